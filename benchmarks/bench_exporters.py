@@ -0,0 +1,82 @@
+"""Benchmark writing and reading back the master list of jobs in every format
+
+Run with: python benchmarks/bench_exporters.py [-rows 100000] [-changes 100]
+
+NOTE: we time the master CSV as well, which is what dashboards had to parse.
+"""
+
+import argparse
+import os
+import tempfile
+from time import perf_counter
+
+from bench_read_master_csv import get_config, write_master_csv
+
+from jobfunnel.backend.exporters.registry import EXPORTER_FROM_FORMAT
+from jobfunnel.backend.jobfunnel import JobFunnel
+from jobfunnel.resources import ExportFormat, JobStatus
+
+
+def measure(func) -> float:
+    """Get the seconds taken by func()"""
+    start = perf_counter()
+    func()
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-rows", type=int, default=100000, help="jobs to export")
+    parser.add_argument(
+        "-changes", type=int, default=100, help="jobs changed before re-writing"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        config = get_config(folder)
+        os.makedirs(config.cache_folder)
+        write_master_csv(config.master_csv_file, args.rows, seed=0)
+        job_funnel = JobFunnel(config)
+        jobs = job_funnel.read_master_csv()
+        job_funnel.write_master_csv(jobs)
+
+        print(f"Exporting {args.rows} jobs, then {args.changes} changed jobs:")
+        print(f"  {'format':<10} {'write':>8} {'re-write':>8} {'read':>8} {'MB':>8}")
+        results = {
+            "CSV": (
+                measure(
+                    lambda: job_funnel._write_master_csv_rows(
+                        (job, None) for job in jobs.values()
+                    )
+                ),
+                None,
+                measure(job_funnel.read_master_csv),
+                config.master_csv_file,
+            )
+        }
+        for export_format in ExportFormat:
+            exporter_cls = EXPORTER_FROM_FORMAT[export_format]
+            file_path = os.path.join(folder, "master" + exporter_cls.file_extension)
+            exporter = exporter_cls(file_path, config.log_file)
+            write_seconds = measure(lambda: exporter.write(jobs))
+            for job in list(jobs.values())[:: args.rows // args.changes]:
+                job.status = JobStatus.APPLIED
+            rewrite_seconds = measure(lambda: exporter.write(jobs))
+            read_seconds = measure(exporter_cls(file_path, config.log_file).read)
+            results[export_format.name] = (
+                write_seconds,
+                rewrite_seconds,
+                read_seconds,
+                file_path,
+            )
+
+        for name, (write, rewrite, read, file_path) in results.items():
+            rewrite_str = f"{rewrite:8.2f}" if rewrite is not None else f"{'-':>8}"
+            print(
+                f"  {name:<10} {write:8.2f} {rewrite_str} {read:8.2f} "
+                f"{os.path.getsize(file_path) / 1024 / 1024:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark JobFilter.filter() one job at a time and as a JobTable
+
+Run with: python benchmarks/bench_filter_jobs.py [-jobs 1000 10000 100000]
+
+NOTE: the block list and duplicates list are JobLists which share a Bloom
+    filter, like JobFunnel's, 1% of the jobs are in each of them.
+"""
+
+import argparse
+from datetime import datetime
+import logging
+import os
+import tempfile
+from time import perf_counter
+from typing import Dict
+
+from jobfunnel.backend import Job, JobStatus
+from jobfunnel.backend.tools.bloom import BloomFilter
+from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.backend.tools.job_list import JobList
+from jobfunnel.resources import MIN_KEY_ID_FILTER_CAPACITY, Locale, Remoteness
+
+
+def get_jobs(n_jobs: int) -> Dict[str, Job]:
+    return {
+        f"key_{i}": Job(
+            title=f"Software Developer {i % 500}",
+            company=f"Company {i % 2000}",
+            location="Waterloo, ON",
+            description=f"Job {i} description",
+            url=f"https://www.example.com/job/{i}",
+            locale=Locale.CANADA_ENGLISH,
+            query="Python",
+            provider="IndeedScraperCANEng",
+            status=JobStatus.NEW if i % 20 else JobStatus.ARCHIVE,
+            key_id=f"key_{i}",
+            post_date=datetime(2020, 1, 1 + i % 28),
+            remoteness=list(Remoteness)[i % len(Remoteness)],
+        )
+        for i in range(n_jobs)
+    }
+
+
+def get_job_filter(folder: str, n_jobs: int, min_job_table_size: int) -> JobFilter:
+    log_file = os.path.join(folder, "log.log")
+    block_list = JobList(
+        os.path.join(folder, "block_list.json"), log_file, logging.WARNING
+    )
+    duplicates_list = JobList(
+        os.path.join(folder, "duplicates_list.json"), log_file, logging.WARNING
+    )
+    if not len(block_list):
+        block_list.update({f"key_{i}": {} for i in range(0, n_jobs, 100)})
+        duplicates_list.update({f"key_{i}": {} for i in range(1, n_jobs, 100)})
+    key_id_filter = BloomFilter.build(
+        list(block_list) + list(duplicates_list),
+        max(2 * (len(block_list) + len(duplicates_list)), MIN_KEY_ID_FILTER_CAPACITY),
+    )
+    block_list.key_id_filter = key_id_filter
+    duplicates_list.key_id_filter = key_id_filter
+    return JobFilter(
+        block_list,
+        duplicates_list,
+        [f"Company {i}" for i in range(0, 2000, 50)],
+        datetime(2020, 1, 8),
+        desired_remoteness=Remoteness.FULLY_REMOTE,
+        min_job_table_size=min_job_table_size,
+        log_level=logging.WARNING,
+        log_file=log_file,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-jobs", type=int, nargs="+", default=[1000, 10000, 100000], help="jobs"
+    )
+    parser.add_argument("-repeats", type=int, default=3, help="best of n runs")
+    args = parser.parse_args()
+
+    print(f"  {'jobs':>7} {'kept':>7} {'per job':>10} {'JobTable':>10}")
+    for n_jobs in args.jobs:
+        jobs_dict = get_jobs(n_jobs)
+        with tempfile.TemporaryDirectory() as folder:
+            seconds = []
+            for min_job_table_size in (n_jobs + 1, 0):
+                job_filter = get_job_filter(folder, n_jobs, min_job_table_size)
+                best = float("inf")
+                for _ in range(args.repeats):
+                    start = perf_counter()
+                    kept = job_filter.filter(jobs_dict)
+                    best = min(best, perf_counter() - start)
+                seconds.append(best)
+            assert list(kept) == list(
+                get_job_filter(folder, n_jobs, n_jobs + 1).filter(jobs_dict)
+            )
+        print(
+            f"  {n_jobs:>7} {len(kept):>7} {seconds[0] * 1e3:7.1f} ms {seconds[1] * 1e3:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
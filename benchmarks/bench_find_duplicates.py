@@ -0,0 +1,114 @@
+"""Benchmark time and peak memory of JobFilter.find_duplicates on large masters
+
+Run with: python benchmarks/bench_find_duplicates.py [-jobs 10000 50000 100000]
+
+NOTE: find_duplicates used to deepcopy() the existing jobs and every incoming
+    job before reading their descriptions, we measure that too for comparison.
+    The duplicate engine's index is warmed up first, as it is on every run
+    after the first one.
+"""
+
+import argparse
+from copy import deepcopy
+from datetime import date
+import os
+import random
+import tempfile
+from time import perf_counter
+import tracemalloc
+
+from jobfunnel.backend import Job
+from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.resources import DuplicateEngine, JobStatus, Locale
+
+VOCABULARY = [f"term{i}" for i in range(20000)]
+
+
+def get_jobs(n_jobs: int, prefix: str, seed: int) -> dict:
+    """Get jobs with random descriptions of 100-300 words each"""
+    rng = random.Random(seed)
+    jobs = {}
+    for i in range(n_jobs):
+        key_id = f"{prefix}{i}"
+        jobs[key_id] = Job(
+            title=f"Title {i}",
+            company=f"Company {i}",
+            location="Waterloo, ON",
+            description=" ".join(rng.choices(VOCABULARY, k=rng.randint(100, 300))),
+            url=f"https://www.example.com/{key_id}",
+            locale=Locale.CANADA_ENGLISH,
+            query="Python",
+            provider="Indeed",
+            status=JobStatus.NEW,
+            key_id=key_id,
+            post_date=date.today(),
+        )
+    return jobs
+
+
+def measure(func) -> tuple:
+    """Get the result, seconds taken and peak MB allocated by func()"""
+    tracemalloc.start()
+    start = perf_counter()
+    result = func()
+    seconds = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-jobs",
+        type=int,
+        nargs="+",
+        default=[10000, 50000, 100000],
+        help="numbers of existing jobs",
+    )
+    parser.add_argument("-incoming", type=int, default=1000, help="incoming jobs")
+    parser.add_argument(
+        "-engine",
+        type=str,
+        choices=[e.name for e in DuplicateEngine],
+        default=DuplicateEngine.TFIDF.name,
+        help="duplicate engine",
+    )
+    args = parser.parse_args()
+
+    log_folder = tempfile.TemporaryDirectory()
+    for n_jobs in args.jobs:
+        # Every 10th incoming job is a re-post of an existing job
+        existing = get_jobs(n_jobs, "existing", seed=0)
+        incoming = get_jobs(args.incoming, "incoming", seed=1)
+        for i, job in enumerate(list(incoming.values())[::10]):
+            job.description = existing[f"existing{i}"].description
+
+        job_filter = JobFilter(
+            log_file=os.path.join(log_folder.name, "log.log"),
+            duplicate_engine=DuplicateEngine[args.engine],
+        )
+        job_filter.find_duplicates(existing, incoming)
+
+        print(f"{args.incoming} incoming jobs vs. {n_jobs} existing jobs:")
+        for name, func in [
+            (
+                "deepcopy jobs",
+                lambda: job_filter.find_duplicates(
+                    deepcopy(existing), {k: deepcopy(v) for k, v in incoming.items()}
+                ),
+            ),
+            (
+                "read jobs in place",
+                lambda: job_filter.find_duplicates(existing, incoming),
+            ),
+        ]:
+            duplicates, seconds, peak_mb = measure(func)
+            print(
+                f"  {name:<20} {seconds:7.2f} s {peak_mb:9.1f} MB peak "
+                f"{len(duplicates):6d} duplicates"
+            )
+
+
+if __name__ == "__main__":
+    main()
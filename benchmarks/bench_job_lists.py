@@ -0,0 +1,120 @@
+"""Benchmark opening the block list, adding a few jobs to it and checking it
+
+Run with: python benchmarks/bench_job_lists.py [-entries 100000] [-changes 100]
+
+NOTE: JobFunnel used to json.load the whole block list when it started, and
+    json.dump the whole list again whenever it added jobs, and checked key_ids
+    against the loaded dict, we time that too.
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+from time import perf_counter
+import tracemalloc
+
+from jobfunnel.backend.tools.bloom import BloomFilter
+from jobfunnel.backend.tools.job_list import JobList
+from jobfunnel.resources import MIN_KEY_ID_FILTER_CAPACITY
+
+
+def get_entry(i: int) -> dict:
+    """Get a block list entry like Job.as_json_entry"""
+    return {
+        "title": f"Software Developer {i % 500}",
+        "company": f"Company {i % 2000}",
+        "post_date": "2020-01-01",
+        "description": f"Job {i} description " * 10 + "..",
+        "status": "DELETE",
+    }
+
+
+def legacy_add_jobs(file_path: str, entries: dict) -> None:
+    """How JobFunnel used to load the block list and write its additions"""
+    with open(file_path, "r") as infile:
+        jobs_dict = json.load(infile)
+    jobs_dict.update(entries)
+    with open(file_path, "w", encoding="utf8") as outfile:
+        outfile.write(
+            json.dumps(
+                jobs_dict,
+                indent=4,
+                sort_keys=True,
+                separators=(",", ": "),
+                ensure_ascii=False,
+            )
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-entries", type=int, default=100000, help="jobs in the block list"
+    )
+    parser.add_argument("-changes", type=int, default=100, help="jobs added per run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        json_file = os.path.join(folder, "block_list.json")
+        log_file = os.path.join(folder, "log.log")
+        with open(json_file, "w", encoding="utf8") as outfile:
+            json.dump({f"key_{i}": get_entry(i) for i in range(args.entries)}, outfile)
+        JobList(json_file, log_file, logging.WARNING)  # i.e. import it once
+        entries = {f"new_{i}": get_entry(i) for i in range(args.changes)}
+
+        print(f"Opening a block list of {args.entries} jobs, adding {args.changes}:")
+        start = perf_counter()
+        legacy_add_jobs(json_file, entries)
+        print(f"  {'legacy JSON':<12} {perf_counter() - start:7.3f} s")
+
+        # NOTE: the legacy write changed the JSON, so we export it first
+        JobList(json_file, log_file, logging.WARNING).export_json()
+        start = perf_counter()
+        job_list = JobList(json_file, log_file, logging.WARNING)
+        job_list.update({f"{k}_2": v for k, v in entries.items()})
+        assert "new_0_2" in job_list
+        print(f"  {'JobList':<12} {perf_counter() - start:7.3f} s")
+
+        # Scraped key_ids, of which 1% are in the block list
+        key_ids = [f"key_{i * 100}" for i in range(args.entries // 10000)] + [
+            f"scraped_{i}" for i in range(args.entries // 100)
+        ]
+        print(f"Checking {len(key_ids)} scraped key_ids against the block list:")
+        print(f"  {'':<12} {'load':>7}   {'check':>7}   {'MB':>7}")
+        start = perf_counter()
+        with open(json_file, "r") as infile:
+            jobs_dict = json.load(infile)
+        load_seconds = perf_counter() - start
+        del jobs_dict
+        tracemalloc.start()  # NOTE: this slows loading, so we load it again
+        with open(json_file, "r") as infile:
+            jobs_dict = json.load(infile)
+        megabytes = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+        start = perf_counter()
+        n_legacy = sum(key_id in jobs_dict for key_id in key_ids)
+        print(
+            f"  {'legacy dict':<12} {load_seconds:7.3f} s {perf_counter() - start:7.3f}"
+            f" s {megabytes:7.1f}"
+        )
+        del jobs_dict
+
+        start = perf_counter()
+        job_list = JobList(json_file, log_file, logging.WARNING)
+        job_list.key_id_filter = BloomFilter.build(
+            job_list, max(2 * len(job_list), MIN_KEY_ID_FILTER_CAPACITY)
+        )
+        load_seconds = perf_counter() - start
+        start = perf_counter()
+        n_listed = sum(key_id in job_list for key_id in key_ids)
+        print(
+            f"  {'Bloom filter':<12} {load_seconds:7.3f} s {perf_counter() - start:7.3f}"
+            f" s {job_list.key_id_filter.n_bits / 8e6:7.1f}"
+        )
+        assert n_listed == n_legacy
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark memory used per Job, i.e. for the jobs of a master CSV
+
+Run with: python benchmarks/bench_job_memory.py [-jobs 50000]
+
+NOTE: Job used to store its attribs in a __dict__ per job and didn't intern
+    any strings, we measure that too for comparison. Every field is a new str
+    per job, as it is when we read the master CSV.
+"""
+
+import argparse
+import csv
+from datetime import date, datetime
+import gc
+import io
+import random
+import tracemalloc
+
+from jobfunnel.backend import Job
+from jobfunnel.resources import JobStatus, Locale, Remoteness
+
+VOCABULARY = [f"term{i}" for i in range(20000)]
+LOCATIONS = ["Waterloo, ON", "Toronto, ON", "Remote", "Kitchener, ON"]
+QUERIES = ["Python", "Python Developer", "Data Scientist"]
+PROVIDERS = ["IndeedScraperCANEng", "MonsterScraperCANEng"]
+TAGS = ["Full-time", "Permanent", "Contract", "Part-time"]
+
+
+class LegacyJob:
+    """How Job used to store its attribs"""
+
+    def __init__(self, **kwargs) -> None:
+        for attr, value in kwargs.items():
+            setattr(self, attr, value)
+        self._raw_scrape_data = None
+
+
+def get_csv_rows(n_jobs: int, description_words: int, seed: int) -> list:
+    """Get CSV rows of jobs, parsed from text so every field is a new str"""
+    rng = random.Random(seed)
+    text = io.StringIO()
+    writer = csv.writer(text)
+    for i in range(n_jobs):
+        writer.writerow(
+            [
+                f"Title {i}",
+                f"Company {rng.randint(0, n_jobs // 10)}",
+                rng.choice(LOCATIONS),
+                " ".join(rng.choices(VOCABULARY, k=description_words)),
+                f"https://www.example.com/{i}",
+                rng.choice(QUERIES),
+                rng.choice(PROVIDERS),
+                ",".join(rng.sample(TAGS, 2)),
+                str(i),
+            ]
+        )
+    text.seek(0)
+    return list(csv.reader(text))
+
+
+def build_jobs(job_cls, rows: list) -> list:
+    """Build a job from every CSV row"""
+    return [
+        job_cls(
+            title=title,
+            company=company,
+            location=location,
+            description=description,
+            url=url,
+            locale=Locale.CANADA_ENGLISH,
+            query=query,
+            provider=provider,
+            status=JobStatus.NEW,
+            key_id=key_id,
+            scrape_date=datetime.today(),
+            short_description="",
+            post_date=date.today(),
+            wage=None,
+            tags=tags.split(","),
+            remoteness=Remoteness.UNKNOWN,
+        )
+        for title, company, location, description, url, query, provider, tags, key_id in rows  # noqa: E501
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-jobs", type=int, default=50000, help="number of jobs")
+    parser.add_argument(
+        "-description-words", type=int, default=0, help="words per description"
+    )
+    args = parser.parse_args()
+
+    print(f"{args.jobs} jobs, {args.description_words} words per description:")
+    for name, job_cls in [("__dict__", LegacyJob), ("__slots__ + intern", Job)]:
+        gc.collect()
+        tracemalloc.start()
+        rows = get_csv_rows(args.jobs, args.description_words, seed=0)
+        jobs = build_jobs(job_cls, rows)
+        del rows
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {name:<20} {size / len(jobs):8.0f} bytes per job")
+        del jobs
+
+
+if __name__ == "__main__":
+    main()
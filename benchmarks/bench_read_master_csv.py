@@ -0,0 +1,144 @@
+"""Benchmark how many rows per second we read from the master CSV
+
+Run with: python benchmarks/bench_read_master_csv.py [-rows 100000]
+
+NOTE: JobFunnel.read_master_csv used to use a csv.DictReader, loop over every
+    JobStatus and Locale to decode them and strptime every date, we time that
+    too for comparison.
+"""
+
+import argparse
+import csv
+from datetime import date, datetime, timedelta
+import logging
+import os
+import random
+import tempfile
+from time import perf_counter
+
+from jobfunnel.backend import Job
+from jobfunnel.backend.jobfunnel import JobFunnel
+from jobfunnel.config import JobFunnelConfigManager, SearchConfig
+from jobfunnel.resources import CSV_HEADER, JobStatus, Locale, Provider, Remoteness
+
+VOCABULARY = [f"term{i}" for i in range(20000)]
+
+
+def get_config(folder: str) -> JobFunnelConfigManager:
+    """Build a minimal config which writes everything into folder"""
+    return JobFunnelConfigManager(
+        master_csv_file=os.path.join(folder, "master.csv"),
+        user_block_list_file=os.path.join(folder, "block_list.json"),
+        duplicates_list_file=os.path.join(folder, "duplicates_list.json"),
+        cache_folder=os.path.join(folder, "cache"),
+        log_file=os.path.join(folder, "log.log"),
+        log_level=logging.WARNING,
+        search_config=SearchConfig(
+            keywords=["Python"],
+            province_or_state="ON",
+            locale=Locale.CANADA_ENGLISH,
+            providers=[Provider.INDEED],
+            city="Waterloo",
+        ),
+    )
+
+
+def write_master_csv(file_path: str, n_rows: int, seed: int) -> None:
+    """Write a master CSV of random jobs posted within the last 60 days"""
+    rng = random.Random(seed)
+    with open(file_path, "w", encoding="utf8") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_HEADER)
+        for i in range(n_rows):
+            post_date = date.today() - timedelta(days=rng.randint(0, 60))
+            writer.writerow(
+                [
+                    rng.choice([JobStatus.NEW.name, JobStatus.APPLIED.name]),
+                    f"Title {i}",
+                    f"Company {rng.randint(0, n_rows // 10)}",
+                    "Waterloo, ON",
+                    post_date.strftime("%Y-%m-%d"),
+                    " ".join(rng.choices(VOCABULARY, k=rng.randint(100, 300))),
+                    "Full-time,Permanent",
+                    f"https://www.example.com/{i}",
+                    f"IndeedScraperCANEng_{i}",
+                    "IndeedScraperCANEng",
+                    "Python",
+                    Locale.CANADA_ENGLISH.name,
+                    "",
+                    Remoteness.UNKNOWN.name,
+                ]
+            )
+
+
+def legacy_read_master_csv(file_path: str) -> dict:
+    """How read_master_csv used to read the master CSV"""
+    jobs_dict = {}
+    with open(file_path, "r", encoding="utf8", errors="ignore") as csvfile:
+        for row in csv.DictReader(csvfile):
+            post_date = datetime.strptime(row["date"], "%Y-%m-%d")
+            status = None
+            for p_status in JobStatus:
+                if row["status"].strip().lower() == p_status.name.lower():
+                    status = p_status
+                    break
+            locale = None
+            for p_locale in Locale:
+                if row["locale"].strip().lower() == p_locale.name.lower():
+                    locale = p_locale
+                    break
+            job = Job(
+                title=row["title"],
+                company=row["company"],
+                location=row["location"],
+                description=row["blurb"],
+                key_id=row["id"],
+                url=row["link"],
+                locale=locale,
+                query=row["query"],
+                status=status,
+                provider=row["provider"],
+                short_description="",
+                post_date=post_date,
+                scrape_date=post_date,
+                wage=row["wage"].strip(),
+                raw=None,
+                tags=row["tags"].split(","),
+                remoteness=Remoteness[row["remoteness"].strip()],
+            )
+            job.validate()
+            jobs_dict[job.key_id] = job
+    return jobs_dict
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-rows", type=int, default=100000, help="rows in the CSV")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        config = get_config(folder)
+        os.makedirs(config.cache_folder)
+        write_master_csv(config.master_csv_file, args.rows, seed=0)
+        job_funnel = JobFunnel(config)
+
+        print(f"Reading a master CSV of {args.rows} rows:")
+        for name, func in [
+            (
+                "legacy DictReader",
+                lambda: legacy_read_master_csv(config.master_csv_file),
+            ),
+            ("read_master_csv()", job_funnel.read_master_csv),
+            (
+                "iter_master_csv()",
+                lambda: sum(1 for _ in job_funnel.iter_master_csv(validate=False)),
+            ),
+        ]:
+            start = perf_counter()
+            func()
+            seconds = perf_counter() - start
+            print(f"  {name:<20} {seconds:7.2f} s {args.rows / seconds:10.0f} rows / s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark how long it takes to construct our scrapers
+
+Run with: python benchmarks/bench_scraper_startup.py [-n 20]
+
+NOTE: BaseScraper used to start a multiprocessing.Manager() server process
+    per-instance to get a lock, we time that too for comparison.
+"""
+
+import argparse
+import logging
+from multiprocessing import Manager
+import os
+import tempfile
+from time import perf_counter
+
+from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.backend.tools.session import SessionPool
+from jobfunnel.config import JobFunnelConfigManager, SearchConfig
+from jobfunnel.resources import Locale, Provider
+
+
+def get_config(folder: str) -> JobFunnelConfigManager:
+    """Build a minimal config which writes everything into folder"""
+    return JobFunnelConfigManager(
+        master_csv_file=os.path.join(folder, "master.csv"),
+        user_block_list_file=os.path.join(folder, "block_list.json"),
+        duplicates_list_file=os.path.join(folder, "duplicates_list.json"),
+        cache_folder=os.path.join(folder, "cache"),
+        log_file=os.path.join(folder, "log.log"),
+        log_level=logging.WARNING,
+        search_config=SearchConfig(
+            keywords=["Python"],
+            province_or_state="ON",
+            locale=Locale.CANADA_ENGLISH,
+            providers=[p for p in Provider],
+            city="Waterloo",
+        ),
+    )
+
+
+def time_it(func, n_repeats: int) -> float:
+    """Get the mean number of seconds it takes to call func()"""
+    start = perf_counter()
+    for _ in range(n_repeats):
+        func()
+    return (perf_counter() - start) / n_repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", type=int, default=20, help="number of repeats")
+    n_repeats = parser.parse_args().n
+
+    with tempfile.TemporaryDirectory() as folder:
+        config = get_config(folder)
+        job_filter = JobFilter(log_file=config.log_file)
+        session_pool = SessionPool(config.session_config)
+
+        print(f"Mean of {n_repeats} repeats:")
+        for scraper_cls in config.scrapers:
+            seconds = time_it(
+                lambda: scraper_cls(
+                    session_pool.get(scraper_cls.__name__), config, job_filter
+                ),
+                n_repeats,
+            )
+            print(f"  {scraper_cls.__name__:<30} {seconds * 1000:8.2f} ms")
+
+        def start_manager() -> None:
+            with Manager() as manager:
+                manager.Lock()
+
+        seconds = time_it(start_manager, n_repeats)
+        print(f"  {'multiprocessing.Manager()':<30} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
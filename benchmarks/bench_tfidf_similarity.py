@@ -0,0 +1,104 @@
+"""Benchmark peak memory of finding duplicate jobs by TFIDF similarity
+
+Run with: python benchmarks/bench_tfidf_similarity.py [-existing 50000] [-incoming 1000]
+
+NOTE: JobFilter.tfidf_filter used to build the dense incoming x existing
+    cosine_similarity matrix, we measure that too for comparison.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+from time import perf_counter
+import tracemalloc
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.backend.tools.tfidf import iter_most_similar
+from jobfunnel.resources import DEFAULT_MAX_TFIDF_SIMILARITY
+
+VOCABULARY = [f"term{i}" for i in range(20000)]
+
+
+def get_descriptions(n_jobs: int, seed: int) -> list:
+    """Get random job descriptions of 100-300 words each"""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choices(VOCABULARY, k=rng.randint(100, 300)))
+        for _ in range(n_jobs)
+    ]
+
+
+def dense_most_similar(query_vectors, reference_vectors, min_similarity):
+    """How tfidf_filter used to find the most similar existing job"""
+    matches = []
+    similarities_per_query = cosine_similarity(query_vectors, reference_vectors)
+    for query_index, similarities in enumerate(similarities_per_query):
+        similar_indices = np.where(similarities >= min_similarity)[0]
+        if similar_indices.size > 0:
+            matches.append(query_index)
+    return matches
+
+
+def measure(func) -> tuple:
+    """Get the result, seconds taken and peak MB allocated by func()"""
+    tracemalloc.start()
+    start = perf_counter()
+    result = func()
+    seconds = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-existing", type=int, default=50000, help="existing jobs")
+    parser.add_argument("-incoming", type=int, default=1000, help="incoming jobs")
+    args = parser.parse_args()
+
+    # Every 10th incoming job is a re-post of an existing job
+    existing = get_descriptions(args.existing, seed=0)
+    incoming = get_descriptions(args.incoming, seed=1)
+    incoming[::10] = existing[: len(incoming[::10])]
+
+    log_folder = tempfile.TemporaryDirectory()
+    job_filter = JobFilter(log_file=os.path.join(log_folder.name, "log.log"))
+    existing_ids = [f"existing{i}" for i in range(len(existing))]
+    incoming_ids = [f"incoming{i}" for i in range(len(incoming))]
+    job_filter.tfidf_index.update(
+        dict(zip(existing_ids + incoming_ids, existing + incoming))
+    )
+    query_vectors = job_filter.tfidf_index.transform(incoming_ids)
+    reference_vectors = job_filter.tfidf_index.transform(existing_ids)
+
+    print(f"{args.incoming} incoming jobs vs. {args.existing} existing jobs:")
+    for name, func in [
+        (
+            "dense cosine_similarity",
+            lambda: dense_most_similar(
+                query_vectors, reference_vectors, DEFAULT_MAX_TFIDF_SIMILARITY
+            ),
+        ),
+        (
+            "blocked sparse top-1",
+            lambda: [
+                match[0]
+                for match in iter_most_similar(
+                    query_vectors, reference_vectors, DEFAULT_MAX_TFIDF_SIMILARITY
+                )
+            ],
+        ),
+    ]:
+        matches, seconds, peak_mb = measure(func)
+        print(
+            f"  {name:<25} {seconds:7.2f} s {peak_mb:9.1f} MB peak "
+            f"{len(matches):6d} duplicates"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark writing the master CSV back out after a run changed a few jobs
+
+Run with: python benchmarks/bench_write_master_csv.py [-rows 100000] [-changes 100]
+
+NOTE: JobFunnel.write_master_csv used to validate and serialize every job and
+    rewrite the whole CSV in place, we time that too for comparison.
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import tempfile
+from time import perf_counter
+
+from bench_read_master_csv import get_config, write_master_csv
+
+from jobfunnel.backend.jobfunnel import JobFunnel
+from jobfunnel.resources import CSV_HEADER, JobStatus
+
+SCENARIOS = ["unchanged", "new jobs", "changed statuses"]
+
+
+def legacy_write_master_csv(file_path: str, jobs: dict) -> None:
+    """How write_master_csv used to write the master CSV"""
+    with open(file_path, "w", encoding="utf8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_HEADER)
+        writer.writeheader()
+        for job in jobs.values():
+            job.validate()
+            writer.writerow(job.as_row)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-rows", type=int, default=100000, help="rows in the CSV")
+    parser.add_argument(
+        "-changes", type=int, default=100, help="jobs added / changed per run"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        config = get_config(folder)
+        os.makedirs(config.cache_folder)
+        write_master_csv(config.master_csv_file, args.rows, seed=0)
+
+        # Write the CSV once so that it is formatted as write_master_csv does
+        job_funnel = JobFunnel(config)
+        job_funnel.write_master_csv(job_funnel.read_master_csv())
+        original_file = os.path.join(folder, "original.csv")
+        shutil.copyfile(config.master_csv_file, original_file)
+
+        print(f"Writing a master CSV of {args.rows} rows:")
+        for scenario in SCENARIOS:
+            for name in ["legacy full rewrite", "write_master_csv()"]:
+                shutil.copyfile(original_file, config.master_csv_file)
+                job_funnel = JobFunnel(config)
+                jobs = job_funnel.read_master_csv()
+                if scenario == "new jobs":
+                    new_jobs = JobFunnel(config).read_master_csv()
+                    for key_id in list(new_jobs)[: args.changes]:
+                        job = new_jobs[key_id]
+                        job.key_id = f"{key_id}_new"
+                        jobs[job.key_id] = job
+                elif scenario == "changed statuses":
+                    for job in list(jobs.values())[:: args.rows // args.changes]:
+                        job.status = JobStatus.APPLIED
+
+                start = perf_counter()
+                if name == "write_master_csv()":
+                    job_funnel.write_master_csv(jobs)
+                else:
+                    legacy_write_master_csv(config.master_csv_file, jobs)
+                seconds = perf_counter() - start
+                print(f"  {scenario:<18} {name:<22} {seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
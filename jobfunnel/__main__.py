@@ -21,11 +21,16 @@ def main():
     # Init
     job_funnel = JobFunnel(funnel_cfg)
 
+    # Export the block / duplicates lists, and exit
+    if args["do_export_lists"]:
+        job_funnel.export_lists()
+        return 0
+
     # Run or recover
     if args["do_recovery_mode"]:
         job_funnel.recover()
     else:
-        job_funnel.run()
+        job_funnel.run(from_export=args["do_from_export"])
 
     # Return value for Travis CI
     if len(job_funnel.master_jobs_dict.keys()) > 1 and os.path.exists(
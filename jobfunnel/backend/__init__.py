@@ -1,3 +1,4 @@
 from jobfunnel.backend.job import Job, JobStatus
+from jobfunnel.backend.job_table import JobTable
 
-__all__ = ["Job", "JobStatus"]
+__all__ = ["Job", "JobStatus", "JobTable"]
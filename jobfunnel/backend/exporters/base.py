@@ -0,0 +1,117 @@
+"""The base Exporter, which writes the master list of jobs to a file alongside
+the master CSV (i.e. for dashboards), and reads the jobs back from it.
+"""
+
+from abc import ABC, abstractmethod
+import logging
+from typing import Any, Dict, Sequence
+
+from jobfunnel.backend import Job
+from jobfunnel.backend.tools import Logger
+
+# The attribs of every job we export, in order. NOTE: we export Enums by name.
+EXPORT_COLUMNS = [
+    "key_id",
+    "status",
+    "title",
+    "company",
+    "location",
+    "post_date",
+    "scrape_date",
+    "description",
+    "short_description",
+    "tags",
+    "url",
+    "provider",
+    "query",
+    "locale",
+    "wage",
+    "remoteness",
+]
+
+
+class BaseExporter(ABC, Logger):
+    """Base exporter, which keeps a copy of the master list of jobs in a file
+    of its format, keyed by key_id.
+
+    NOTE: the master CSV is still the file the user edits, we write every
+        export from the master jobs dict after we write the CSV.
+    """
+
+    # Extension of the export file, we put it next to the master CSV
+    file_extension = ""  # type: str
+
+    def __init__(
+        self,
+        file_path: str,
+        log_file: str,
+        log_level: int = logging.INFO,
+    ) -> None:
+        """Init the exporter of a file
+
+        Args:
+            file_path (str): path to the export file, it need not exist yet.
+            log_file (str): file to log to.
+            log_level (int, optional): level to log at. Defaults to INFO.
+        """
+        super().__init__(level=log_level, file_path=log_file)
+        self.file_path = file_path
+
+    @abstractmethod
+    def write(self, jobs: Dict[str, Job]) -> None:
+        """Update the export so that it holds exactly jobs
+
+        Args:
+            jobs (Dict[str, Job]): the master jobs dict.
+        """
+
+    @abstractmethod
+    def read(self) -> Dict[str, Job]:
+        """Read every job in the export
+
+        Returns:
+            Dict[str, Job]: the jobs keyed by key_id, empty if there is no
+                export yet.
+        """
+
+    @staticmethod
+    def get_job(values: Sequence[Any]) -> Job:
+        """Build a Job from its values in EXPORT_COLUMNS order, with dates as
+        datetimes, tags as a list and Enums decoded from their names.
+        """
+        (
+            key_id,
+            status,
+            title,
+            company,
+            location,
+            post_date,
+            scrape_date,
+            description,
+            short_description,
+            tags,
+            url,
+            provider,
+            query,
+            locale,
+            wage,
+            remoteness,
+        ) = values
+        return Job(
+            title=title,
+            company=company,
+            location=location,
+            description=description,
+            url=url,
+            locale=locale,
+            query=query,
+            provider=provider,
+            status=status,
+            key_id=key_id,
+            scrape_date=scrape_date,
+            short_description=short_description,
+            post_date=post_date,
+            wage=wage,
+            tags=tags,
+            remoteness=remoteness,
+        )
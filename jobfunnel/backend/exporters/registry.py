@@ -0,0 +1,13 @@
+"""Lookup table where we can map export formats to exporters
+
+NOTE: if you implement an exporter you must add it here
+"""
+
+from jobfunnel.backend.exporters.parquet import ParquetExporter
+from jobfunnel.backend.exporters.sqlite import SQLiteExporter
+from jobfunnel.resources import ExportFormat
+
+EXPORTER_FROM_FORMAT = {
+    ExportFormat.SQLITE: SQLiteExporter,
+    ExportFormat.PARQUET: ParquetExporter,
+}
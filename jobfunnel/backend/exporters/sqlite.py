@@ -0,0 +1,138 @@
+"""Export the master list of jobs into a SQLite table keyed by key_id
+"""
+
+from datetime import date, datetime
+from hashlib import blake2b
+import logging
+import sqlite3
+from typing import Any, Dict, List, Optional, Tuple
+
+from jobfunnel.backend import Job
+from jobfunnel.backend.exporters.base import EXPORT_COLUMNS, BaseExporter
+from jobfunnel.resources import JobStatus, Locale, Remoteness
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+class SQLiteExporter(BaseExporter):
+    """Exports jobs into the jobs table of a SQLite database, with key_id as
+    its primary key, so replacing a job and looking one up are both indexed.
+
+    Every row also has a fingerprint of its values, so writing the jobs of a
+    run only replaces the rows of the jobs that changed and deletes the rows
+    of the jobs that are gone, instead of re-writing the whole table.
+
+    NOTE: we store Enums by name, dates as %Y-%m-%d like the master CSV and
+        tags separated by newlines.
+    """
+
+    file_extension = ".sqlite"
+
+    def __init__(
+        self,
+        file_path: str,
+        log_file: str,
+        log_level: int = logging.INFO,
+    ) -> None:
+        """Open (or create) the SQLite database of the export"""
+        super().__init__(file_path, log_file, log_level=log_level)
+        self._date_strings = {}  # type: Dict[date, str]
+        self._db = sqlite3.connect(file_path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs (key_id TEXT PRIMARY KEY, "
+            + "".join(f"{column} TEXT, " for column in EXPORT_COLUMNS[1:])
+            + "fingerprint BLOB NOT NULL)"
+        )
+        self._db.commit()
+        self._insert = (
+            f"INSERT OR REPLACE INTO jobs ({', '.join(EXPORT_COLUMNS)}, fingerprint) "
+            f"VALUES ({', '.join('?' * (len(EXPORT_COLUMNS) + 1))})"
+        )
+
+    def write(self, jobs: Dict[str, Job]) -> None:
+        """Replace the rows of the jobs which changed and delete the rows of
+        the jobs which are not in jobs anymore, in one transaction.
+        """
+        fingerprints = dict(
+            self._db.execute("SELECT key_id, fingerprint FROM jobs")
+        )  # type: Dict[str, bytes]
+        rows: List[Tuple[Any, ...]] = []
+        for job in jobs.values():
+            row = self._get_row(job)
+            if fingerprints.pop(job.key_id, None) != row[-1]:
+                rows.append(row)
+
+        # NOTE: any fingerprints left are of jobs which are gone
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM jobs WHERE key_id = ?",
+                [(key_id,) for key_id in fingerprints],
+            )
+            self._db.executemany(self._insert, rows)
+        self.logger.debug(
+            "Exported %d new or changed jobs and deleted %d jobs in %s",
+            len(rows),
+            len(fingerprints),
+            self.file_path,
+        )
+
+    def read(self) -> Dict[str, Job]:
+        datetimes = {}  # type: Dict[str, datetime]
+
+        def __to_datetime(date_str: Optional[str]) -> Optional[datetime]:
+            if date_str is None:
+                return None
+            value = datetimes.get(date_str)
+            if value is None:
+                value = datetimes[date_str] = datetime.strptime(date_str, DATE_FORMAT)
+            return value
+
+        jobs = {}  # type: Dict[str, Job]
+        for row in self._db.execute(f"SELECT {', '.join(EXPORT_COLUMNS)} FROM jobs"):
+            values = list(row)
+            values[1] = JobStatus[values[1]]
+            values[5] = __to_datetime(values[5])  # post_date
+            values[6] = __to_datetime(values[6])  # scrape_date
+            values[9] = values[9].split("\n") if values[9] else []  # tags
+            values[13] = Locale[values[13]]
+            values[15] = Remoteness[values[15]]
+            job = self.get_job(values)
+            jobs[job.key_id] = job
+        return jobs
+
+    def _get_row(self, job: Job) -> Tuple[Any, ...]:
+        """Get the values of job in EXPORT_COLUMNS order and their fingerprint"""
+        values = (
+            job.key_id,
+            job.status.name,
+            job.title,
+            job.company,
+            job.location,
+            self._get_date_string(job.post_date),
+            self._get_date_string(job.scrape_date),
+            job.description,
+            job.short_description,
+            "\n".join(job.tags),
+            job.url,
+            job.provider,
+            job.query,
+            job.locale.name,
+            job.wage,
+            job.remoteness.name,
+        )
+        fingerprint = blake2b(
+            "\x1f".join(map(str, values)).encode("utf8", errors="replace"),
+            digest_size=16,
+        ).digest()
+        return values + (fingerprint,)
+
+    def _get_date_string(self, value: Optional[date]) -> Optional[str]:
+        """Format a date as DATE_FORMAT, formatting every distinct date once"""
+        if value is None:
+            return None
+        date_str = self._date_strings.get(value)
+        if date_str is None:
+            date_str = self._date_strings[value] = value.strftime(DATE_FORMAT)
+        return date_str
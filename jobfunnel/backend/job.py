@@ -4,7 +4,8 @@ to csv / etc by Exporter
 
 from copy import deepcopy
 from datetime import date, datetime
-from typing import Dict, List, Optional
+from sys import intern
+from typing import Any, Dict, List, Optional
 
 from bs4 import BeautifulSoup
 
@@ -27,8 +28,38 @@ JOB_REMOVE_STATUSES = [
 ]
 
 
+def _intern(value: Any) -> Any:
+    """Intern value if it is a str, so that equal strings share one object"""
+    return intern(value) if isinstance(value, str) else value
+
+
 class Job:
-    """The base Job object which contains job information as attribs"""
+    """The base Job object which contains job information as attribs
+
+    NOTE: we keep tens of thousands of these in memory at once, so Job has
+        __slots__ instead of a __dict__ per job, and the strings which repeat
+        across many jobs (location, query, provider and tags) are interned.
+    """
+
+    __slots__ = (
+        "title",
+        "company",
+        "location",
+        "description",
+        "key_id",
+        "url",
+        "locale",
+        "query",
+        "provider",
+        "status",
+        "wage",
+        "remoteness",
+        "post_date",
+        "scrape_date",
+        "tags",
+        "short_description",
+        "_raw_scrape_data",
+    )
 
     def __init__(
         self,
@@ -90,13 +121,13 @@ class Job:
         # These must be populated by a Scraper
         self.title = title
         self.company = company
-        self.location = location
+        self.location = _intern(location)
         self.description = description
         self.key_id = key_id
         self.url = url
         self.locale = locale
-        self.query = query
-        self.provider = provider
+        self.query = _intern(query)
+        self.provider = _intern(provider)
         self.status = status
         self.wage = wage
         self.remoteness = remoteness
@@ -104,7 +135,7 @@ class Job:
         # These may not always be populated in our job source
         self.post_date = post_date
         self.scrape_date = scrape_date if scrape_date else datetime.today()
-        self.tags = tags if tags else []
+        self.tags = [_intern(tag) for tag in tags] if tags else []
         if short_description:
             self.short_description = short_description
         else:
@@ -113,6 +144,21 @@ class Job:
         # Semi-private attrib for debugging
         self._raw_scrape_data = raw
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the attribs of the job as a dict"""
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Unpickle the attribs of the job, interning its repeated strings
+        NOTE: this also loads jobs pickled before Job had __slots__.
+        """
+        for attr, value in state.items():
+            setattr(self, attr, value)
+        self.location = _intern(self.location)
+        self.query = _intern(self.query)
+        self.provider = _intern(self.provider)
+        self.tags = [_intern(tag) for tag in self.tags]
+
     @property
     def is_remove_status(self) -> bool:
         """Return True if the job's status is one of our removal statuses."""
@@ -202,6 +248,32 @@ class Job:
             ]
         )
 
+    @property
+    def row_hash(self) -> int:
+        """Hash of the attribs that we write into the CSV row of this job, so
+        we can tell if the row changed without building it.
+
+        NOTE: a str caches its hash, so this is cheap to re-compute.
+        """
+        return hash(
+            (
+                self.status,
+                self.title,
+                self.company,
+                self.location,
+                self.post_date,
+                self.description,
+                tuple(self.tags),
+                self.url,
+                self.key_id,
+                self.provider,
+                self.query,
+                self.locale,
+                self.wage,
+                self.remoteness,
+            )
+        )
+
     @property
     def as_json_entry(self) -> Dict[str, str]:
         """This formats a job for the purpose of saving it to a block JSON
@@ -211,7 +283,9 @@ class Job:
         return {
             "title": self.title,
             "company": self.company,
-            "post_date": self.post_date.strftime("%Y-%m-%d"),
+            "post_date": (
+                self.post_date.strftime("%Y-%m-%d") if self.post_date else ""
+            ),
             "description": (
                 (self.description[:MAX_BLOCK_LIST_DESC_CHARS] + "..")
                 if len(self.description) > MAX_BLOCK_LIST_DESC_CHARS
@@ -0,0 +1,178 @@
+"""Columnar view of a collection of Jobs, so that filters can be applied to all
+of them at once as NumPy masks instead of one Job at a time.
+"""
+
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from jobfunnel.backend.job import Job
+from jobfunnel.backend.tools.bloom import BloomFilter
+from jobfunnel.backend.tools.job_list import JobList
+
+# Code of an unset Enum attrib, Enum values in jobfunnel.resources start at 1
+UNSET_CODE = 0
+
+
+class JobTable:
+    """The jobs of a jobs dict, with the columns we filter on as arrays.
+
+    Company and provider are categorical, i.e. an integer code per job for
+    one of their distinct values, status and remoteness are Enum values and
+    post dates are datetime64, so a filter over the whole table is a few
+    vectorized comparisons.
+
+    NOTE: we only convert the distinct statuses, remotenesses and post dates
+        of the jobs, since there are few of them compared to the jobs.
+
+    NOTE: the table keeps references to the jobs, it does not copy them, and
+        it does not see changes made to the jobs after it was built.
+    """
+
+    def __init__(self, jobs: List[Job], keys: Optional[List[str]] = None) -> None:
+        """Build the columns of jobs
+
+        Args:
+            jobs (List[Job]): the jobs, row i of every column is jobs[i].
+            keys (Optional[List[str]], optional): key of every job in to_dict().
+                Defaults to the key_id of every job.
+        """
+        self.jobs = jobs
+        self.key_ids = [job.key_id for job in jobs]
+        self.keys = keys if keys is not None else self.key_ids
+        self.company_codes, self.companies = _get_categories(
+            [job.company for job in jobs]
+        )
+        self.provider_codes, self.providers = _get_categories(
+            [job.provider for job in jobs]
+        )
+        self.status_codes = _get_enum_codes([job.status for job in jobs])
+        self.remoteness_codes = _get_enum_codes([job.remoteness for job in jobs])
+        date_codes, dates = _get_categories([job.post_date for job in jobs])
+        self.post_dates = np.array(
+            [_to_datetime64(post_date) for post_date in dates],
+            dtype="datetime64[us]",
+        )[date_codes]
+
+        # The rows with a key_id, and the Bloom filter hashes of their key_ids
+        # NOTE: we only hash the key_ids of the rows we check, see has_key_id()
+        self._has_key_id = np.fromiter(
+            (bool(key_id) and isinstance(key_id, str) for key_id in self.key_ids),
+            dtype=bool,
+            count=len(jobs),
+        )
+        self._key_id_hashes = np.zeros((len(jobs), 2), dtype=np.uint64)
+        self._is_hashed = np.zeros(len(jobs), dtype=bool)
+
+    @classmethod
+    def from_dict(cls, jobs_dict: Dict[str, Job]) -> "JobTable":
+        """Build the table of a jobs dict keyed by key_id"""
+        return cls(list(jobs_dict.values()), list(jobs_dict))
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def to_dict(self, mask: Optional[np.ndarray] = None) -> Dict[str, Job]:
+        """Get the jobs dict of the rows where mask is True (or of every row)"""
+        rows = np.flatnonzero(mask) if mask is not None else range(len(self))
+        return {self.keys[row]: self.jobs[row] for row in rows}
+
+    def has_key_id(
+        self, key_ids: Collection[str], where: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Mask of the rows with one of key_ids, rows without one never match
+
+        NOTE: if key_ids is a JobList we check the rows against its Bloom
+            filter all at once, and then look up the rows that are probably
+            in it with a query per MAX_SQL_VARIABLES of them.
+
+        Args:
+            key_ids (Collection[str]): i.e. a JobList, dict or set of key_ids.
+            where (Optional[np.ndarray], optional): only check the rows where
+                this mask is True, i.e. those no other filter removed yet.
+                Defaults to None (every row).
+        """
+        mask = np.zeros(len(self), dtype=bool)
+        if not key_ids:
+            return mask
+        rows = np.flatnonzero(
+            self._has_key_id if where is None else where & self._has_key_id
+        )
+        if not isinstance(key_ids, JobList):
+            mask[rows] = [self.key_ids[row] in key_ids for row in rows]
+            return mask
+        if key_ids.key_id_filter is not None:
+            rows = rows[key_ids.key_id_filter.contains_hashes(self._get_hashes(rows))]
+        found = key_ids.get_key_ids_in([self.key_ids[row] for row in rows])
+        mask[rows] = [self.key_ids[row] in found for row in rows]
+        return mask
+
+    def _get_hashes(self, rows: np.ndarray) -> np.ndarray:
+        """Get the Bloom filter hashes of the key_ids of rows, hashing each
+        key_id at most once, since we check it against more than one list.
+        """
+        new_rows = rows[~self._is_hashed[rows]]
+        if len(new_rows):
+            self._key_id_hashes[new_rows] = BloomFilter.get_hashes(
+                [self.key_ids[row] for row in new_rows]
+            )
+            self._is_hashed[new_rows] = True
+        return self._key_id_hashes[rows]
+
+    def has_company(self, companies: Iterable[str]) -> np.ndarray:
+        """Mask of the rows with one of companies"""
+        return _isin_categories(self.company_codes, self.companies, companies)
+
+    def has_provider(self, providers: Iterable[str]) -> np.ndarray:
+        """Mask of the rows with one of providers"""
+        return _isin_categories(self.provider_codes, self.providers, providers)
+
+    def has_status(self, statuses: Iterable[Enum]) -> np.ndarray:
+        """Mask of the rows with one of statuses"""
+        return np.isin(self.status_codes, [status.value for status in statuses])
+
+    def is_older_than(self, max_age: datetime) -> np.ndarray:
+        """Mask of the rows posted before max_age, like Job.is_old()
+        NOTE: rows without a post date are never old.
+        """
+        return self.post_dates < _to_datetime64(max_age)
+
+
+def _get_categories(values: List[Any]) -> Tuple[np.ndarray, Dict[Any, int]]:
+    """Get a code per value and the code of every distinct value"""
+    categories = {value: code for code, value in enumerate(dict.fromkeys(values))}
+    codes = np.fromiter(
+        map(categories.__getitem__, values), dtype=np.int64, count=len(values)
+    )
+    return codes, categories
+
+
+def _isin_categories(
+    codes: np.ndarray, categories: Dict[Any, int], values: Iterable[Any]
+) -> np.ndarray:
+    """Mask of the codes of any of values"""
+    value_codes = [categories[value] for value in values if value in categories]
+    return np.isin(codes, value_codes)
+
+
+def _get_enum_codes(values: List[Optional[Enum]]) -> np.ndarray:
+    """Get the value of every Enum as an array, UNSET_CODE if it is None
+    NOTE: we look the Enums up by id, since hashing an Enum runs Python code.
+    """
+    enums = dict(zip(map(id, values), values))
+    codes = {
+        enum_id: UNSET_CODE if value is None else value.value
+        for enum_id, value in enums.items()
+    }
+    return np.fromiter(
+        map(codes.__getitem__, map(id, values)), dtype=np.int64, count=len(values)
+    )
+
+
+def _to_datetime64(value: Optional[date]) -> np.datetime64:
+    """Get a date or datetime as a datetime64, NaT if it is None"""
+    if value is None:
+        return np.datetime64("NaT", "us")
+    return np.datetime64(value, "us")
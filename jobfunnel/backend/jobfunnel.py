@@ -1,31 +1,63 @@
-"""Scrapes jobs, applies search filters and writes pickles to master list
+"""Scrapes jobs, applies search filters, stores jobs and writes the master list
 Paul McInnis 2020
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import csv
 from datetime import date, datetime, timedelta
-import json
+import io
+from itertools import chain
 import os
 import pickle
+from queue import Queue
+import shutil
+from threading import Event
 from time import time
-from typing import Dict
-
-from requests import Session
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from jobfunnel import __version__
 from jobfunnel.backend import Job
+from jobfunnel.backend.exporters.base import BaseExporter
+from jobfunnel.backend.exporters.registry import EXPORTER_FROM_FORMAT
 from jobfunnel.backend.tools import Logger
+from jobfunnel.backend.tools.bloom import BloomFilter
+from jobfunnel.backend.tools.delay import RateLimiter
 from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.backend.tools.http_cache import HTTPCache
+from jobfunnel.backend.tools.job_list import JobList
+from jobfunnel.backend.tools.job_store import JobStore
+from jobfunnel.backend.tools.session import SessionPool
 from jobfunnel.config import JobFunnelConfigManager
 from jobfunnel.resources import (
     CSV_HEADER,
+    MIN_KEY_ID_FILTER_CAPACITY,
     T_NOW,
     DuplicateType,
     JobStatus,
     Locale,
+    Provider,
     Remoteness,
 )
 
+# pylint: disable=using-constant-test,unused-import
+if False:  # or typing.TYPE_CHECKING  if python3.5.3+
+    from jobfunnel.backend.scrapers.base import BaseScraper
+# pylint: enable=using-constant-test,unused-import
+
+# For decoding the (case-insensitive) Enum names in the master CSV
+STATUS_BY_NAME = {status.name.lower(): status for status in JobStatus}
+LOCALE_BY_NAME = {locale.name.lower(): locale for locale in Locale}
+
 
 class JobFunnel(Logger):
     """Class that initializes a Scraper and scrapes a website to get jobs"""
@@ -42,24 +74,69 @@ class JobFunnel(Logger):
         self.__date_string = date.today().strftime("%Y-%m-%d")
         self.master_jobs_dict = {}  # type: Dict[str, Job]
 
-        # Open a session with/out a proxy configured
-        self.session = Session()
-        if self.config.proxy_config:
-            self.session.proxies = {
-                self.config.proxy_config.protocol: self.config.proxy_config.url
-            }
-
-        # Read the user's block list
-        user_block_jobs_dict = {}  # type: Dict[str, str]
-        if os.path.isfile(self.config.user_block_list_file):
-            user_block_jobs_dict = json.load(
-                open(self.config.user_block_list_file, "r")
+        # The (start, end, Job.row_hash) of every row of the master CSV by
+        # key_id, and the (size, mtime, header end) of the CSV we read / wrote
+        self._master_csv_rows = {}  # type: Dict[str, Tuple[int, int, int]]
+        self._master_csv_state = None  # type: Optional[Tuple[int, int, int]]
+
+        # Cache of HTTP responses, so re-running a search re-downloads less
+        self.http_cache: Optional[HTTPCache] = None
+        if self.config.http_cache_config.enabled:
+            self.http_cache = HTTPCache(
+                os.path.join(self.config.cache_folder, "http_cache.sqlite"),
+                self.config.http_cache_config,
+            )
+
+        # Exports of the master list next to the master CSV, i.e. for dashboards
+        self.exporters: List[BaseExporter] = []
+        for export_format in self.config.export_formats:
+            exporter_cls = EXPORTER_FROM_FORMAT[export_format]
+            self.exporters.append(
+                exporter_cls(
+                    os.path.splitext(self.config.master_csv_file)[0]
+                    + exporter_cls.file_extension,
+                    self.config.log_file,
+                    log_level=self.config.log_level,
+                )
             )
 
-        # Read the user's duplicate jobs list (from TFIDF)
-        duplicate_jobs_dict = {}  # type: Dict[str, str]
-        if os.path.isfile(self.config.duplicates_list_file):
-            duplicate_jobs_dict = json.load(open(self.config.duplicates_list_file, "r"))
+        # Every job we scrape, so we can re-load a search or recover the CSV
+        self.job_store = JobStore(os.path.join(self.config.cache_folder, "jobs.sqlite"))
+
+        # Keep-alive sessions for every provider we scrape, for the whole run
+        self.session_pool = SessionPool(
+            self.config.session_config, self.config.proxy_config, self.http_cache
+        )
+
+        # One rate limiter for all scrapers, so each host is delayed only once
+        self.rate_limiter = RateLimiter(self.config.delay_config)
+
+        # The user's block list and the duplicate jobs list (from TFIDF)
+        # NOTE: these are stored next to their JSON files, see export_lists()
+        user_block_jobs_dict = JobList(
+            self.config.user_block_list_file,
+            self.config.log_file,
+            self.config.log_level,
+        )
+        duplicate_jobs_dict = JobList(
+            self.config.duplicates_list_file,
+            self.config.log_file,
+            self.config.log_level,
+        )
+
+        # Build a Bloom filter of the key_ids of both lists once per run, so
+        # that checking a key_id which is in neither list skips their lookups.
+        # NOTE: it is memory-mapped, so other processes can BloomFilter.open()
+        key_id_filter = BloomFilter.build(
+            chain(user_block_jobs_dict, duplicate_jobs_dict),
+            max(
+                2 * (len(user_block_jobs_dict) + len(duplicate_jobs_dict)),
+                MIN_KEY_ID_FILTER_CAPACITY,
+            ),
+            file_path=os.path.join(self.config.cache_folder, "key_ids.bloom"),
+        )
+        user_block_jobs_dict.key_id_filter = key_id_filter
+        duplicate_jobs_dict.key_id_filter = key_id_filter
 
         # Initialize our job filter
         self.job_filter = JobFilter(
@@ -68,25 +145,32 @@ class JobFunnel(Logger):
             self.config.search_config.blocked_company_names,
             T_NOW - timedelta(days=self.config.search_config.max_listing_days),
             desired_remoteness=self.config.search_config.remoteness,
+            tfidf_index_file=os.path.join(self.config.cache_folder, "tfidf_index.npz"),
+            duplicate_engine=self.config.duplicate_engine,
+            minhash_index_file=(
+                os.path.splitext(self.config.duplicates_list_file)[0] + "_minhash.npz"
+            ),
             log_level=self.config.log_level,
             log_file=self.config.log_file,
         )
 
     @property
-    def daily_cache_file(self) -> str:
-        """The name for for pickle file containing the scraped data ran today'
-        TODO: instead of using a 'daily' cache file, we should be tying this
-        into the search that was made to prevent cross-caching results.
-        """
-        return os.path.join(
-            self.config.cache_folder,
-            f"jobs_{self.__date_string}.pkl",
-        )
+    def search_key(self) -> str:
+        """Identifies the search we are running in the job store"""
+        return self.config.search_config.fingerprint
 
-    def run(self) -> None:
-        """Scrape, update lists and save to CSV."""
-        # Read the master CSV file
-        if os.path.isfile(self.config.master_csv_file):
+    def run(self, from_export: bool = False) -> None:
+        """Scrape, update lists and save to CSV.
+
+        Args:
+            from_export (bool, optional): read the master list of jobs from our
+                export instead of the master CSV, i.e. if the CSV was deleted.
+                Defaults to False.
+        """
+        # Read the master CSV file, or our export of it if the user asked to
+        if from_export:
+            self.master_jobs_dict = self.read_export()
+        elif os.path.isfile(self.config.master_csv_file):
             self.master_jobs_dict = self.read_master_csv()
 
         # Load master csv jobs if they exist and update our block list with
@@ -101,27 +185,35 @@ class JobFunnel(Logger):
             )
 
         # Scrape jobs or load them from a cache if one exists (--no-scrape)
+        # and filter out any jobs we have rejected, archived or block-listed
+        # NOTE: we do not remove duplicates here as these may trigger updates
         scraped_jobs_dict = {}  # type: Dict[str, Job]
         if self.config.no_scrape:
-            # Load cache since --no-scrape is set
+            # Load the newest jobs of this search since --no-scrape is set
             self.logger.info("Skipping scraping, running with --no-scrape.")
-            if os.path.exists(self.daily_cache_file):
-                scraped_jobs_dict = self.load_cache(self.daily_cache_file)
+            scrape_date = self.job_store.get_latest_scrape_date(self.search_key)
+            if scrape_date:
+                if scrape_date != self.__date_string:
+                    self.logger.info(
+                        "Loading jobs of this search scraped on %s.", scrape_date
+                    )
+                scraped_jobs_dict = self.job_filter.filter(
+                    self.load_store(self.search_key, scrape_date),
+                    remove_existing_duplicate_keys=False,
+                )
             else:
                 self.logger.warning(
-                    "No incoming jobs, missing cache: %s", self.daily_cache_file
+                    "No incoming jobs, this search was never scraped: %s",
+                    self.config.search_config.query_string,
                 )
         else:
-            # Scrape new jobs from all our configured providers and cache them
-            scraped_jobs_dict = self.scrape()
+            # Scrape new jobs from all our configured providers, filtering each
+            # one as it comes in, and store each one as soon as we have it
+            for job in self.iter_scraped_jobs():
+                self.job_store.add(job, self.search_key, self.__date_string)
+                if not self.job_filter.filterable(job, check_existing_duplicates=False):
+                    scraped_jobs_dict[job.key_id] = job
 
-        # Filter out any jobs we have rejected, archived or block-listed
-        # NOTE: we do not remove duplicates here as these may trigger updates
-        if scraped_jobs_dict:
-            self.write_cache(scraped_jobs_dict)
-            scraped_jobs_dict = self.job_filter.filter(
-                scraped_jobs_dict, remove_existing_duplicate_keys=False
-            )
         if self.master_jobs_dict:
             self.master_jobs_dict = self.job_filter.filter(
                 self.master_jobs_dict,
@@ -130,27 +222,31 @@ class JobFunnel(Logger):
 
         # Parse duplicate jobs into updates for master jobs dict
         # NOTE: we prevent inter-scrape duplicates by key-id within BaseScraper
-        # FIXME: impl. TFIDF on inter-scrape duplicates
+        # and content-matching also finds duplicates within the scraped jobs,
+        # i.e. the same job posted to more than one provider, as does matching
+        # the listings the scrapers claimed (see JobFilter.claim_listing()).
         duplicate_jobs = []  # type: List[DuplicatedJob]
-        if self.master_jobs_dict and scraped_jobs_dict:
+        if scraped_jobs_dict:
             # Remove jobs with duplicated key_ids from scrape + update master
             duplicate_jobs = self.job_filter.find_duplicates(
                 self.master_jobs_dict,
                 scraped_jobs_dict,
             )
 
-            for match in duplicate_jobs:
+            # NOTE: update_if_newer() also updates the key_id of the original
+            # job, so we get the key_ids of the originals before updating any.
+            original_key_ids = [
+                match.original.key_id if match.original else None
+                for match in duplicate_jobs
+            ]
+            for match, original_key_id in zip(duplicate_jobs, original_key_ids):
                 # Was it a key-id match?
-                if match.type in [DuplicateType.KEY_ID or DuplicateType.EXISTING_TFIDF]:
+                if match.type == DuplicateType.KEY_ID:
                     # NOTE: original and duplicate have same key id for these.
-                    # When it's EXISTING_TFIDF, we can't set match.duplicate
-                    # because it is only partially stored in the block list JSON
-                    if match.original.key_id and (
-                        match.original.key_id != match.duplicate.key_id
-                    ):
+                    if original_key_id and original_key_id != match.duplicate.key_id:
                         raise ValueError(
                             "Found duplicate by key-id, but keys dont match! "
-                            f"{match.original.key_id}, {match.duplicate.key_id}"
+                            f"{original_key_id}, {match.duplicate.key_id}"
                         )
 
                     # Got a key-id match, pop from scrape dict and maybe update
@@ -165,10 +261,35 @@ class JobFunnel(Logger):
                         "updated older" if upd else "did not update",
                     )
 
+                # Was it a content-match we already know about?
+                elif match.type == DuplicateType.EXISTING_TFIDF:
+                    # NOTE: we can't update the original because it is only
+                    # partially stored in the duplicates list JSON
+                    scraped_jobs_dict.pop(match.duplicate.key_id)
+                    self.logger.debug(
+                        "Identified %s as an existing duplicate by description.",
+                        match.duplicate.key_id,
+                    )
+
+                # Was it another provider's copy of a listing we kept?
+                elif match.type == DuplicateType.LISTING:
+                    # NOTE: we don't update the original with the copy, so we
+                    # keep the copy of the same provider whichever is newer.
+                    scraped_jobs_dict.pop(match.duplicate.key_id)
+                    self.logger.debug(
+                        "Identified %s as a duplicate of %s by its listing.",
+                        match.duplicate.key_id,
+                        original_key_id,
+                    )
+
                 # Was it a content-match?
-                elif match.type == DuplicateType.NEW_TFIDF:
+                elif match.type in [DuplicateType.NEW_TFIDF, DuplicateType.NEW_MINHASH]:
                     # Got a content match, pop from scrape dict and maybe update
-                    upd = self.master_jobs_dict[match.original.key_id].update_if_newer(
+                    # NOTE: the original may be another job we just scraped.
+                    original = self.master_jobs_dict.get(original_key_id)
+                    if original is None:
+                        original = scraped_jobs_dict[original_key_id]
+                    upd = original.update_if_newer(
                         scraped_jobs_dict.pop(match.duplicate.key_id)
                     )
                     self.logger.debug(
@@ -176,13 +297,9 @@ class JobFunnel(Logger):
                         "original job %s with its data.",
                         match.duplicate.key_id,
                         "updated older" if upd else "did not update",
-                        match.original.key_id,
+                        original_key_id,
                     )
 
-        # Update duplicates file (if any updates are incoming)
-        if duplicate_jobs:
-            self.update_duplicates_file()
-
         # Update master jobs dict with the incoming jobs that passed filters
         if scraped_jobs_dict:
             self.master_jobs_dict.update(scraped_jobs_dict)
@@ -191,6 +308,8 @@ class JobFunnel(Logger):
         if self.master_jobs_dict:
             # Write our updated jobs out (if none, dont make the file at all)
             self.write_master_csv(self.master_jobs_dict)
+            for exporter in self.exporters:
+                exporter.write(self.master_jobs_dict)
             self.logger.info(
                 "Done. View your current jobs in %s", self.config.master_csv_file
             )
@@ -205,78 +324,230 @@ class JobFunnel(Logger):
                 self.logger.warning("No new jobs were added to CSV.")
 
     def _check_for_inter_scraper_validity(
-        self,
-        existing_jobs: Dict[str, Job],
-        incoming_jobs: Dict[str, Job],
-    ) -> None:
-        """Verify that we aren't overwriting jobs by key-id between scrapers
-        NOTE: this is a slow check, would be cool to improve the O(n) on this
+        self, job_providers: Dict[str, str], job: Job
+    ) -> bool:
+        """Verify that we aren't overwriting jobs by key-id between scrapers,
+        and record the provider of job if we aren't.
+
+        NOTE: this is a single dict lookup, so merging all the scraper outputs
+            is linear in the number of jobs scraped.
+        NOTE: a collision is logged with both providers and the later job is
+            dropped, it does not stop the other jobs from being scraped.
+
+        Args:
+            job_providers (Dict[str, str]): provider of every key_id so far.
+            job (Job): incoming job.
+
+        Returns:
+            bool: True if job.key_id is new, False if we already had it.
         """
-        existing_job_keys = existing_jobs.keys()
-        for inc_key_id in incoming_jobs.keys():
-            for exist_key_id in existing_job_keys:
-                if inc_key_id == exist_key_id:
-                    raise ValueError(f"Inter-scraper key-id duplicate! {exist_key_id}")
+        provider = job_providers.get(job.key_id)
+        if provider is None:
+            job_providers[job.key_id] = job.provider
+            return True
+        if provider == job.provider:
+            self.logger.warning(
+                "Dropping job %s from %s, it was scraped twice.",
+                job.key_id,
+                provider,
+            )
+        else:
+            self.logger.warning(
+                "Inter-scraper key-id duplicate! Dropping job %s from %s, it "
+                "has the same key-id as a job from %s.",
+                job.key_id,
+                job.provider,
+                provider,
+            )
+        return False
 
     def scrape(self) -> Dict[str, Job]:
-        """Run each of the desired Scraper.scrape() with threading and delaying"""
+        """Run each of the desired Scraper.scrape() with threading and delaying
+
+        NOTE: use iter_scraped_jobs() to process jobs as they are scraped.
+
+        Returns:
+            Dict[str, Job]: scraped jobs from all providers keyed by key_id
+        """
+        return {job.key_id: job for job in self.iter_scraped_jobs()}
+
+    def iter_scraped_jobs(self) -> Iterator[Job]:
+        """Run each of the desired Scraper.iter_jobs(), yielding jobs from all
+        of them as they are scraped.
+
+        NOTE: the scrapers run concurrently (up to max_concurrent_scrapers at
+            once) since they hit different hosts and each one delays itself,
+            so this takes roughly as long as the slowest provider.
+
+        Yields:
+            Job: scraped job, with a key_id that is unique among all providers
+        """
         self.logger.info("Scraping local providers with: %s", self.config.scraper_names)
 
-        # Iterate thru scrapers and run their scrape.
-        jobs = {}  # type: Dict[str, Job]
-        for scraper_cls in self.config.scrapers:
-            incoming_jobs_dict = {}
-            start = time()
-            scraper = scraper_cls(self.session, self.config, self.job_filter)
-            try:
-                incoming_jobs_dict = scraper.scrape()
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to scrape jobs for {scraper_cls.__name__}: {e}"
+        # Run the scrapers and merge their results in as each job comes in.
+        job_providers = {}  # type: Dict[str, str]
+        n_collisions = 0
+        jobs_queue = Queue()  # type: Queue
+        stop_scraping = Event()
+        threads = ThreadPoolExecutor(max_workers=self.config.max_concurrent_scrapers)
+        try:
+            for provider, scraper_cls in zip(
+                self.config.search_config.providers, self.config.scrapers
+            ):
+                threads.submit(
+                    self._scrape_provider,
+                    provider,
+                    scraper_cls,
+                    jobs_queue,
+                    stop_scraping,
                 )
-
-            # Ensure we have no duplicates between our scrapers by key-id
-            # (since we are updating the jobs dict with results)
-            self._check_for_inter_scraper_validity(
-                jobs,
-                incoming_jobs_dict,
+            n_scraping = len(self.config.scrapers)
+            while n_scraping:
+                job = jobs_queue.get()
+                if job is None:
+                    # A scraper has finished
+                    n_scraping -= 1
+                    continue
+
+                # Ensure we have no duplicates between our scrapers by key-id
+                # (since we are updating the jobs dict with results)
+                if not self._check_for_inter_scraper_validity(job_providers, job):
+                    n_collisions += 1
+                    continue
+                yield job
+        finally:
+            # Stop any scrapers that are still running if we stop early
+            stop_scraping.set()
+            threads.shutdown()
+            self.session_pool.close()
+
+        self.logger.info(
+            "Completed all scraping, found %d new jobs.", len(job_providers)
+        )
+        if n_collisions:
+            self.logger.warning(
+                "Dropped %d jobs with key-ids that were already scraped.",
+                n_collisions,
             )
 
-            jobs.update(incoming_jobs_dict)
-            end = time()
-            self.logger.debug(
-                "Scraped %d jobs from %s, took %.3fs",
-                len(jobs.items()),
-                scraper_cls.__name__,
-                (end - start),
-            )
+    def _scrape_provider(
+        self,
+        provider: Provider,
+        scraper_cls: Type["BaseScraper"],
+        jobs_queue: Queue,
+        stop_scraping: Event,
+    ) -> None:
+        """Run a single Scraper.iter_jobs(), this is safe to call from a thread.
 
-        self.logger.info("Completed all scraping, found %d new jobs.", len(jobs))
-        return jobs
+        NOTE: every provider gets its own Session since it sets its own headers
+        NOTE: we always put None into jobs_queue once we are done, even if the
+            scrape failed.
+
+        Args:
+            provider (Provider): the provider which scraper_cls scrapes.
+            scraper_cls (Type[BaseScraper]): the scraper class to run.
+            jobs_queue (Queue): queue to put each scraped Job into.
+            stop_scraping (Event): set this to stop scraping early.
+        """
+        n_jobs = 0
+        start = time()
+        try:
+            scraper = scraper_cls(
+                self.session_pool.get(scraper_cls.__name__, provider),
+                self.config,
+                self.job_filter,
+                self.rate_limiter,
+            )
+            for job in scraper.iter_jobs():
+                if stop_scraping.is_set():
+                    break
+                jobs_queue.put(job)
+                n_jobs += 1
+        except Exception as e:
+            self.logger.error(f"Failed to scrape jobs for {scraper_cls.__name__}: {e}")
+        finally:
+            jobs_queue.put(None)
+        end = time()
+        self.logger.debug(
+            "Scraped %d jobs from %s, took %.3fs",
+            n_jobs,
+            scraper_cls.__name__,
+            (end - start),
+        )
 
     def recover(self) -> None:
-        """Build a new master CSV from all the available pickles in our cache"""
+        """Build a new master CSV from all the jobs in our job store, and any
+        pickles in our cache from before we had a job store.
+
+        NOTE: we stream the jobs from the job store into the CSV, so we only
+            keep the key_ids (and CSV rows) of the recovered jobs in memory.
+        """
         self.logger.info("Recovering jobs from all cache files in cache folder")
-        if os.path.exists(self.config.user_block_list_file):
+        if self.job_filter.user_block_jobs_dict:
             self.logger.warning(
                 "Running recovery mode, but with existing block-list, delete "
-                "%s if you want to start fresh from the cached data and not "
-                "filter any jobs away.",
+                "%s and %s if you want to start fresh from the cached data and "
+                "not filter any jobs away.",
                 self.config.user_block_list_file,
+                self.job_filter.user_block_jobs_dict.db_file,
             )
-        all_jobs_dict = {}  # type: Dict[str, Job]
-        for file in os.listdir(self.config.cache_folder):
-            if ".pkl" in file:
-                all_jobs_dict.update(
-                    self.load_cache(os.path.join(self.config.cache_folder, file))
+        recovered_key_ids: Set[str] = set()
+
+        def __iter_recovered_jobs() -> Iterator[Job]:
+            # The newest record of a job in the store is the newest version
+            for job in self.job_store.iter_jobs():
+                recovered_key_ids.add(job.key_id)
+                if not self.job_filter.filterable(job):
+                    yield job
+
+            # Pickles are older than the job store, newest first
+            for file in sorted(os.listdir(self.config.cache_folder), reverse=True):
+                if ".pkl" in file:
+                    jobs_dict = self.load_cache(
+                        os.path.join(self.config.cache_folder, file)
+                    )
+                    for key_id, job in self.job_filter.filter(jobs_dict).items():
+                        if key_id not in recovered_key_ids:
+                            recovered_key_ids.add(key_id)
+                            yield job
+
+        self._write_master_csv_rows((job, None) for job in __iter_recovered_jobs())
+
+    def load_store(
+        self, search: Optional[str] = None, scrape_date: Optional[str] = None
+    ) -> Dict[str, Job]:
+        """Load the jobs of a search and / or scrape date from our job store
+
+        Args:
+            search (Optional[str]): search key to load the jobs of, i.e.
+                self.search_key. Defaults to None (all searches).
+            scrape_date (Optional[str]): scrape date to load the jobs of as
+                %Y-%m-%d. Defaults to None (all dates).
+
+        Returns:
+            Dict[str, Job]: newest version of every job, keyed by key_id.
+        """
+        for version in self.job_store.get_versions(search, scrape_date):
+            if version != __version__:
+                # NOTE: this may be an error in the future
+                self.logger.warning(
+                    "Loaded jobs have version mismatch! "
+                    "job store version: %s, current version: %s",
+                    version,
+                    __version__,
                 )
-        self.write_master_csv(self.job_filter.filter(all_jobs_dict))
+        jobs_dict = {
+            job.key_id: job for job in self.job_store.iter_jobs(search, scrape_date)
+        }
+        self.logger.info(
+            "Read %d jobs from previously-scraped jobs store: %s.",
+            len(jobs_dict),
+            self.job_store.db_file,
+        )
+        return jobs_dict
 
     def load_cache(self, cache_file: str) -> Dict[str, Job]:
-        """Load today's scrape data from pickle via date string
-
-        TODO: search the cache for pickles that match search config.
-        (we may need a registry for the pickles and seach terms used)
+        """Load scrape data from a pickle written before we had a job store
 
         Args:
             cache_file (str): path to cache pickle file containing jobs dict
@@ -315,69 +586,143 @@ class JobFunnel(Logger):
             )
             return jobs_dict
 
-    def write_cache(self, jobs_dict: Dict[str, Job], cache_file: str = None) -> None:
-        """Dump a jobs_dict into a pickle
+    def read_export(self) -> Dict[str, Job]:
+        """Read the jobs of the master list from the first of our exports that
+        has any, i.e. if the master CSV was deleted (--from-export).
 
-        TODO: write search_config into the cache file and jobfunnel version
-        TODO: some way to cache Job.RAW without hitting recursion limit
+        NOTE: this is much faster than reading the master CSV, since we don't
+            parse any text, but it only has the jobs of our last run, not any
+            changes the user made to the CSV since.
 
-        Args:
-            jobs_dict (Dict[str, Job]): jobs dict to dump into cache.
-            cache_file (str, optional): file path to write to. Defaults to None.
+        Returns:
+            Dict[str, Job]: unique Job objects in the export, keyed by key_id
         """
-        cache_file = cache_file if cache_file else self.daily_cache_file
-        for job in jobs_dict.values():
-            job._raw_scrape_data = None  # pylint: disable=protected-access
-        pickle.dump(
-            {
-                "version": __version__,
-                "jobs_dict": jobs_dict,
-            },
-            open(cache_file, "wb"),
+        for exporter in self.exporters:
+            jobs_dict = exporter.read()
+            if jobs_dict:
+                self.logger.info(
+                    "Read %d jobs from export: %s", len(jobs_dict), exporter.file_path
+                )
+                return jobs_dict
+        self.logger.warning(
+            "No jobs in any export of the master list, export formats: %s",
+            [export_format.name for export_format in self.config.export_formats],
         )
-        self.logger.debug("Dumped %d jobs to %s", len(jobs_dict.keys()), cache_file)
+        return {}
 
     def read_master_csv(self) -> Dict[str, Job]:
         """Read in the master-list CSV to a dict of unique Jobs
 
+        NOTE: we also keep where every row is in the CSV and the row hash of
+            its Job, so that write_master_csv() can skip the unchanged rows.
+
         TODO: make blurb --> description and add short_description
 
         Returns:
             Dict[str, Job]: unique Job objects in the CSV
         """
+        # NOTE: if the CSV changes while we read it, we will not reuse its rows
+        file_stat = os.stat(self.config.master_csv_file)
         jobs_dict = {}  # type: Dict[str, Job]
-        with open(
-            self.config.master_csv_file, "r", encoding="utf8", errors="ignore"
-        ) as csvfile:
-            for row in csv.DictReader(csvfile):
+        self._master_csv_rows = {}
+        self._master_csv_state = None
+        for job, start, end, is_as_written in self._iter_master_csv_rows():
+            if self._master_csv_state is None:
+                self._master_csv_state = (
+                    file_stat.st_size,
+                    file_stat.st_mtime_ns,
+                    start,
+                )
+            jobs_dict[job.key_id] = job
+            if is_as_written:
+                self._master_csv_rows[job.key_id] = (start, end, job.row_hash)
+            else:
+                self._master_csv_rows.pop(job.key_id, None)
+
+        self.logger.debug(
+            "Read %d jobs from master-CSV: %s",
+            len(jobs_dict.keys()),
+            self.config.master_csv_file,
+        )
+        return jobs_dict
+
+    def iter_master_csv(self, validate: bool = True) -> Iterator[Job]:
+        """Yield the Jobs of the master-list CSV as we read its rows
+
+        Args:
+            validate (bool, optional): validate every Job. Defaults to True.
+
+        Yields:
+            Job: Job of each row in the CSV
+        """
+        for job, _, _, _ in self._iter_master_csv_rows(validate):
+            yield job
+
+    def _iter_master_csv_rows(
+        self, validate: bool = True
+    ) -> Iterator[Tuple[Job, int, int, bool]]:
+        """Yield the Job of every row of the master-list CSV, the byte offsets
+        of the start and end of the row, and whether writing the Job gives the
+        exact same row.
+
+        NOTE: statuses, locales and remotenesses are decoded with a dict lookup
+            and we parse every distinct date only once, since they repeat a lot.
+        """
+        dates = {}  # type: Dict[str, Tuple[datetime, bool]]
+        position, line = 0, ""
+
+        def __parse_date(date_str: str) -> Tuple[datetime, bool]:
+            # Get the date and whether it is formatted the way we write it
+            parsed = dates.get(date_str)
+            if parsed is None:
+                value = datetime.strptime(date_str, "%Y-%m-%d")
+                parsed = (value, value.strftime("%Y-%m-%d") == date_str)
+                dates[date_str] = parsed
+            return parsed
+
+        def __iter_lines(csvfile: BinaryIO) -> Iterator[str]:
+            # NOTE: csv.reader reads one line at a time, so once it gives us a
+            # row, position is the offset of the end of that row.
+            nonlocal position, line
+            for line_bytes in csvfile:
+                position += len(line_bytes)
+                line = line_bytes.decode("utf8", errors="ignore")
+                yield line
+
+        with open(self.config.master_csv_file, "rb") as csvfile:
+            reader = csv.reader(__iter_lines(csvfile))
+            header = next(reader, [])
+            has_header = header == CSV_HEADER
+            columns = {name: index for index, name in enumerate(header)}
+
+            def __get(row: List[str], name: str, default: str = None) -> str:
+                index = columns.get(name)
+                return row[index] if index is not None else default
+
+            start = position
+            for row in reader:
+                end = position
+                if not row:
+                    # Skip blank lines, like csv.DictReader
+                    start = end
+                    continue
+
                 # NOTE: we are doing legacy support here with 'blurb' etc.
                 # In the future we should have an actual short description
-                if "short_description" in row:
-                    short_description = row["short_description"]
-                else:
-                    short_description = ""
-                post_date = datetime.strptime(row["date"], "%Y-%m-%d")
-
-                if "scrape_date" in row:
-                    scrape_date = datetime.strptime(row["scrape_date"], "%Y-%m-%d")
+                short_description = __get(row, "short_description", "")
+                post_date, is_date_as_written = __parse_date(__get(row, "date"))
+                scrape_date_str = __get(row, "scrape_date")
+                if scrape_date_str:
+                    scrape_date = __parse_date(scrape_date_str)[0]
                 else:
                     scrape_date = post_date
 
-                if "raw" in row:
-                    # NOTE: we should never see this because raw cant be in CSV
-                    raw = row["raw"]
-                else:
-                    raw = None
+                # NOTE: we should never see this because raw cant be in CSV
+                raw = __get(row, "raw")
 
-                # FIXME: this is the wrong way to compare row val to Enum.name!
                 # We need to convert from user statuses
-                status = None
-                if "status" in row:
-                    status_str = row["status"].strip()
-                    for p_status in JobStatus:
-                        if status_str.lower() == p_status.name.lower():
-                            status = p_status
-                            break
+                status_str = __get(row, "status", "").strip()
+                status = STATUS_BY_NAME.get(status_str.lower())
                 if not status:
                     self.logger.warning(
                         "Unknown status %s, setting to UNKNOWN", status_str
@@ -385,80 +730,216 @@ class JobFunnel(Logger):
                     status = JobStatus.UNKNOWN
 
                 # NOTE: this is for legacy support:
-                locale = None
-                if "locale" in row:
-                    locale_str = row["locale"].strip()
-                    for p_locale in Locale:
-                        if locale_str.lower() == p_locale.name.lower():
-                            locale = p_locale
-                            break
+                locale_str = __get(row, "locale", "").strip()
+                locale = LOCALE_BY_NAME.get(locale_str.lower())
                 if not locale:
+                    locale = self.config.search_config.locale
                     self.logger.warning(
-                        "Unknown locale %s, setting to UNKNOWN", locale_str
+                        "Unknown locale %s, setting to %s", locale_str, locale.name
                     )
-                    locale = locale.UNKNOWN
 
                 # Check for remoteness (handle if not present for legacy)
                 remoteness = Remoteness.UNKNOWN
-                if "remoteness" in row:
-                    remote_str = row["remoteness"].strip()
-                    remoteness = Remoteness[remote_str]
-                if not locale:
-                    self.logger.warning(
-                        "Unknown locale %s, setting to UNKNOWN", locale_str
-                    )
-                    locale = locale.UNKNOWN
+                remote_str = __get(row, "remoteness")
+                if remote_str is not None:
+                    remoteness = Remoteness[remote_str.strip()]
 
                 # Check for wage (handle if not present for legacy
-                wage = ""
-                if "wage" in row:
-                    wage = row["wage"].strip()
+                wage = __get(row, "wage", "").strip()
 
+                tags_str = __get(row, "tags")
                 job = Job(
-                    title=row["title"],
-                    company=row["company"],
-                    location=row["location"],
-                    description=row["blurb"],
-                    key_id=row["id"],
-                    url=row["link"],
+                    title=__get(row, "title"),
+                    company=__get(row, "company"),
+                    location=__get(row, "location"),
+                    description=__get(row, "blurb"),
+                    key_id=__get(row, "id"),
+                    url=__get(row, "link"),
                     locale=locale,
-                    query=row["query"],
+                    query=__get(row, "query"),
                     status=status,
-                    provider=row["provider"],
+                    provider=__get(row, "provider"),
                     short_description=short_description,
                     post_date=post_date,
                     scrape_date=scrape_date,
                     wage=wage,
                     raw=raw,
-                    tags=row["tags"].split(","),
+                    tags=tags_str.split(","),
                     remoteness=remoteness,
                 )
-                job.validate()
-                jobs_dict[job.key_id] = job
-
-        self.logger.debug(
-            "Read %d jobs from master-CSV: %s",
-            len(jobs_dict.keys()),
-            self.config.master_csv_file,
-        )
-        return jobs_dict
+                if validate:
+                    job.validate()
+
+                # NOTE: the user may edit the CSV, i.e. type a status in lower
+                # case or save it with \n line endings (csv writes \r\n), and we
+                # write tags separated by newlines, not commas.
+                is_as_written = (
+                    has_header
+                    and line.endswith("\r\n")
+                    and is_date_as_written
+                    and __get(row, "status") == status.name
+                    and __get(row, "locale") == locale.name
+                    and __get(row, "remoteness") == remoteness.name
+                    and __get(row, "wage") == wage
+                    and "," not in tags_str
+                )
+                yield job, start, end, is_as_written
+                start = end
 
     def write_master_csv(self, jobs: Dict[str, Job]) -> None:
         """Write out our dict of unique Jobs to a CSV
 
+        NOTE: we only validate and serialize the Jobs that are new or changed
+            since we read the CSV, the rows of the others are copied as they
+            are. If the CSV is still exactly the rows we read, in the order of
+            jobs, we append the remaining jobs to it, otherwise we write a new
+            CSV and rename it over the old one.
+
         Args:
             jobs (Dict[str, Job]): Dict of unique Jobs, keyd by unique id's
         """
-        with open(self.config.master_csv_file, "w", encoding="utf8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=CSV_HEADER)
-            writer.writeheader()
-            for job in jobs.values():
+        if not self._is_master_csv_as_read():
+            # We didn't read the CSV or it was edited since, so write every job
+            self._write_master_csv_rows((job, None) for job in jobs.values())
+            return
+
+        rows = []  # type: List[Tuple[Job, Optional[Tuple[int, int, int]]]]
+        for job in jobs.values():
+            row = self._master_csv_rows.get(job.key_id)
+            rows.append((job, row if row and row[2] == job.row_hash else None))
+
+        # Find the unchanged rows that are still in the order we read them
+        size, _, position = self._master_csv_state
+        n_unchanged = 0
+        for _, row in rows:
+            if not row or row[0] != position:
+                break
+            position = row[1]
+            n_unchanged += 1
+
+        if position == size and not any(row for _, row in rows[n_unchanged:]):
+            self._write_master_csv_rows(rows[n_unchanged:], append=True)
+        else:
+            self._write_master_csv_rows(rows)
+
+    def _is_master_csv_as_read(self) -> bool:
+        """Check that the master CSV is the one we last read or wrote"""
+        if not self._master_csv_state:
+            return False
+        try:
+            file_stat = os.stat(self.config.master_csv_file)
+        except FileNotFoundError:
+            return False
+        return (file_stat.st_size, file_stat.st_mtime_ns) == (
+            self._master_csv_state[:2]
+        )
+
+    def _write_master_csv_rows(
+        self,
+        rows: Iterable[Tuple[Job, Optional[Tuple[int, int, int]]]],
+        append: bool = False,
+    ) -> None:
+        """Write out the rows of unique Jobs to the CSV, as we iterate over them
+
+        Every row is a Job and the (start, end, row hash) of its row in the CSV
+        if it is unchanged, or None if we need to validate and serialize it.
+
+        NOTE: unless we append, we write into a temporary file and rename it
+            over the CSV once it is complete, so we never leave a partial CSV.
+
+        Args:
+            rows (Iterable[Tuple[Job, Optional[Tuple[int, int, int]]]]): rows
+                in the order we write them.
+            append (bool, optional): append the rows to the CSV, which must
+                not be unchanged rows. Defaults to False.
+        """
+        file_path = self.config.master_csv_file
+        temp_file_path = None if append else f"{file_path}.{os.getpid()}.tmp"
+        master_csv_rows = self._master_csv_rows if append else {}
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=CSV_HEADER)
+        n_jobs, n_copied = 0, 0
+
+        def __get_bytes(job: Optional[Job]) -> bytes:
+            # Get the CSV row of job, or the CSV header if job is None
+            buffer.seek(0)
+            buffer.truncate()
+            if job is None:
+                writer.writeheader()
+            else:
                 job.validate()
                 writer.writerow(job.as_row)
+            return buffer.getvalue().encode("utf8")
+
+        def __copy(start: int, end: int) -> None:
+            # Copy the bytes from start to end of the old CSV, 1MB at a time
+            if start == end:
+                return
+            infile.seek(start)
+            while start < end:
+                chunk = infile.read(min(end - start, 1 << 20))
+                if not chunk:
+                    raise ValueError(f"{file_path} is shorter than when we read it")
+                outfile.write(chunk)
+                start += len(chunk)
+
+        infile = None  # type: Optional[BinaryIO]
+        if not append and os.path.isfile(file_path):
+            infile = open(file_path, "rb")
+        try:
+            with open(file_path if append else temp_file_path, "ab") as outfile:
+                if append:
+                    header_end = self._master_csv_state[2]
+                    position = outfile.tell()
+                else:
+                    outfile.write(__get_bytes(None))
+                    header_end = position = outfile.tell()
+
+                # NOTE: we copy consecutive unchanged rows all at once
+                copy_start, copy_end = 0, 0
+                for job, row in rows:
+                    if row is None:
+                        __copy(copy_start, copy_end)
+                        copy_start, copy_end = 0, 0
+                        row_bytes = __get_bytes(job)
+                        outfile.write(row_bytes)
+                        row = (position, position + len(row_bytes), job.row_hash)
+                    else:
+                        if row[0] != copy_end:
+                            __copy(copy_start, copy_end)
+                            copy_start = row[0]
+                        copy_end = row[1]
+                        row = (position, position + row[1] - row[0], row[2])
+                        n_copied += 1
+                    master_csv_rows[job.key_id] = row
+                    position = row[1]
+                    n_jobs += 1
+                __copy(copy_start, copy_end)
+
+                if not append:
+                    outfile.flush()
+                    os.fsync(outfile.fileno())
+        except BaseException:
+            if temp_file_path and os.path.isfile(temp_file_path):
+                os.remove(temp_file_path)
+            raise
+        finally:
+            if infile:
+                infile.close()
+
+        if not append:
+            if os.path.isfile(file_path):
+                shutil.copymode(file_path, temp_file_path)
+            os.replace(temp_file_path, file_path)
+        file_stat = os.stat(file_path)
+        self._master_csv_rows = master_csv_rows
+        self._master_csv_state = (file_stat.st_size, file_stat.st_mtime_ns, header_end)
         self.logger.debug(
-            "Wrote %d jobs to %s",
-            len(jobs),
-            self.config.master_csv_file,
+            "%s %d jobs to %s, %d of them unchanged",
+            "Appended" if append else "Wrote",
+            n_jobs,
+            file_path,
+            n_copied,
         )
 
     def update_user_block_list(self) -> None:
@@ -484,12 +965,12 @@ class JobFunnel(Logger):
                 )
 
         # Add jobs from csv that need to be filtered away, if any + update self
-        n_jobs_added = 0
+        # NOTE: we add them to the block list all at once, in one transaction
+        block_jobs_dict = {}  # type: Dict[str, Dict[str, str]]
         for job in self.master_jobs_dict.values():
             if job.is_remove_status:
                 if job.key_id not in self.job_filter.user_block_jobs_dict:
-                    n_jobs_added += 1
-                    self.job_filter.user_block_jobs_dict[job.key_id] = job.as_json_entry
+                    block_jobs_dict[job.key_id] = job.as_json_entry
                     self.logger.debug(
                         "Added %s to %s", job.key_id, self.config.user_block_list_file
                     )
@@ -501,56 +982,21 @@ class JobFunnel(Logger):
                         job.key_id,
                     )
 
-        if n_jobs_added:
-            # Write out complete list with any additions from the masterlist
-            # NOTE: we use indent=4 so that it stays human-readable.
-            with open(
-                self.config.user_block_list_file, "w", encoding="utf8"
-            ) as outfile:
-                outfile.write(
-                    json.dumps(
-                        self.job_filter.user_block_jobs_dict,
-                        indent=4,
-                        sort_keys=True,
-                        separators=(",", ": "),
-                        ensure_ascii=False,
-                    )
-                )
-
+        if block_jobs_dict:
+            self.job_filter.user_block_jobs_dict.update(block_jobs_dict)
             self.logger.info(
                 "Moved %d jobs into block-list due to removable statuses: %s",
-                n_jobs_added,
+                len(block_jobs_dict),
                 self.config.user_block_list_file,
             )
 
-    def update_duplicates_file(self) -> None:
-        """Update duplicates filter file if we have a path and contents
-        TODO: this should be writing out DuplicatedJob objects and a version
-        so that we retain links to original jobs.
+    def export_lists(self) -> None:
+        """Write the block list and the duplicates list out to their JSON
+        files, sorted and indented so that they are human-readable.
+
+        NOTE: the lists are stored in SQLite, so we only write their JSON
+            files when asked to. If a JSON file is edited, it replaces the
+            stored list the next time we start.
         """
-        if self.config.duplicates_list_file:
-            if self.job_filter.duplicate_jobs_dict:
-                # Write out the changes NOTE: indent=4 is for human-readability
-                self.logger.debug("Extending existing duplicate jobs dict.")
-                with open(
-                    self.config.duplicates_list_file, "w", encoding="utf8"
-                ) as outfile:
-                    outfile.write(
-                        json.dumps(
-                            self.job_filter.duplicate_jobs_dict,
-                            indent=4,
-                            sort_keys=True,
-                            separators=(",", ": "),
-                            ensure_ascii=False,
-                        )
-                    )
-            else:
-                self.logger.debug(
-                    "Current duplicate jobs dict is empty, no updates written."
-                )
-        else:
-            self.logger.warning(
-                "Duplicates will not be saved, no duplicates list "
-                "file set. Saving to a duplicates file will ensure "
-                "that jobs detected to be duplicates by contents persist."
-            )
+        self.job_filter.user_block_jobs_dict.export_json()
+        self.job_filter.duplicate_jobs_dict.export_json()
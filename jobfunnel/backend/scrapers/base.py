@@ -3,28 +3,37 @@ Paul McInnis 2020
 """
 
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from multiprocessing import Lock, Manager
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from queue import Full, Queue
 import random
-from time import sleep
-from typing import Any, Dict, List, Optional
+from threading import Event, Thread
+from typing import Any, Dict, Generator, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
 from bs4 import BeautifulSoup
 from requests import Session
-from requests.adapters import HTTPAdapter
 from tqdm import tqdm
-from urllib3.util import Retry
+
+try:
+    import aiohttp
+except ImportError:  # NOTE: aiohttp is only needed for ScrapeEngine.ASYNCIO
+    aiohttp = None
 
 from jobfunnel.backend import Job, JobStatus
 from jobfunnel.backend.tools import Logger
-from jobfunnel.backend.tools.delay import calculate_delays
+from jobfunnel.backend.tools.delay import RateLimiter
 from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.backend.tools.http_cache import CachedSession
 from jobfunnel.resources import (
     MAX_CPU_WORKERS,
+    MAX_QUEUED_JOB_SOUPS,
     USER_AGENT_LIST,
     JobField,
     Locale,
+    PageKind,
     Remoteness,
+    ScrapeEngine,
 )
 
 # pylint: disable=using-constant-test,unused-import
@@ -33,22 +42,46 @@ if False:  # or typing.TYPE_CHECKING  if python3.5.3+
 # pylint: enable=using-constant-test,unused-import
 
 
+def _next_action(actions: Generator) -> Tuple[bool, Any]:
+    """Run a job's actions up to the next one, i.e. in a worker thread
+
+    NOTE: a StopIteration can't be raised through a Future, so we return it.
+
+    Returns:
+        Tuple[bool, Any]: (False, the url it yielded), or (True, the scraped
+            Job) once it is done.
+    """
+    try:
+        return False, next(actions)
+    except StopIteration as stop:
+        return True, stop.value
+
+
 class BaseScraper(ABC, Logger):
     """Base scraper object, for scraping and filtering Jobs from a provider"""
 
     def __init__(
-        self, session: Session, config: "JobFunnelConfigManager", job_filter: JobFilter
+        self,
+        session: Session,
+        config: "JobFunnelConfigManager",
+        job_filter: JobFilter,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         """Init
 
         Args:
             session (Session): session object used to make post and get requests
+                NOTE: this should not be shared with other scrapers since we
+                set our headers on it, see SessionPool.
             config (JobFunnelConfigManager): config containing all needed paths,
                 search proxy, delaying and other metadata.
             job_filter (JobFilter): object for filtering incoming jobs using
                 various internal filters, including a content-matching tool.
                 NOTE: this runs-on-the-fly as well, and preempts un-promising
                 job scrapes to minimize session() usage.
+            rate_limiter (Optional[RateLimiter], optional): spaces out our
+                requests to each host, pass one in to share it between
+                scrapers. Defaults to a new RateLimiter(config.delay_config).
 
         Raises:
             ValueError: if no Locale is configured in the JobFunnelConfigManager
@@ -61,12 +94,6 @@ class BaseScraper(ABC, Logger):
         if self.headers:
             self.session.headers.update(self.headers)
 
-        # Elongate the retries TODO: make configurable
-        retry = Retry(connect=3, backoff_factor=0.5)
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-
         # Ensure that the locale we want to use matches the locale that the
         # scraper was written to scrape in:
         if self.config.search_config.locale != self.locale:
@@ -78,7 +105,13 @@ class BaseScraper(ABC, Logger):
 
         # Ensure our properties satisfy constraints
         self._validate_get_set()
-        self.thread_manager = Manager()
+
+        # Spaces out our requests to each host by the configured delays
+        self.rate_limiter = rate_limiter or RateLimiter(self.config.delay_config)
+
+        # Pages fetched ahead of set() by the asyncio engine, keyed by url
+        # NOTE: we drop the pages of each job once it is scraped
+        self._prefetched_pages = {}  # type: Dict[str, str]
 
         # Construct actions list which respects priority for scraping Jobs
         self._actions_list = [(True, f) for f in self.job_get_fields]
@@ -200,176 +233,520 @@ class BaseScraper(ABC, Logger):
     def scrape(self) -> Dict[str, Job]:
         """Scrape job source into a dict of unique jobs keyed by ID
 
+        NOTE: use iter_jobs() to process jobs as they are scraped instead.
+
         Returns:
             jobs (Dict[str, Job]): list of Jobs in a Dict keyed by job.key_id
         """
+        return {job.key_id: job for job in self.iter_jobs()}
+
+    def iter_jobs(self) -> Iterator[Job]:
+        """Scrape job source, yielding each unique Job as soon as it is scraped
+
+        NOTE: the search results pages are fetched in the background and feed
+            a bounded queue of job soups, which we start scraping right away.
+        NOTE: only a bounded window of job soups is scraped at any one time and
+            we drop each Job's raw scrape data before yielding it, so memory use
+            is bounded by the number of jobs in flight, not the whole scrape.
 
-        # Get a list of job soups from the initial search results page
+        Yields:
+            Job: validated job, with a key_id that is unique within this scrape
+        """
+        # Get job soups from the search results pages in a producer thread
         # These wont contain enough information to do more than initialize Job
+        job_soups_queue = Queue(maxsize=MAX_QUEUED_JOB_SOUPS)  # type: Queue
+        stop_listing = Event()
+        listing_errors = []  # type: List[Exception]
+        listing_thread = Thread(
+            target=self._put_job_soups,
+            args=(job_soups_queue, stop_listing, listing_errors),
+            daemon=True,
+        )
+        listing_thread.start()
+
+        if self.config.session_config.engine == ScrapeEngine.ASYNCIO:
+            scraped_jobs = self._iter_scraped_jobs_async(job_soups_queue)
+        else:
+            scraped_jobs = self._iter_scraped_jobs_threaded(job_soups_queue)
+
+        # For each job-soup object, scrape the soup into a Job (w/o desc.)
+        titles_by_key_id = {}  # type: Dict[str, str]
         try:
-            job_soups = self.get_job_soups_from_search_result_listings()
-        except Exception as err:
+            for job in tqdm(scraped_jobs, ascii=True, desc=self.__class__.__name__):
+                if not job:
+                    continue
+
+                # Handle inter-scraped data duplicates by key.
+                # TODO: move this functionality into duplicates filter
+                if job.key_id in titles_by_key_id:
+                    self.logger.error(
+                        "Job %s and %s share duplicate key_id: %s",
+                        job.title,
+                        titles_by_key_id[job.key_id],
+                        job.key_id,
+                    )
+                    continue
+                titles_by_key_id[job.key_id] = job.title
+
+                # We are done with the job's page, don't keep it around.
+                job._raw_scrape_data = None  # pylint: disable=protected-access
+                yield job
+        finally:
+            # Cleanup, NOTE: this stops the listing early if we are stopped
+            stop_listing.set()
+            scraped_jobs.close()
+            listing_thread.join()
+
+        if listing_errors:
             raise ValueError(
-                "Unable to extract jobs from initial search result page:\n\t"
-                f"{str(err)}"
+                "Unable to extract jobs from search result pages:\n\t"
+                f"{str(listing_errors[0])}"
             )
-        n_soups = len(job_soups)
+
+    def _put_job_soups(
+        self, job_soups_queue: Queue, stop: Event, errors: List[Exception]
+    ) -> None:
+        """Put the job soups from our search results pages into job_soups_queue,
+        followed by None once we are done. This is meant to run in a thread.
+
+        NOTE: any error is appended to errors rather than raised.
+
+        Args:
+            job_soups_queue (Queue): bounded queue to put the job soups into.
+            stop (Event): set this to stop fetching search results pages early.
+            errors (List[Exception]): list to add any exception we raise to.
+        """
+        n_soups = 0
+        try:
+            for job_soup in self.iter_job_soups_from_search_result_listings():
+                if not self._put_unless_stopped(job_soups_queue, job_soup, stop):
+                    break
+                n_soups += 1
+        except Exception as err:
+            errors.append(err)
+        finally:
+            if not self._put_unless_stopped(job_soups_queue, None, stop):
+                # NOTE: if the queue is full, nobody is waiting on it anyways
+                try:
+                    job_soups_queue.put_nowait(None)
+                except Full:
+                    pass
         self.logger.info("Scraped %s job listings from search results pages", n_soups)
 
-        # Init a Manager so we can control delaying
-        # this is assuming every job will incur one delayed session.get()
-        # NOTE pylint issue: https://github.com/PyCQA/pylint/issues/3313
-        delay_lock = self.thread_manager.Lock()  # pylint: disable=no-member
+    @staticmethod
+    def _put_unless_stopped(queue: Queue, item: Any, stop: Event) -> bool:
+        """Put item into queue, waiting for room unless stop gets set.
+
+        Returns:
+            bool: True if item was put into the queue.
+        """
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def _iter_scraped_jobs_threaded(
+        self, job_soups_queue: Queue
+    ) -> Iterator[Optional[Job]]:
+        """Scrape job soups with a pool of workers, in order of completion
+
+        NOTE: we keep at most 2 job soups per worker submitted at once so that
+            finished jobs can be consumed before the rest are scraped.
+
+        Args:
+            job_soups_queue (Queue): job soups from the search results, which
+                ends with None.
+
+        Yields:
+            Optional[Job]: scraped job, or None if the scrape failed.
+        """
+        # NOTE: only get/set calls in self.delayed_get_set_fields will wait
+        # on self.rate_limiter, the rest of the scraping runs meanwhile.
         threads = ThreadPoolExecutor(max_workers=MAX_CPU_WORKERS)
+        getter = ThreadPoolExecutor(max_workers=1)
+        futures: Set[Future] = set()
+        next_job_soup = None  # type: Optional[Future]
+        listing_done = False
+        try:
+            while True:
+                # Take the next job soup from the queue when we have room for it
+                if (
+                    not (listing_done or next_job_soup)
+                    and len(futures) < 2 * MAX_CPU_WORKERS
+                ):
+                    next_job_soup = getter.submit(job_soups_queue.get)
+                if not (futures or next_job_soup):
+                    break
 
-        # Distribute work to N workers such that each worker is building one
-        # Job at a time, getting and setting all required attributes
-        jobs_dict = {}  # type: Dict[str, Job]
+                done, _ = wait(
+                    futures | {next_job_soup} if next_job_soup else futures,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    if future is next_job_soup:
+                        next_job_soup = None
+                        job_soup = future.result()
+                        if job_soup is None:
+                            listing_done = True
+                        else:
+                            futures.add(threads.submit(self.scrape_job, job_soup))
+                    else:
+                        futures.remove(future)
+                        yield future.result()
+        finally:
+            # Cleanup
+            for future in futures:
+                future.cancel()
+            threads.shutdown()
+            getter.shutdown()
+
+    def _iter_scraped_jobs_async(
+        self, job_soups_queue: Queue
+    ) -> Iterator[Optional[Job]]:
+        """Scrape job soups with asyncio, in order of completion
+
+        Every job's own page is fetched with aiohttp ahead of set(), so we can
+        keep up to max_concurrent_requests requests in flight at once. The
+        get() and set() calls (and any fetch() that falls back to a blocking
+        session.get()) run in a pool of worker threads, so they never block
+        the event loop.
+
+        NOTE: we run the event loop in between yields, and keep at most 2 job
+            soups per concurrent request scheduled at once.
+        NOTE: this only helps scrapers which fetch() each job's own page in a
+            delayed set(), i.e. Monster and Glassdoor. Indeed gets every field
+            from its search results, so it scrapes the same with either engine.
+
+        Args:
+            job_soups_queue (Queue): job soups from the search results, which
+                ends with None.
+
+        Yields:
+            Optional[Job]: scraped job, or None if the scrape failed.
+        """
+        max_requests = self.config.session_config.max_concurrent_requests
+        request_semaphore = asyncio.Semaphore(max_requests)
+        loop = asyncio.new_event_loop()
+        threads = ThreadPoolExecutor(max_workers=MAX_CPU_WORKERS)
+        client = loop.run_until_complete(self._get_aiohttp_client(max_requests))
+        tasks: Set[asyncio.Future] = set()
+        next_job_soup = None  # type: Optional[asyncio.Future]
+        listing_done = False
         try:
-            # Calculate delays for get/set calls per-job NOTE: only get/set
-            # calls in self.delayed_get_set_fields will be delayed.
-            # and it busy-waits.
-            delays = calculate_delays(n_soups, self.config.delay_config)
-            futures = []
-            for job_soup, delay in zip(job_soups, delays):
-                futures.append(
-                    threads.submit(
-                        self.scrape_job,
-                        job_soup=job_soup,
-                        delay=delay,
-                        delay_lock=delay_lock,
+            while True:
+                # Take the next job soup from the queue when we have room for it
+                # NOTE: same delaying as the threaded engine, only get/set calls
+                # in self.delayed_get_set_fields will wait on self.rate_limiter.
+                if (
+                    not (listing_done or next_job_soup)
+                    and len(tasks) < 2 * max_requests
+                ):
+                    next_job_soup = loop.run_in_executor(None, job_soups_queue.get)
+                if not (tasks or next_job_soup):
+                    break
+
+                done, _ = loop.run_until_complete(
+                    asyncio.wait(
+                        tasks | {next_job_soup} if next_job_soup else tasks,
+                        return_when=asyncio.FIRST_COMPLETED,
                     )
                 )
-
-            # For each job-soup object, scrape the soup into a Job (w/o desc.)
-            for future in tqdm(as_completed(futures), total=n_soups, ascii=True):
-                job = future.result()
-                if job:
-                    # Handle inter-scraped data duplicates by key.
-                    # TODO: move this functionality into duplicates filter
-                    if job.key_id in jobs_dict:
-                        self.logger.error(
-                            "Job %s and %s share duplicate key_id: %s",
-                            job.title,
-                            jobs_dict[job.key_id].title,
-                            job.key_id,
-                        )
+                for task in done:
+                    if task is next_job_soup:
+                        next_job_soup = None
+                        job_soup = task.result()
+                        if job_soup is None:
+                            listing_done = True
+                        else:
+                            tasks.add(
+                                loop.create_task(
+                                    self._scrape_job_async(
+                                        client, job_soup, request_semaphore, threads
+                                    )
+                                )
+                            )
                     else:
-                        jobs_dict[job.key_id] = job
-
+                        tasks.remove(task)
+                        yield task.result()
         finally:
             # Cleanup
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.wait(tasks))
+            loop.run_until_complete(client.close())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
             threads.shutdown()
 
-        return jobs_dict
+    async def _get_aiohttp_client(self, max_requests: int) -> "aiohttp.ClientSession":
+        """Get an aiohttp client with the same headers and cookies as our Session
+
+        NOTE: this must run on the event loop which will be using the client.
+        """
+        return aiohttp.ClientSession(
+            headers=dict(self.session.headers),
+            cookies=self.session.cookies.get_dict(),
+            connector=aiohttp.TCPConnector(limit=max_requests),
+        )
+
+    def fetch(self, url: str) -> str:
+        """Get the text of the page at url, i.e. the job's own page
+
+        NOTE: when scraping with ScrapeEngine.ASYNCIO the page has usually
+            been prefetched already, otherwise we GET it with self.session.
+        """
+        page = self._prefetched_pages.pop(url, None)
+        if page is None:
+            if isinstance(self.session, CachedSession):
+                with self.session.cached_as(PageKind.JOB):
+                    page = self.session.get(url).text
+            else:
+                page = self.session.get(url).text
+        return page
+
+    def is_cached(self, url: Optional[str]) -> bool:
+        """True if fetch(url) will be served by our HTTP cache without a request,
+        in which case we don't need to wait for a request slot either.
+        """
+        return (
+            bool(url)
+            and isinstance(self.session, CachedSession)
+            and self.session.is_fresh(url, PageKind.JOB)
+        )
 
     # pylint: disable=no-member
-    def scrape_job(
-        self, job_soup: BeautifulSoup, delay: float, delay_lock: Optional[Lock] = None
-    ) -> Optional[Job]:
+    def scrape_job(self, job_soup: BeautifulSoup) -> Optional[Job]:
         """Scrapes a search page and get a list of soups that will yield jobs
         Arguments:
             job_soup (BeautifulSoup): This is a soup object that your get/set
                 will use to perform the get/set action. It should be specific
                 to this job and not contain other job information.
-            delay (float): how long to delay getting/setting for certain
-                get/set calls while scraping data for this job.
-            delay_lock (Optional[Manager.Lock], optional): semaphore for
-                synchronizing respectful delaying across workers
 
         NOTE: this will never raise an exception to prevent killing workers,
             who are building jobs sequentially.
+        NOTE: get/set calls in self.delayed_get_set_fields first wait for a
+            request slot from self.rate_limiter.
 
         Returns:
             Optional[Job]: job object constructed from the soup and localization
                 of class, returns None if scrape failed.
         """
+        actions = self._scrape_job_actions(job_soup)
+        try:
+            url = next(actions)
+            while True:
+                # Respectfully delay if it's configured to do so.
+                if not self.is_cached(url):
+                    self.rate_limiter.wait(url)
+                url = next(actions)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _scrape_job_async(
+        self,
+        client: "aiohttp.ClientSession",
+        job_soup: BeautifulSoup,
+        request_semaphore: asyncio.Semaphore,
+        threads: ThreadPoolExecutor,
+    ) -> Optional[Job]:
+        """Same as scrape_job() but waits without blocking, and fetches the
+        job's own page with aiohttp so that set() can read it via fetch().
+
+        NOTE: the get() and set() calls (and HTTP cache reads and writes) run
+            in threads, the pages we prefetch for this job are dropped once it
+            is scraped, whether set() used them or not.
+
+        Arguments:
+            client (aiohttp.ClientSession): client used to prefetch pages.
+            job_soup (BeautifulSoup): soup object that your get/set will use.
+            request_semaphore (asyncio.Semaphore): caps requests in flight.
+            threads (ThreadPoolExecutor): workers that run get() and set().
+
+        Returns:
+            Optional[Job]: job object constructed from the soup and localization
+                of class, returns None if scrape failed.
+        """
+        loop = asyncio.get_running_loop()
+        actions = self._scrape_job_actions(job_soup)
+        prefetched_urls = []  # type: List[str]
+        try:
+            is_done, url = await loop.run_in_executor(threads, _next_action, actions)
+            while not is_done:
+                # Cached pages are read by fetch() without making a request
+                if url in self._prefetched_pages or await loop.run_in_executor(
+                    threads, self.is_cached, url
+                ):
+                    is_done, url = await loop.run_in_executor(
+                        threads, _next_action, actions
+                    )
+                    continue
+
+                # Respectfully delay if it's configured to do so.
+                await self.rate_limiter.wait_async(url)
+
+                # Prefetch the page, NOTE: fetch() falls back to session.get()
+                if url:
+                    try:
+                        async with request_semaphore:
+                            async with client.get(
+                                url,
+                                proxy=self.session.proxies.get(urlsplit(url).scheme),
+                            ) as response:
+                                self._prefetched_pages[url] = await response.text()
+                                prefetched_urls.append(url)
+                                if isinstance(self.session, CachedSession):
+                                    await loop.run_in_executor(
+                                        threads,
+                                        self.session.store_response,
+                                        url,
+                                        response.status,
+                                        dict(response.headers),
+                                        await response.read(),
+                                    )
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                        self.logger.debug("Unable to prefetch %s: %s", url, err)
+                is_done, url = await loop.run_in_executor(
+                    threads, _next_action, actions
+                )
+            return url  # i.e. the scraped Job
+        finally:
+            for url in prefetched_urls:
+                self._prefetched_pages.pop(url, None)
+
+    def _scrape_job_actions(
+        self, job_soup: BeautifulSoup
+    ) -> Generator[Optional[str], None, Optional[Job]]:
+        """Build a Job by calling get() and set() for every field, in priority
+
+        NOTE: this yields before every action in self.delayed_get_set_fields so
+            that the caller can wait for a request slot first. The yielded value is
+            the url of the job's own page which is about to be used, or "" if
+            we haven't got it yet (i.e. a delayed get() before JobField.URL).
+        NOTE: the scraped Job is the return value (i.e. StopIteration.value)
+
+        Arguments:
+            job_soup (BeautifulSoup): This is a soup object that your get/set
+                will use to perform the get/set action.
+        """
         # Scrape the data for the post, requiring a minimum of info...
         # NOTE: if we perform a self.session.get we may get respectfully delayed
         job = None  # type: Optional[Job]
         invalid_job = False  # type: bool
+        claimed_key_id = None  # type: Optional[str]
+        is_scraped = False  # type: bool
         job_init_kwargs = self.job_init_kwargs  # NOTE: faster?
-        for is_get, field in self._actions_list:
-            # Break out immediately because we have failed a filterable
-            # condition with something we initialized while scraping.
-            if job and self.job_filter.filterable(job):
-                if self.job_filter.is_duplicate(job):
-                    # NOTE: if we pre-empt scraping duplicates we cannot update
-                    # the existing job listing with the new information!
-                    # TODO: make this behaviour configurable? ('minimal-get' ?)
-                    self.logger.debug(
-                        "Scraped job %s has key_id in known duplicates list. "
-                        "Continuing scrape of job to update existing job "
-                        "attributes.",
-                        job.key_id,
-                    )
-                else:
-                    self.logger.debug(
-                        "Cancelled scraping of %s, failed JobFilter", job.key_id
+        try:
+            for is_get, field in self._actions_list:
+                # Break out immediately because we have failed a filterable
+                # condition with something we initialized while scraping.
+                if job and self.job_filter.filterable(job):
+                    if self.job_filter.is_duplicate(job):
+                        # NOTE: if we pre-empt scraping duplicates we cannot
+                        # update the existing job listing with the new info!
+                        # TODO: make this configurable? ('minimal-get' ?)
+                        self.logger.debug(
+                            "Scraped job %s has key_id in known duplicates list. "
+                            "Continuing scrape of job to update existing job "
+                            "attributes.",
+                            job.key_id,
+                        )
+                    else:
+                        self.logger.debug(
+                            "Cancelled scraping of %s, failed JobFilter", job.key_id
+                        )
+                        invalid_job = True
+                        break
+
+                if not (is_get or job):
+                    # Build initial job object + populate all the job
+                    job = Job(**{k.name.lower(): v for k, v in job_init_kwargs.items()})
+
+                    # Don't scrape the rest of a listing another provider has
+                    # NOTE: the filter lists this job as a duplicate of the
+                    # other once we know that we kept the other.
+                    other_key_id = self.job_filter.claim_listing(
+                        job, job.provider + "_" + job.key_id
                     )
-                    invalid_job = True
-                    break
+                    if other_key_id:
+                        self.logger.debug(
+                            "Cancelled scraping of %s, same listing as %s",
+                            job.key_id,
+                            other_key_id,
+                        )
+                        return None
+                    claimed_key_id = job.provider + "_" + job.key_id
 
-            # Respectfully delay if it's configured to do so.
-            if field in self.delayed_get_set_fields:
-                if delay_lock:
-                    self.logger.debug("Delaying for %.4f", delay)
-                    with delay_lock:
-                        sleep(delay)
-                else:
-                    sleep(delay)
+                # Let the caller respectfully delay if it's configured to do so.
+                if field in self.delayed_get_set_fields:
+                    yield job.url if job else job_init_kwargs.get(JobField.URL, "")
 
-            try:
-                if is_get:
-                    job_init_kwargs[field] = self.get(field, job_soup)
-                else:
-                    if not job:
-                        # Build initial job object + populate all the job
-                        job = Job(
-                            **{k.name.lower(): v for k, v in job_init_kwargs.items()}
+                try:
+                    if is_get:
+                        job_init_kwargs[field] = self.get(field, job_soup)
+                    else:
+                        self.set(field, job, job_soup)
+
+                except Exception as err:
+                    # TODO: we should really dump the soup object to an XML file
+                    # so that users encountering bugs can submit it and we can
+                    # quickly fix any failing scraping.
+
+                    url_str = job.url if job else ""
+                    if field in self.min_required_job_fields:
+                        raise ValueError(
+                            "Unable to scrape minimum-required job field: "
+                            f"{field.name} Got error:{err}. {url_str}"
+                        )
+                    else:
+                        # Crash out gracefully so we can continue scraping.
+                        self.logger.warning(
+                            "Unable to scrape %s for job: %s. %s",
+                            field.name.lower(),
+                            err,
+                            url_str,
                         )
-                    self.set(field, job, job_soup)
-
-            except Exception as err:
-                # TODO: we should really dump the soup object to an XML file
-                # so that users encountering bugs can submit it and we can
-                # quickly fix any failing scraping.
-
-                url_str = job.url if job else ""
-                if field in self.min_required_job_fields:
-                    raise ValueError(
-                        "Unable to scrape minimum-required job field: "
-                        f"{field.name} Got error:{err}. {url_str}"
-                    )
-                else:
-                    # Crash out gracefully so we can continue scraping.
-                    self.logger.warning(
-                        "Unable to scrape %s for job: %s. %s",
-                        field.name.lower(),
-                        err,
-                        url_str,
-                    )
 
-        # Validate job fields if we got something
-        if job and not invalid_job:
-            try:
-                job.validate()
+            # Validate job fields if we got something
+            if job and not invalid_job:
+                try:
+                    job.validate()
 
-            except Exception as err:
-                # Bad job scrapes can't take down execution!
-                # NOTE: desc too short etc, usually indicates that the job
-                # is an empty page. Not sure why this comes up once in awhile...
-                self.logger.error("Job failed validation: %s", err)
-                return None
+                except Exception as err:
+                    # Bad job scrapes can't take down execution!
+                    # NOTE: desc too short etc, usually indicates that the job
+                    # is an empty page. Not sure why this comes up once in awhile
+                    self.logger.error("Job failed validation: %s", err)
+                    return None
+                is_scraped = True
 
-        # Prefix the id with the scraper name to avoid key conflicts
-        new_key_id = job.provider + "_" + job.key_id
-        job.key_id = new_key_id
+            # Prefix the id with the scraper name to avoid key conflicts
+            new_key_id = job.provider + "_" + job.key_id
+            job.key_id = new_key_id
 
-        return job
+            return job
+        finally:
+            # Let other providers scrape their copy of a listing we failed on
+            if claimed_key_id and not is_scraped:
+                self.job_filter.release_listing(job, claimed_key_id)
 
     # pylint: enable=no-member
 
+    def iter_job_soups_from_search_result_listings(self) -> Iterator[BeautifulSoup]:
+        """Yield the job soups from the search results as they are fetched.
+
+        Override this to yield each page's soups as soon as it is fetched so
+        that we can begin scraping jobs before all the pages are in. By default
+        this yields from get_job_soups_from_search_result_listings().
+
+        Yields:
+            BeautifulSoup: job soup we can use to make a Job
+        """
+        yield from self.get_job_soups_from_search_result_listings()
+
     @abstractmethod
     def get_job_soups_from_search_result_listings(self) -> List[BeautifulSoup]:
         """Scrapes a job provider's response to a search query where we are
@@ -377,6 +754,9 @@ class BaseScraper(ABC, Logger):
 
         NOTE: the soups list returned by this method should contain enough
         information to set your self.min_required_job_fields with get()
+        NOTE: a 'soup' is whatever per-job listing object your get() and set()
+        accept, i.e. if the provider serves listings as JSON you can return the
+        decoded dicts here so that they are only ever parsed once.
 
         Returns:
             List[BeautifulSoup]: list of jobs soups we can use to make a Job
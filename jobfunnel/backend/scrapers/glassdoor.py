@@ -3,10 +3,10 @@ FIXME: this is currently unable to get past page 1 of job results.
 """
 
 from abc import abstractmethod
-from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from math import ceil
 import re
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from bs4 import BeautifulSoup
 from requests import Session
@@ -18,6 +18,7 @@ from jobfunnel.backend.scrapers.base import (
     BaseUKEngScraper,
     BaseUSAEngScraper,
 )
+from jobfunnel.backend.tools.delay import RateLimiter
 from jobfunnel.backend.tools.filters import JobFilter
 from jobfunnel.backend.tools.tools import calc_post_date_from_relative_str
 from jobfunnel.resources import MAX_CPU_WORKERS, JobField
@@ -44,10 +45,14 @@ GLASSDOOR_RADIUS_MAP = {
 
 class BaseGlassDoorScraper(BaseScraper):
     def __init__(
-        self, session: Session, config: "JobFunnelConfigManager", job_filter: JobFilter
+        self,
+        session: Session,
+        config: "JobFunnelConfigManager",
+        job_filter: JobFilter,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         """Init that contains glassdoor specific stuff"""
-        super().__init__(session, config, job_filter)
+        super().__init__(session, config, job_filter, rate_limiter)
         self.max_results_per_page = MAX_RESULTS_PER_GLASSDOOR_PAGE
         self.query = "-".join(self.config.search_config.keywords)
         # self.driver = get_webdriver() TODO: we can use this if-needed
@@ -152,6 +157,14 @@ class BaseGlassDoorScraper(BaseScraper):
         Returns:
             List[BeautifulSoup]: list of jobs soups we can use to make Job init
         """
+        return list(self.iter_job_soups_from_search_result_listings())
+
+    def iter_job_soups_from_search_result_listings(self) -> Iterator[BeautifulSoup]:
+        """Yield the job soups from each search results page as it comes in
+
+        Yields:
+            BeautifulSoup: job soup we can use to make Job init
+        """
         # Get the search url
         search_url, data = self.get_search_url(method="post")
 
@@ -166,32 +179,33 @@ class BaseGlassDoorScraper(BaseScraper):
         )
 
         # Get the first page of job soups from the search results listings
-        job_soup_list = self._parse_job_listings_to_bs4(soup_base)
+        yield from self._parse_job_listings_to_bs4(soup_base)
 
         # Init threads & futures list FIXME: we should probably delay here too
         threads = ThreadPoolExecutor(MAX_CPU_WORKERS)
+        futures: List[Future] = []
         try:
             # Search the remaining pages to extract the list of job soups
             # FIXME: we can't load page 2, it redirects to page 1.
             # There is toast that shows to get email notifs that shows up if
             # I click it myself, must be an event listener?
-            futures = []
             if n_pages > 1:
-                for page in range(2, n_pages + 1):
-                    futures.append(
-                        threads.submit(
-                            self._search_page_for_job_soups,
-                            self._get_next_page_url(soup_base, page),
-                            job_soup_list,
-                        )
+                futures = [
+                    threads.submit(
+                        self._search_page_for_job_soups,
+                        self._get_next_page_url(soup_base, page),
                     )
+                    for page in range(2, n_pages + 1)
+                ]
 
-            wait(futures)  # wait for all scrape jobs to finish
+            # Yield each page's job soups as soon as it is scraped
+            for future in as_completed(futures):
+                yield from future.result()
         finally:
+            for future in futures:
+                future.cancel()
             threads.shutdown()
 
-        return job_soup_list
-
     def get(self, parameter: JobField, soup: BeautifulSoup) -> Any:
         """Get a single job attribute from a soup object by JobField
         TODO: impl div class=compactStars value somewhere.
@@ -248,7 +262,7 @@ class BaseGlassDoorScraper(BaseScraper):
         """
         if parameter == JobField.RAW:
             job._raw_scrape_data = BeautifulSoup(
-                self.session.get(job.url).text, self.config.bs4_parser
+                self.fetch(job.url), self.config.bs4_parser
             )
         elif parameter == JobField.DESCRIPTION:
             assert job._raw_scrape_data
@@ -258,19 +272,15 @@ class BaseGlassDoorScraper(BaseScraper):
         else:
             raise NotImplementedError(f"Cannot set {parameter.name}")
 
-    def _search_page_for_job_soups(
-        self, listings_page_url: str, job_soup_list: List[BeautifulSoup]
-    ) -> None:
+    def _search_page_for_job_soups(self, listings_page_url: str) -> List[BeautifulSoup]:
         """Get a list of job soups from a glassdoor page, by loading the page.
         NOTE: this makes GET requests and should be respectfully delayed.
         """
         self.logger.debug(f"Scraping listings page {listings_page_url}")
-        job_soup_list.extend(
-            self._parse_job_listings_to_bs4(
-                BeautifulSoup(
-                    self.session.get(listings_page_url).text,
-                    self.config.bs4_parser,
-                )
+        return self._parse_job_listings_to_bs4(
+            BeautifulSoup(
+                self.session.get(listings_page_url).text,
+                self.config.bs4_parser,
             )
         )
 
@@ -1,12 +1,12 @@
 """Scraper designed to get jobs from www.indeed.X
 """
 
-from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import json
 from math import ceil
 import random
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from unicodedata import normalize
 
 from bs4 import BeautifulSoup
@@ -21,6 +21,7 @@ from jobfunnel.backend.scrapers.base import (
     BaseUKEngScraper,
     BaseUSAEngScraper,
 )
+from jobfunnel.backend.tools.delay import RateLimiter
 from jobfunnel.backend.tools.filters import JobFilter
 from jobfunnel.backend.tools.tools import calc_post_date_from_relative_str
 from jobfunnel.resources import (
@@ -52,6 +53,10 @@ REMOTENESS_STR_MAP = {
     "hybrid work": Remoteness.TEMPORARILY_REMOTE,
 }
 
+# A job card is a single decoded entry of the mosaic-provider-jobcards results
+# NOTE: we keep the decoded dict so that get() never has to re-parse any JSON.
+IndeedJobCard = Dict[str, Any]
+
 
 def format_taxonomy_attributes(taxonomy_attributes):
     result = []
@@ -81,10 +86,14 @@ class BaseIndeedScraper(BaseScraper):
     """Scrapes jobs from www.indeed.X"""
 
     def __init__(
-        self, session: Session, config: "JobFunnelConfigManager", job_filter: JobFilter
+        self,
+        session: Session,
+        config: "JobFunnelConfigManager",
+        job_filter: JobFilter,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         """Init that contains indeed specific stuff"""
-        super().__init__(session, config, job_filter)
+        super().__init__(session, config, job_filter, rate_limiter)
         self.max_results_per_page = MAX_RESULTS_PER_INDEED_PAGE
         self.query = "+".join(self.config.search_config.keywords)
 
@@ -155,11 +164,22 @@ class BaseIndeedScraper(BaseScraper):
             "Connection": "keep-alive",
         }
 
-    def get_job_soups_from_search_result_listings(self) -> List[BeautifulSoup]:
-        """Scrapes raw data from a job source into a list of job-soups
+    def get_job_soups_from_search_result_listings(self) -> List[IndeedJobCard]:
+        """Scrapes raw data from a job source into a list of job cards
+
+        NOTE: Indeed embeds its listings as JSON, so rather than soups we return
+            the decoded job card dicts, each is decoded exactly once.
 
         Returns:
-            List[BeautifulSoup]: list of jobs soups we can use to make Job init
+            List[IndeedJobCard]: list of job cards we can use to make Job init
+        """
+        return list(self.iter_job_soups_from_search_result_listings())
+
+    def iter_job_soups_from_search_result_listings(self) -> Iterator[IndeedJobCard]:
+        """Yield the job cards from each search results page as it comes in
+
+        Yields:
+            IndeedJobCard: job card we can use to make Job init
         """
         # Get the search url
         search_url = self._get_search_url()
@@ -170,37 +190,28 @@ class BaseIndeedScraper(BaseScraper):
             "Found %d pages of search results for query=%s", pages, self.query
         )
 
-        # Init list of job soups
-        job_soup_list = []  # type: List[Any]
-
         # Init threads & futures list FIXME: we should probably delay here too
         threads = ThreadPoolExecutor(max_workers=MAX_CPU_WORKERS)
+        futures: List[Future] = []
         try:
             # Scrape soups for all the result pages containing many job listings
-            futures = []
-            for page in range(0, pages):
-                futures.append(
-                    threads.submit(
-                        self._get_job_soups_from_search_page,
-                        search_url,
-                        page,
-                        job_soup_list,
-                    )
-                )
+            futures = [
+                threads.submit(self._get_job_soups_from_search_page, search_url, page)
+                for page in range(0, pages)
+            ]
 
-            # Wait for all scrape jobs to finish
-            wait(futures)
+            # Yield each page's job cards as soon as it is scraped
+            for future in as_completed(futures):
+                yield from future.result()
 
         finally:
+            for future in futures:
+                future.cancel()
             threads.shutdown()
 
-        return job_soup_list
-
-    def get(self, parameter: JobField, soup: BeautifulSoup) -> Any:
-        """Get a single job attribute from a soup object that was derived from a JSON string."""
-
-        # Convert BeautifulSoup object back to a dictionary
-        job_data = json.loads(soup.text)
+    def get(self, parameter: JobField, soup: IndeedJobCard) -> Any:
+        """Get a single job attribute from a decoded job card by JobField"""
+        job_data = soup
 
         if parameter == JobField.TITLE:
             return job_data.get("displayTitle", None)
@@ -253,13 +264,13 @@ class BaseIndeedScraper(BaseScraper):
         else:
             raise NotImplementedError(f"Cannot get {parameter.name}")
 
-    def set(self, parameter: JobField, job: Job, soup: BeautifulSoup) -> None:
-        """Set a single job attribute from a soup object by JobField
+    def set(self, parameter: JobField, job: Job, soup: IndeedJobCard) -> None:
+        """Set a single job attribute from a job card by JobField
         NOTE: URL is high-priority, since we need it to get RAW.
         """
         if parameter == JobField.RAW:
             job._raw_scrape_data = BeautifulSoup(
-                self.session.get(job.url).text, self.config.bs4_parser
+                self.fetch(job.url), self.config.bs4_parser
             )
 
         elif parameter == JobField.REMOTENESS:
@@ -336,14 +347,15 @@ class BaseIndeedScraper(BaseScraper):
         return radius
 
     def _get_job_soups_from_search_page(
-        self, search: str, page: str, job_soup_list: List[BeautifulSoup]
-    ) -> None:
-        """Scrapes the indeed page for a list of job soups
-        NOTE: modifies the job_soup_list in-place
+        self, search: str, page: str
+    ) -> List[IndeedJobCard]:
+        """Scrapes the indeed page for a list of job cards
+        NOTE: errors are logged, and give us an empty list of job cards
         NOTE: Indeed's remoteness filter sucks, and we will always see a mix.
             ... need to add some kind of filtering for this!
         """
         url = f"{search}&start={page * self.max_results_per_page}"
+        job_soup_list = []  # type: List[IndeedJobCard]
 
         try:
             response = self.session.get(url).text
@@ -352,7 +364,7 @@ class BaseIndeedScraper(BaseScraper):
             script_tag = soup.find("script", id="mosaic-data")
             if not script_tag:
                 self.logger.warn("No 'mosaic-data' script tag found on the page.")
-                return
+                return job_soup_list
 
             script_content = script_tag.string
             json_regex = re.search(
@@ -373,13 +385,7 @@ class BaseIndeedScraper(BaseScraper):
                     )
 
                     if job_data:
-                        job_data_json = [json.dumps(job) for job in job_data]
-                        job_soup_list.extend(
-                            [
-                                BeautifulSoup(job_json, "lxml")
-                                for job_json in job_data_json
-                            ]
-                        )
+                        job_soup_list.extend(job_data)
                     else:
                         self.logger.error("No job data found in the JSON structure.")
                 except json.JSONDecodeError as e:
@@ -394,6 +400,8 @@ class BaseIndeedScraper(BaseScraper):
                 f"An error occurred while fetching or parsing the page: {e}"
             )
 
+        return job_soup_list
+
     def _get_num_search_result_pages(self, search_url: str, max_pages=0) -> int:
         """Calculates the number of pages of job listings to be scraped.
 
@@ -2,9 +2,12 @@
 """
 
 from abc import abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from math import ceil
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set
 
 from bs4 import BeautifulSoup
 from requests import Session
@@ -17,9 +20,10 @@ from jobfunnel.backend.scrapers.base import (
     BaseUKEngScraper,
     BaseUSAEngScraper,
 )
+from jobfunnel.backend.tools.delay import RateLimiter
 from jobfunnel.backend.tools.filters import JobFilter
 from jobfunnel.backend.tools.tools import calc_post_date_from_relative_str
-from jobfunnel.resources import JobField, Remoteness
+from jobfunnel.resources import MAX_CPU_WORKERS, JobField, Remoteness
 
 # pylint: disable=using-constant-test,unused-import
 if False:  # or typing.TYPE_CHECKING  if python3.5.3+
@@ -33,6 +37,7 @@ ID_REGEX = re.compile(
     r"/((?:[0-9a-f]{8}-[0-9a-f]{4}-[1-5][0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]"
     r"{12})|\d+)"
 )
+POSTING_ID_REGEX = re.compile(r"data-m_impr_j_postingid=[\"']([^\"']+)[\"']")
 
 
 class BaseMonsterScraper(BaseScraper):
@@ -43,10 +48,14 @@ class BaseMonsterScraper(BaseScraper):
     """
 
     def __init__(
-        self, session: Session, config: "JobFunnelConfigManager", job_filter: JobFilter
+        self,
+        session: Session,
+        config: "JobFunnelConfigManager",
+        job_filter: JobFilter,
+        rate_limiter: Optional[RateLimiter] = None,
     ) -> None:
         """Init that contains monster specific stuff"""
-        super().__init__(session, config, job_filter)
+        super().__init__(session, config, job_filter, rate_limiter)
         self.query = "-".join(self.config.search_config.keywords).replace(" ", "-")
 
         # This is currently not scrapable through Monster site (contents maybe)
@@ -136,7 +145,7 @@ class BaseMonsterScraper(BaseScraper):
         """
         if parameter == JobField.RAW:
             job._raw_scrape_data = BeautifulSoup(
-                self.session.get(job.url).text, self.config.bs4_parser
+                self.fetch(job.url), self.config.bs4_parser
             )
         elif parameter == JobField.WAGE:
             pot_wage_cell = job._raw_scrape_data.find(
@@ -172,15 +181,29 @@ class BaseMonsterScraper(BaseScraper):
     def get_job_soups_from_search_result_listings(self) -> List[BeautifulSoup]:
         """Scrapes raw data from a job source into a list of job-soups
 
-        TODO: use threading here too
-
         Returns:
             List[BeautifulSoup]: list of jobs soups we can use to make Job init
         """
+        return list(self.iter_job_soups_from_search_result_listings())
+
+    def iter_job_soups_from_search_result_listings(self) -> Iterator[BeautifulSoup]:
+        """Yield the new job soups from each search results page as it comes in
+
+        NOTE: Monster is an endless-scroll style of job site so every page also
+            contains the listings of all the pages before it. We fetch pages
+            concurrently but handle them in order, only yield listings we have
+            not seen yet, and stop as soon as a page adds no new listings.
+        NOTE: results pages share request slots with the job pages on
+            self.rate_limiter, since they are on the same host.
+
+        Yields:
+            BeautifulSoup: job soup we can use to make Job init
+        """
         # Get the search url
         search_url = self._get_search_url()
 
         # Load our initial search results listings page
+        self.rate_limiter.wait(search_url)
         initial_search_results_html = self.session.get(search_url)
         initial_search_results_soup = BeautifulSoup(
             initial_search_results_html.text, self.config.bs4_parser
@@ -203,34 +226,63 @@ class BaseMonsterScraper(BaseScraper):
         )
 
         # Get first page of listing soups from our search results listings page
-        # NOTE: Monster is an endless-scroll style of job site so we have to
-        # Remove previous pages as we go.
-        # TODO: better error handling here?
-        # TODO: maybe we can move this into get set / BaseScraper somehow?
-        def __get_job_soups_by_key_id(
-            result_listings: BeautifulSoup,
-        ) -> Dict[str, BeautifulSoup]:
-            return {
-                self.get(JobField.KEY_ID, job_soup): job_soup
-                for job_soup in self._get_job_soups_from_search_page(result_listings)
-            }
-
-        job_soups_dict = __get_job_soups_by_key_id(initial_search_results_soup)
-
-        # Get all the other pages
-        if n_pages > 1:
-            for page in range(2, n_pages):
-                next_listings_page_soup = BeautifulSoup(
-                    self.session.get(self._get_search_url(page=page)).text,
-                    self.config.bs4_parser,
+        seen_key_ids = set()  # type: Set[str]
+        yield from self._get_new_job_soups(initial_search_results_soup, seen_key_ids)
+
+        # Get all the other pages, keeping up to MAX_CPU_WORKERS in flight
+        # NOTE: each one waits for its request slot on self.rate_limiter
+        threads = ThreadPoolExecutor(max_workers=MAX_CPU_WORKERS)
+        pages = iter(range(2, n_pages + 1))
+        futures: Deque[Future] = deque()
+        try:
+            futures.extend(
+                threads.submit(self._get_search_results_page_html, page)
+                for page in islice(pages, MAX_CPU_WORKERS)
+            )
+            while futures:
+                page_html = futures.popleft().result()
+
+                # Pre-scan the page's posting ids so that we don't have to parse
+                # the (ever-growing) page unless it has listings we haven't seen
+                if not set(POSTING_ID_REGEX.findall(page_html)) - seen_key_ids:
+                    self.logger.debug(
+                        "Stopping early, search results page has no new listings"
+                    )
+                    break
+                futures.extend(
+                    threads.submit(self._get_search_results_page_html, page)
+                    for page in islice(pages, 1)
                 )
-                # Add only the jobs that we didn't 'scroll' past already
-                job_soups_dict.update(
-                    __get_job_soups_by_key_id(next_listings_page_soup)
+                yield from self._get_new_job_soups(
+                    BeautifulSoup(page_html, self.config.bs4_parser), seen_key_ids
                 )
+        finally:
+            for future in futures:
+                future.cancel()
+            threads.shutdown()
+
+    def _get_search_results_page_html(self, page: int) -> str:
+        """Get the HTML text of a page of search results listings, once we
+        have a request slot for it.
+        """
+        search_url = self._get_search_url(page=page)
+        self.rate_limiter.wait(search_url)
+        return self.session.get(search_url).text
 
-        # TODO: would be cool if we could avoid key_id scrape duplication in get
-        return list(job_soups_dict.values())
+    def _get_new_job_soups(
+        self, results_soup: BeautifulSoup, seen_key_ids: Set[str]
+    ) -> List[BeautifulSoup]:
+        """Get the job soups from a search results page that we haven't seen yet
+
+        NOTE: adds the key_ids of the new job soups to seen_key_ids in-place
+        """
+        new_job_soups = []  # type: List[BeautifulSoup]
+        for job_soup in self._get_job_soups_from_search_page(results_soup):
+            key_id = self.get(JobField.KEY_ID, job_soup)
+            if key_id not in seen_key_ids:
+                seen_key_ids.add(key_id)
+                new_job_soups.append(job_soup)
+        return new_job_soups
 
     def _get_job_soups_from_search_page(
         self,
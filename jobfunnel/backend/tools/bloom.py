@@ -0,0 +1,176 @@
+"""A Bloom filter of key_ids, so we can tell that a key_id is not in a list of
+jobs (i.e. the block list) without keeping the key_ids of the list in memory.
+"""
+
+from hashlib import blake2b
+from itertools import islice
+import math
+import mmap
+import os
+import struct
+from threading import Lock
+from typing import Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+from jobfunnel.resources import KEY_ID_FILTER_FALSE_POSITIVE_RATE
+
+BLOOM_FILTER_MAGIC = b"JFBLOOM1"
+HEADER = struct.Struct("<8sQQ")  # magic, number of bits, number of hashes
+MAX_UINT64 = (1 << 64) - 1
+_UNPACK_DIGEST = struct.Struct("<QQ").unpack  # i.e. into h1, h2
+BLOOM_CHUNK_SIZE = 100000  # Max. # of key_ids we hash at once when adding
+
+
+class BloomFilter:
+    """Bit array where every key_id we add sets n_hashes bits, at the indices
+    (h1 + i * h2) % n_bits of the two 64 bit halves of its blake2b digest.
+
+    If any bit of a key_id is unset, the key_id was never added. If all of
+    them are set it probably was, with a false positive rate of about
+    false_positive_rate as long as we added no more than capacity key_ids, so
+    positives have to be confirmed against the list itself.
+
+    The filter can be stored in a memory-mapped file, so other scrapers or
+    processes can open() it instead of building their own, and they see the
+    key_ids we add to it.
+
+    NOTE: this is safe to share between threads.
+    """
+
+    def __init__(
+        self, n_bits: int, n_hashes: int, buffer: Union[bytearray, mmap.mmap]
+    ) -> None:
+        """Init, use build() or open() instead
+
+        Args:
+            n_bits (int): size of the filter in bits, a multiple of 8.
+            n_hashes (int): number of bits we set per key_id.
+            buffer (Union[bytearray, mmap.mmap]): HEADER and then the bits.
+        """
+        self.n_bits = n_bits
+        self.n_hashes = n_hashes
+        self._buffer = buffer
+        self._bits = np.frombuffer(buffer, dtype=np.uint8, offset=HEADER.size)
+        self._lock = Lock()
+
+    @classmethod
+    def build(
+        cls,
+        key_ids: Iterable[str],
+        capacity: int,
+        file_path: Optional[str] = None,
+        false_positive_rate: float = KEY_ID_FILTER_FALSE_POSITIVE_RATE,
+    ) -> "BloomFilter":
+        """Build the filter of key_ids
+
+        Args:
+            key_ids (Iterable[str]): key_ids to add, i.e. streamed from a list.
+            capacity (int): number of key_ids we size the filter for,
+                including any we add() later.
+            file_path (Optional[str], optional): file to store the filter in,
+                we replace any existing file. Defaults to None (in memory).
+            false_positive_rate (float, optional): probability that a key_id
+                we never added is in the filter, when it is at capacity.
+                Defaults to KEY_ID_FILTER_FALSE_POSITIVE_RATE.
+        """
+        capacity = max(capacity, 1)
+        n_bits = (
+            math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2 / 8)
+            * 8
+        )
+        n_hashes = max(1, round(n_bits / capacity * math.log(2)))
+        buffer = bytearray(HEADER.size + n_bits // 8)
+        HEADER.pack_into(buffer, 0, BLOOM_FILTER_MAGIC, n_bits, n_hashes)
+        bloom_filter = cls(n_bits, n_hashes, buffer)
+        bloom_filter.update(key_ids)
+
+        if file_path:
+            # NOTE: we write the filter and then map it, so it is never partial
+            temp_file_path = f"{file_path}.{os.getpid()}.tmp"
+            with open(temp_file_path, "wb") as outfile:
+                outfile.write(buffer)
+            os.replace(temp_file_path, file_path)
+            with open(file_path, "r+b") as infile:
+                bloom_filter = cls(n_bits, n_hashes, mmap.mmap(infile.fileno(), 0))
+        return bloom_filter
+
+    @classmethod
+    def open(cls, file_path: str) -> "BloomFilter":
+        """Map the filter stored in file_path read-only, i.e. in a process
+        other than the one that built it.
+        """
+        with open(file_path, "rb") as infile:
+            buffer = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n_bits, n_hashes = HEADER.unpack_from(buffer, 0)
+        if magic != BLOOM_FILTER_MAGIC or len(buffer) != HEADER.size + n_bits // 8:
+            raise ValueError(f"{file_path} is not a Bloom filter of key_ids")
+        return cls(n_bits, n_hashes, buffer)
+
+    def __contains__(self, key_id: object) -> bool:
+        if not isinstance(key_id, str):
+            return False
+        # NOTE: most key_ids are not in the filter, so we check one bit at a
+        # time and return as soon as one is unset.
+        h1, h2 = _UNPACK_DIGEST(_get_digest(key_id))
+        buffer, n_bits = self._buffer, self.n_bits
+        for _ in range(self.n_hashes):
+            index = h1 % n_bits
+            if not buffer[HEADER.size + (index >> 3)] & (1 << (index & 7)):
+                return False
+            h1 = (h1 + h2) & MAX_UINT64
+        return True
+
+    def add(self, key_id: str) -> None:
+        """Add a key_id to the filter"""
+        self.update([key_id])
+
+    def update(self, key_ids: Iterable[str]) -> None:
+        """Add key_ids to the filter, setting the bits of a chunk of key_ids
+        at a time with numpy.
+        """
+        key_ids = iter(key_ids)
+        while True:
+            halves = self.get_hashes(list(islice(key_ids, BLOOM_CHUNK_SIZE)))
+            if not len(halves):
+                return
+            indices = self._get_indices(halves).ravel()
+            with self._lock:
+                np.bitwise_or.at(
+                    self._bits,
+                    indices >> np.uint64(3),
+                    np.left_shift(1, indices & np.uint64(7)).astype(np.uint8),
+                )
+
+    def contains_hashes(self, halves: np.ndarray) -> np.ndarray:
+        """Check many key_ids at once, by the hashes get_hashes() gave us
+
+        NOTE: the hashes of a key_id don't depend on the filter, so a JobTable
+            gets them once and checks them against every list.
+
+        Returns:
+            mask which is True for the key_ids which are probably in the filter
+        """
+        indices = self._get_indices(halves)
+        bits = self._bits[indices >> np.uint64(3)] >> (indices & np.uint64(7))
+        return (bits & 1).all(axis=1)
+
+    @staticmethod
+    def get_hashes(key_ids: Sequence[str]) -> np.ndarray:
+        """Get the two 64 bit halves of the digest of every key_id, as an
+        array of shape (len(key_ids), 2).
+        """
+        digests = b"".join(map(_get_digest, key_ids))
+        return np.frombuffer(digests, dtype="<u8").reshape(-1, 2)
+
+    def _get_indices(self, halves: np.ndarray) -> np.ndarray:
+        """Get the n_hashes bit indices of every key_id by its hashes"""
+        # NOTE: uint64 arithmetic wraps around, __contains__ mirrors that
+        return (
+            halves[:, :1] + np.arange(self.n_hashes, dtype=np.uint64) * halves[:, 1:]
+        ) % np.uint64(self.n_bits)
+
+
+def _get_digest(key_id: str) -> bytes:
+    """Get the 16 byte digest we derive the bit indices of a key_id from"""
+    return blake2b(key_id.encode("utf8", errors="replace"), digest_size=16).digest()
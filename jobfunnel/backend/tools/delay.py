@@ -1,16 +1,24 @@
 """Module for calculating random or non-random delay
 """
 
+import asyncio
 from math import ceil, log, sqrt
 from random import uniform
-from typing import List, Union
+from threading import Lock
+from time import monotonic, sleep
+from typing import Dict, List, Union
+from urllib.parse import urlsplit
 
 from numpy import arange
 from scipy.special import expit  # pylint: disable=no-name-in-module
 
-from jobfunnel.config.delay import DelayConfig
 from jobfunnel.resources import DelayAlgorithm
 
+# pylint: disable=using-constant-test,unused-import
+if False:  # or typing.TYPE_CHECKING  if python3.5.3+
+    from jobfunnel.config.delay import DelayConfig
+# pylint: enable=using-constant-test,unused-import
+
 
 def _c_delay(list_len: int, delay: Union[int, float]):
     """Sets single delay value to whole list."""
@@ -57,11 +65,11 @@ def _sig_delay(list_len: int, delay: Union[int, float]):
     return delays.tolist()  # convert np array back to list
 
 
-def calculate_delays(list_len: int, delay_config: DelayConfig) -> List[float]:
+def calculate_delays(list_len: int, delay_config: "DelayConfig") -> List[float]:
     """Checks delay config and returns calculated delay list.
 
     NOTE: we do this to be respectful to online job sources
-    TODO: we should be able to calculate delays on-demand.
+    NOTE: use a RateLimiter to apply these delays on-demand.
 
     Args:
         list_len: length of scrape job list
@@ -111,3 +119,75 @@ def calculate_delays(list_len: int, delay_config: DelayConfig) -> List[float]:
     durations[0] = 0.0
 
     return durations
+
+
+class RateLimiter:
+    """Per-host leaky bucket which spaces out requests by our delay schedule
+
+    The n-th request to a host is given a slot no sooner than calculate_delays
+    seconds after the slot of the (n-1)-th request, so we are exactly as polite
+    as sleeping through the delays one after another. Slots are reserved under
+    a lock but waited for outside of it, so callers can keep parsing and
+    filtering while they wait, and a request that shows up late is not delayed.
+
+    NOTE: this is thread-safe, and wait_async() can be used from an event loop.
+    """
+
+    # Number of delays we calculate ahead of time, we grow this on-demand
+    SCHEDULE_CHUNK_SIZE = 64
+
+    def __init__(self, delay_config: "DelayConfig") -> None:
+        """Init the rate limiter
+
+        Args:
+            delay_config (DelayConfig): delaying algorithm and min/max durations
+                used to calculate the spacing between requests to each host.
+        """
+        delay_config.validate()
+        self.delay_config = delay_config
+        self._lock = Lock()
+        self._intervals: List[float] = []
+        self._n_requests: Dict[str, int] = {}
+        self._last_slot: Dict[str, float] = {}
+
+    def reserve(self, url: str) -> float:
+        """Reserve the next request slot for the host of url
+
+        Args:
+            url (str): url which is about to be requested.
+
+        Returns:
+            float: number of seconds to wait before making the request.
+        """
+        host = urlsplit(url).netloc
+        with self._lock:
+            n_request = self._n_requests.get(host, 0)
+            self._n_requests[host] = n_request + 1
+            now = monotonic()
+            slot = max(
+                now, self._last_slot.get(host, now) + self._get_interval(n_request)
+            )
+            self._last_slot[host] = slot
+        return slot - now
+
+    def wait(self, url: str) -> None:
+        """Block the calling thread until it may request url"""
+        sleep(self.reserve(url))
+
+    async def wait_async(self, url: str) -> None:
+        """Yield to the event loop until we may request url"""
+        await asyncio.sleep(self.reserve(url))
+
+    def _get_interval(self, n_request: int) -> float:
+        """Get the delay before the n-th request to a host, extending the
+        schedule of delays if we have run past the end of it.
+
+        NOTE: must be called with self._lock held.
+        """
+        n_known = len(self._intervals)
+        if n_request >= n_known:
+            list_len = max(n_request + 1, 2 * n_known, self.SCHEDULE_CHUNK_SIZE)
+            self._intervals.extend(
+                calculate_delays(list_len, self.delay_config)[n_known:]
+            )
+        return self._intervals[n_request]
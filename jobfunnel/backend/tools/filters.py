@@ -4,21 +4,26 @@ Paul McInnis 2020
 """
 
 from collections import namedtuple
-from copy import deepcopy
 from datetime import datetime
+from hashlib import sha256
 import logging
-from typing import Dict, List, Optional, Tuple
+from threading import Lock
+from typing import Dict, List, MutableMapping, Optional, Set, Tuple
 
 import nltk
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
-from jobfunnel.backend import Job
+from jobfunnel.backend import Job, JobTable
+from jobfunnel.backend.job import JOB_REMOVE_STATUSES
 from jobfunnel.backend.tools import Logger
+from jobfunnel.backend.tools.minhash import MinHashIndex, jaccard_similarity
+from jobfunnel.backend.tools.tfidf import TfidfIndex, iter_most_similar
 from jobfunnel.resources import (
     DEFAULT_MAX_TFIDF_SIMILARITY,
+    MIN_JOBS_FOR_JOB_TABLE,
     MIN_JOBS_TO_PERFORM_SIMILARITY_SEARCH,
+    DuplicateEngine,
     DuplicateType,
     Remoteness,
 )
@@ -37,13 +42,17 @@ class JobFilter(Logger):
 
     def __init__(
         self,
-        user_block_jobs_dict: Optional[Dict[str, str]] = None,
-        duplicate_jobs_dict: Optional[Dict[str, str]] = None,
+        user_block_jobs_dict: Optional[MutableMapping[str, Dict[str, str]]] = None,
+        duplicate_jobs_dict: Optional[MutableMapping[str, Dict[str, str]]] = None,
         blocked_company_names_list: Optional[List[str]] = None,
         max_job_date: Optional[datetime] = None,
         max_similarity: float = DEFAULT_MAX_TFIDF_SIMILARITY,
         desired_remoteness: Remoteness = Remoteness.ANY,
         min_tfidf_corpus_size: int = MIN_JOBS_TO_PERFORM_SIMILARITY_SEARCH,
+        tfidf_index_file: Optional[str] = None,
+        duplicate_engine: DuplicateEngine = DuplicateEngine.TFIDF,
+        minhash_index_file: Optional[str] = None,
+        min_job_table_size: int = MIN_JOBS_FOR_JOB_TABLE,
         log_level: int = logging.INFO,
         log_file: str = None,
     ) -> None:
@@ -52,16 +61,27 @@ class JobFilter(Logger):
         TODO: need a config for this
 
         Args:
-            user_block_jobs_dict (Optional[Dict[str, str]], optional): dict
-                containing user's blocked jobs. Defaults to None.
-            duplicate_jobs_dict (Optional[Dict[str, str]], optional): dict
-                containing duplicate jobs, detected by content. Defaults to None
+            user_block_jobs_dict (Optional[MutableMapping], optional): dict
+                (or JobList) containing user's blocked jobs. Defaults to None.
+            duplicate_jobs_dict (Optional[MutableMapping], optional): dict
+                (or JobList) containing duplicate jobs, detected by content.
+                Defaults to None
             blocked_company_names_list (Optional[List[str]], optional): list of
                 company names disallowed from results. Defaults to None.
             max_job_date (Optional[datetime], optional): maximium date that a
                 job can be scraped. Defaults to None.
             desired_remoteness (Remoteness, optional): The desired level of
                 work-remoteness. ANY will impart no restriction.
+            tfidf_index_file (Optional[str], optional): .npz file to persist
+                the TFIDF index of job descriptions in between runs, so that
+                we only tokenize new descriptions. Defaults to None.
+            duplicate_engine (DuplicateEngine, optional): how we find jobs
+                which are duplicates by description. Defaults to TFIDF.
+            minhash_index_file (Optional[str], optional): .npz file to persist
+                the MinHash index of job descriptions in between runs, only
+                used by DuplicateEngine.MINHASH. Defaults to None.
+            min_job_table_size (int, optional): filter() filters at least this
+                many jobs as a JobTable. Defaults to MIN_JOBS_FOR_JOB_TABLE.
             log_level (Optional[int], optional): log level. Defaults to INFO.
             log_file (Optional[str], optional): log file, Defaults to None.
         """
@@ -69,13 +89,32 @@ class JobFilter(Logger):
             level=log_level,
             file_path=log_file,
         )
-        self.user_block_jobs_dict = user_block_jobs_dict or {}
-        self.duplicate_jobs_dict = duplicate_jobs_dict or {}
+        # NOTE: an empty JobList is falsy, but we must still add jobs to it
+        self.user_block_jobs_dict = (
+            {} if user_block_jobs_dict is None else user_block_jobs_dict
+        )
+        self.duplicate_jobs_dict = (
+            {} if duplicate_jobs_dict is None else duplicate_jobs_dict
+        )
         self.blocked_company_names_list = blocked_company_names_list or []
         self.max_job_date = max_job_date
         self.max_similarity = max_similarity
         self.desired_remoteness = desired_remoteness
         self.min_tfidf_corpus_size = min_tfidf_corpus_size
+        self.tfidf_index_file = tfidf_index_file
+        self._tfidf_index = None  # type: Optional[TfidfIndex]
+        self.duplicate_engine = duplicate_engine
+        self.minhash_index_file = minhash_index_file
+        self._minhash_index = None  # type: Optional[MinHashIndex]
+        self.min_job_table_size = min_job_table_size
+
+        # The (provider, key_id) that claimed each (title, company, location)
+        # listing we scrape, and for every copy of a listing that lost its
+        # claim the key_id of the job that kept it and the copy's JSON entry
+        # NOTE: these are only kept in memory, see find_claimed_duplicates()
+        self._listings = {}  # type: Dict[Tuple[str, str, str], Tuple[str, str]]
+        self._claimed_duplicates: Dict[str, Tuple[str, Optional[Dict[str, str]]]] = {}
+        self._listings_lock = Lock()
 
         # Retrieve stopwords if not already downloaded
         try:
@@ -92,6 +131,45 @@ class JobFilter(Logger):
             stop_words=stopwords,
         )
 
+    @property
+    def tfidf_index(self) -> TfidfIndex:
+        """Index of job descriptions built with self.vectorizer's analyzer
+        NOTE: this is loaded from self.tfidf_index_file the first time we use it
+        """
+        if self._tfidf_index is None:
+            analyzer = self.vectorizer.build_analyzer()
+            if self.tfidf_index_file:
+                self._tfidf_index = TfidfIndex.load(
+                    self.tfidf_index_file, analyzer, self.vectorizer_fingerprint
+                )
+            else:
+                self._tfidf_index = TfidfIndex(analyzer, self.vectorizer_fingerprint)
+        return self._tfidf_index
+
+    @property
+    def minhash_index(self) -> MinHashIndex:
+        """Index of job descriptions shingled with self.vectorizer's analyzer
+        NOTE: this is loaded from self.minhash_index_file the first time we use it
+        """
+        if self._minhash_index is None:
+            analyzer = self.vectorizer.build_analyzer()
+            if self.minhash_index_file:
+                self._minhash_index = MinHashIndex.load(
+                    self.minhash_index_file, analyzer, self.vectorizer_fingerprint
+                )
+            else:
+                self._minhash_index = MinHashIndex(
+                    analyzer, self.vectorizer_fingerprint
+                )
+        return self._minhash_index
+
+    @property
+    def vectorizer_fingerprint(self) -> str:
+        """Identifies the settings of self.vectorizer, for our persisted indexes"""
+        return sha256(
+            repr(sorted(self.vectorizer.get_params().items())).encode()
+        ).hexdigest()
+
     def filter(
         self, jobs_dict: Dict[str, Job], remove_existing_duplicate_keys: bool = True
     ) -> Dict[str, Job]:
@@ -104,10 +182,20 @@ class JobFilter(Logger):
 
         NOTE: if you remove duplicates before processesing them into updates
               you will retain potentially stale job information.
+        NOTE: we filter min_job_table_size or more jobs as a JobTable, which
+              checks the key_ids of all of them against the block list and
+              duplicates list Bloom filter at once.
 
         Returns:
             jobs_dict with all filtered items removed.
         """
+        if len(jobs_dict) >= self.min_job_table_size:
+            table = JobTable.from_dict(jobs_dict)
+            return table.to_dict(
+                ~self.get_filterable_mask(
+                    table, check_existing_duplicates=remove_existing_duplicate_keys
+                )
+            )
         return {
             key_id: job
             for key_id, job in jobs_dict.items()
@@ -116,11 +204,43 @@ class JobFilter(Logger):
             )
         }
 
+    def get_filterable_mask(
+        self, table: JobTable, check_existing_duplicates: bool = True
+    ) -> np.ndarray:
+        """Filter the jobs of a table out using all our available filters, as
+        vectorized masks over the table's columns.
+
+        NOTE: this is the same as filterable() on every job of the table.
+
+        Arguments:
+            check_existing_duplicates: pass True to check if ID was previously
+                detected to be a duplicate via TFIDF cosine similarity
+
+        Returns:
+            mask which is True for the rows of table filterable() would remove
+        """
+        mask = table.has_status(JOB_REMOVE_STATUSES)
+        mask |= table.has_company(self.blocked_company_names_list)
+        if self.max_job_date:
+            mask |= table.is_older_than(self.max_job_date)
+        if self.desired_remoteness != Remoteness.ANY:
+            mask |= (table.remoteness_codes != Remoteness.UNKNOWN.value) & (
+                table.remoteness_codes != self.desired_remoteness.value
+            )
+        # NOTE: we only look up the key_ids of jobs we haven't removed yet
+        mask |= table.has_key_id(self.user_block_jobs_dict, where=~mask)
+        if check_existing_duplicates:
+            mask |= table.has_key_id(self.duplicate_jobs_dict, where=~mask)
+        return mask
+
     def filterable(self, job: Job, check_existing_duplicates: bool = True) -> bool:
         """Filter jobs out using all our available filters
 
         NOTE: this allows job to be partially initialized
         NOTE: if a job has UNKNOWN remoteness, we will include it anyways
+        NOTE: BaseScraper calls this before every get/set, the JobLists check
+            their Bloom filter first, so a key_id in neither list costs no
+            lookups of the lists.
         TODO: we should probably add some logging to this?
 
         Arguments:
@@ -156,6 +276,111 @@ class JobFilter(Logger):
             and job.key_id in self.duplicate_jobs_dict
         )
 
+    def claim_listing(self, job: Job, key_id: str) -> Optional[str]:
+        """Claim a job's listing for its provider before we scrape the rest of it
+
+        The same job is often listed by several providers at once, if another
+        provider claimed a listing with the same title, company and location
+        we don't need to scrape this copy of it. Of the providers which list
+        it, the one whose name sorts first keeps the listing, so which copy we
+        keep does not depend on which provider scraped it first.
+
+        NOTE: this is safe to call from every scraper's threads.
+        NOTE: we never match listings of the same provider since it would have
+            given them the same key_id if they were the same job.
+        NOTE: we can't compare a job's description without scraping it, so we
+            only list the copies that lost their claim as duplicates once the
+            job that kept the listing is kept, see find_claimed_duplicates().
+
+        Args:
+            job (Job): partially scraped job, with a title, company and location.
+            key_id (str): key_id the job will have once it is scraped, i.e.
+                prefixed with its provider.
+
+        Returns:
+            Optional[str]: key_id of the other provider's job if this job is a
+                duplicate of it, None if we should scrape this job.
+        """
+        listing = self._get_listing(job)
+        if not listing:
+            return None
+        with self._listings_lock:
+            provider, other_key_id = self._listings.setdefault(
+                listing, (job.provider, key_id)
+            )
+            if provider == job.provider:
+                return None
+            if provider < job.provider:
+                self._claimed_duplicates[key_id] = (other_key_id, job.as_json_entry)
+                return other_key_id
+
+            # NOTE: the other job is being scraped already, find_duplicates()
+            # will find it as a duplicate of this one if we keep both.
+            self._listings[listing] = (job.provider, key_id)
+            self._claimed_duplicates[other_key_id] = (key_id, None)
+            return None
+
+    def release_listing(self, job: Job, key_id: str) -> None:
+        """Release a job's claim of its listing, i.e. if we failed to scrape it,
+        so that other providers can scrape their copy of it.
+        """
+        listing = self._get_listing(job)
+        with self._listings_lock:
+            if listing and self._listings.get(listing) == (job.provider, key_id):
+                del self._listings[listing]
+
+    def find_claimed_duplicates(
+        self,
+        existing_jobs_dict: Dict[str, Job],
+        incoming_jobs_dict: Dict[str, Job],
+    ) -> List[DuplicatedJob]:
+        """List the copies of listings claimed by another provider's job as
+        duplicates, now that we know which of those jobs we kept.
+
+        NOTE: if we didn't keep the job which claimed a listing (i.e. it was
+            filtered away or failed to scrape) we drop the copies of it, they
+            will be scraped again next time.
+        NOTE: copies that were scraped before they lost their claim are in
+            incoming_jobs_dict, we return those as DuplicateType.LISTING.
+
+        Args:
+            existing_jobs_dict (Dict[str, Job]): dict of jobs keyed by key_id.
+            incoming_jobs_dict (Dict[str, Job]): dict of new jobs by key_id.
+
+        Returns:
+            List[DuplicatedJob]: the copies which are in incoming_jobs_dict.
+        """
+        with self._listings_lock:
+            claimed_duplicates = self._claimed_duplicates
+            self._claimed_duplicates = {}
+
+        duplicate_jobs_list = []  # type: List[DuplicatedJob]
+        for key_id, (original_key_id, entry) in claimed_duplicates.items():
+            original = incoming_jobs_dict.get(original_key_id)
+            if original is None:
+                original = existing_jobs_dict.get(original_key_id)
+            if original is None or key_id in existing_jobs_dict:
+                # NOTE: if we have this copy already we keep updating it
+                continue
+            if key_id in incoming_jobs_dict:
+                duplicate_jobs_list.append(
+                    DuplicatedJob(
+                        original=original,
+                        duplicate=incoming_jobs_dict[key_id],
+                        type=DuplicateType.LISTING,
+                    )
+                )
+            elif entry:
+                self.duplicate_jobs_dict[key_id] = entry
+            else:
+                continue  # i.e. it lost its claim and then failed to scrape
+            self.logger.debug(
+                "Identified %s as a duplicate of %s by its listing.",
+                key_id,
+                original_key_id,
+            )
+        return duplicate_jobs_list
+
     def find_duplicates(
         self,
         existing_jobs_dict: Dict[str, Job],
@@ -164,6 +389,9 @@ class JobFilter(Logger):
         """Remove all known duplicates from jobs_dict and update original data
 
         TODO: find duplicates by content within existing jobs
+        NOTE: the jobs are only read, never copied, so this costs no memory
+            per job beyond the description lists of the content filters, and
+            DuplicatedJob.original / .duplicate are the jobs we were passed.
 
         Args:
             existing_jobs_dict (Dict[str, Job]): dict of jobs keyed by key_id.
@@ -173,14 +401,21 @@ class JobFilter(Logger):
             Dict[str, Job]: jobs dict with all jobs keyed by known-duplicate
                 key_ids removed, and their originals updated.
         """
-        duplicate_jobs_list = []  # type: List[DuplicatedJob]
-        filt_existing_jobs_dict = deepcopy(existing_jobs_dict)
+        # Look for copies of listings another provider claimed first
+        # NOTE: these come first since their original may be a duplicate too
+        duplicate_jobs_list = self.find_claimed_duplicates(
+            existing_jobs_dict, incoming_jobs_dict
+        )
+        claimed_key_ids = {j.duplicate.key_id for j in duplicate_jobs_list}
         filt_incoming_jobs_dict = {}  # type: Dict[str, Job]
 
         # Look for matches by key id only
         for key_id, incoming_job in incoming_jobs_dict.items():
+            if key_id in claimed_key_ids:
+                continue
+
             # The key-ids are a direct match between existing and new
-            if key_id in existing_jobs_dict:
+            elif key_id in existing_jobs_dict:
                 self.logger.debug(
                     f"Identified duplicate {key_id} between incoming data "
                     "and existing data."
@@ -209,12 +444,19 @@ class JobFilter(Logger):
                 )
             else:
                 # This key_id is not duplicate, we can use it for TFIDF
-                filt_incoming_jobs_dict[key_id] = deepcopy(incoming_job)
+                filt_incoming_jobs_dict[key_id] = incoming_job
 
         # Run the tfidf vectorizer if we have enough jobs left after removing
-        # key duplicates
-        if (
-            len(filt_incoming_jobs_dict.keys()) + len(filt_existing_jobs_dict.keys())
+        # key duplicates, NOTE: MinHash has no minimum corpus size.
+        if self.duplicate_engine == DuplicateEngine.MINHASH and filt_incoming_jobs_dict:
+            duplicate_jobs_list.extend(
+                self.minhash_filter(
+                    incoming_jobs_dict=filt_incoming_jobs_dict,
+                    existing_jobs_dict=existing_jobs_dict,
+                )
+            )
+        elif (
+            len(filt_incoming_jobs_dict) + len(existing_jobs_dict)
             < self.min_tfidf_corpus_size
         ):
             self.logger.warning(
@@ -225,7 +467,7 @@ class JobFilter(Logger):
             duplicate_jobs_list.extend(
                 self.tfidf_filter(
                     incoming_jobs_dict=filt_incoming_jobs_dict,
-                    existing_jobs_dict=filt_existing_jobs_dict,
+                    existing_jobs_dict=existing_jobs_dict,
                 )
             )
         else:
@@ -247,8 +489,8 @@ class JobFilter(Logger):
         incoming_jobs_dict: Dict[str, dict],
         existing_jobs_dict: Dict[str, dict],
     ) -> List[DuplicatedJob]:
-        """Fit a tfidf vectorizer to a corpus of Job.DESCRIPTIONs and identify
-        duplicate jobs by cosine-similarity.
+        """Update our tfidf index with a corpus of Job.DESCRIPTIONs and
+        identify duplicate jobs by cosine-similarity.
 
         NOTE/WARNING: if you are running this method, you should have already
             removed any duplicates by key_id
@@ -256,7 +498,8 @@ class JobFilter(Logger):
         NOTE: it is recommended that you have at least around 25 ish Jobs.
         TODO: need to handle existing_jobs_dict = None
         TODO: have this raise an exception if there are too few words.
-        TODO: we should consider caching the transformed corpus.
+        NOTE: only new or changed descriptions are tokenized, and the index is
+            saved to self.tfidf_index_file for the next run.
 
         Args:
             incoming_jobs_dict (Dict[str, dict]): dict of jobs containing
@@ -271,116 +514,273 @@ class JobFilter(Logger):
             List[DuplicatedJob]: list of new duplicate Jobs and their existing
                 Jobs found via content matching (for use in JobFunnel).
         """
-
-        def __dict_to_ids_and_words(
-            jobs_dict: Dict[str, Job],
-            is_incoming: bool = False,
-        ) -> Tuple[List[str], List[str]]:
-            """Get query words and ids as lists + prefilter
-            NOTE: this is just a convenience method since we do this 2x
-            TODO: consider moving this once/if we change iteration
-            """
-            ids = []  # type: List[str]
-            words = []  # type: List[str]
-            filt_job_dict = {}  # type: Dict[str, Job]
-            for job in jobs_dict.values():
-                if is_incoming and job.key_id in self.duplicate_jobs_dict:
-                    # NOTE: we should never see this for incoming jobs.
-                    # we will see it for existing jobs since duplicates can
-                    # share a key_id.
-                    raise ValueError(
-                        "Attempting to run TFIDF with existing duplicate "
-                        f"{job.key_id}"
-                    )
-                elif not len(job.description):
-                    self.logger.debug(
-                        f"Removing {job.key_id} from scrape result, empty "
-                        "description."
-                    )
-                else:
-                    ids.append(job.key_id)
-                    words.append(job.description)
-                    # NOTE: We want to leave changing incoming_jobs_dict in
-                    # place till the end or we will break usage of
-                    # Job.update_if_newer()
-                    filt_job_dict[job.key_id] = job
-
-            # TODO: assert on length of contents of the lists as well
-            if not words:
-                raise ValueError("No data to fit, are your job descriptions all empty?")
-            return ids, words, filt_job_dict
-
-        query_ids, query_words, filt_incoming_jobs_dict = __dict_to_ids_and_words(
-            incoming_jobs_dict, is_incoming=True
+        query_ids, query_words, filt_incoming_jobs_dict = (
+            self._get_ids_and_descriptions(incoming_jobs_dict, is_incoming=True)
         )
 
         # Calculate corpus and format query data for TFIDF calculation
-        corpus = []  # type: List[str]
+        reference_ids, reference_words = [], []  # type: List[str], List[str]
+        filt_existing_jobs_dict = {}  # type: Dict[str, Job]
         if existing_jobs_dict:
             self.logger.debug("Running TFIDF on incoming vs existing data.")
             (
                 reference_ids,
                 reference_words,
                 filt_existing_jobs_dict,
-            ) = __dict_to_ids_and_words(existing_jobs_dict, is_incoming=False)
-            corpus = query_words + reference_words
+            ) = self._get_ids_and_descriptions(existing_jobs_dict, is_incoming=False)
         else:
             self.logger.debug("Running TFIDF on incoming data only.")
-            reference_ids = (query_ids,)
-            reference_words = query_words
-            filt_existing_jobs_dict = filt_incoming_jobs_dict
-            corpus = query_words
+        corpus_docs = dict(zip(query_ids, query_words))
+        corpus_docs.update(zip(reference_ids, reference_words))
 
         # Provide a warning if we have few words.
-        # TODO: warning should reflect actual corpus size
-        if len(corpus) < self.min_tfidf_corpus_size:
+        if len(corpus_docs) < self.min_tfidf_corpus_size:
             self.logger.warning(
                 "It is not recommended to use this filter with less than "
                 f"{self.min_tfidf_corpus_size} jobs"
             )
 
-        # Fit vectorizer to entire corpus
-        self.vectorizer.fit(corpus)
-
-        # Calculate cosine similarity between reference and current blurbs
-        # This is a list of the similarity between that query job and all the
-        # TODO: impl. in a more efficient way since fit() does the transform too
-        similarities_per_query = cosine_similarity(
-            self.vectorizer.transform(query_words),
-            self.vectorizer.transform(reference_words) if existing_jobs_dict else None,
+        # Index the entire corpus, this only tokenizes the jobs it hasn't seen
+        n_tokenized = self.tfidf_index.update(corpus_docs)
+        self.logger.debug(
+            "Tokenized %d of %d job descriptions for TFIDF.",
+            n_tokenized,
+            len(corpus_docs),
         )
+        if self.tfidf_index_file:
+            self.tfidf_index.save(self.tfidf_index_file)
 
-        # Find Duplicate jobs by similarity score
+        # Find the most similar reference blurb for each query blurb by cosine
+        # similarity, without building the dense query x reference matrix.
         # NOTE: multiple jobs can be determined to be a duplicate of same job!
         # TODO: traverse this so we look at max similarity for original vs query
         # currently it's the other way around so we can look at multi-matching
         # original jobs but not multiple matching queries for our original job.
+        # TODO: capture if more jobs are similar by content match
+        query_vectors = self.tfidf_index.transform(query_ids)
+        original_ids = {}  # type: Dict[str, str]
+        if reference_ids:
+            for query_index, reference_index, similarity in iter_most_similar(
+                query_vectors,
+                self.tfidf_index.transform(reference_ids),
+                self.max_similarity,
+            ):
+                original_ids[query_ids[query_index]] = reference_ids[reference_index]
+
+        # Then find duplicates within the incoming jobs that are left, the first
+        # of them we see is the original (i.e. the same job on 2 providers).
+        batch_rows = [i for i, q in enumerate(query_ids) if q not in original_ids]
+        batch_ids = [query_ids[i] for i in batch_rows]
+        batch_vectors = query_vectors[batch_rows]
+        for query_index, reference_index, similarity in iter_most_similar(
+            batch_vectors, batch_vectors, self.max_similarity, only_earlier=True
+        ):
+            original_id = batch_ids[reference_index]
+            original_ids[batch_ids[query_index]] = original_ids.get(
+                original_id, original_id
+            )
+
+        # returns a list of newly-detected duplicate Jobs
+        return self._get_duplicated_jobs(
+            query_ids,
+            original_ids,
+            filt_incoming_jobs_dict,
+            filt_existing_jobs_dict,
+            DuplicateType.NEW_TFIDF,
+        )
+
+    def minhash_filter(
+        self,
+        incoming_jobs_dict: Dict[str, Job],
+        existing_jobs_dict: Dict[str, Job],
+    ) -> List[DuplicatedJob]:
+        """Update our MinHash index with a corpus of Job.DESCRIPTIONs and
+        identify duplicate jobs by Jaccard similarity of their word shingles.
+
+        Only the existing jobs which share an LSH band with an incoming job are
+        candidates, and we verify candidates by their exact Jaccard similarity,
+        so this scales much better than TFIDF when looking for re-posts.
+
+        NOTE/WARNING: if you are running this method, you should have already
+            removed any duplicates by key_id
+        NOTE: self.max_similarity is the minimum Jaccard similarity here.
+        NOTE: incoming jobs which are not duplicates of existing jobs are also
+            matched with each other, the first one we see is the original.
+        NOTE: only new or changed descriptions are shingled, and the index is
+            saved to self.minhash_index_file for the next run.
+
+        Args:
+            incoming_jobs_dict (Dict[str, Job]): dict of jobs containing
+                potential duplicates (i.e jobs we just scraped)
+            existing_jobs_dict (Dict[str, Job]): the existing jobs dict
+                (i.e. Master CSV)
+
+        Raises:
+            ValueError: incoming_jobs_dict contains no job descriptions
+
+        Returns:
+            List[DuplicatedJob]: list of new duplicate Jobs and their original
+                Jobs found via content matching (for use in JobFunnel).
+        """
+        query_ids, query_words, filt_incoming_jobs_dict = (
+            self._get_ids_and_descriptions(incoming_jobs_dict, is_incoming=True)
+        )
+        reference_ids, reference_words = [], []  # type: List[str], List[str]
+        filt_existing_jobs_dict = {}  # type: Dict[str, Job]
+        if existing_jobs_dict:
+            (
+                reference_ids,
+                reference_words,
+                filt_existing_jobs_dict,
+            ) = self._get_ids_and_descriptions(existing_jobs_dict, is_incoming=False)
+
+        # Index the entire corpus, this only shingles the jobs it hasn't seen
+        corpus_docs = dict(zip(reference_ids, reference_words))
+        corpus_docs.update(zip(query_ids, query_words))
+        n_shingled = self.minhash_index.update(corpus_docs)
+        self.logger.debug(
+            "Shingled %d of %d job descriptions for MinHash.",
+            n_shingled,
+            len(corpus_docs),
+        )
+        if self.minhash_index_file:
+            self.minhash_index.save(self.minhash_index_file)
+
+        # Verify the candidates of every query by their exact similarity
+        shingles: Dict[str, Set[Tuple[str, ...]]] = {}
+
+        def __get_most_similar(query_id: str, candidate_ids: List[str]) -> str:
+            top_similarity, top_candidate_id = 0.0, None
+            for candidate_id in candidate_ids:
+                for key_id in (query_id, candidate_id):
+                    if key_id not in shingles:
+                        shingles[key_id] = self.minhash_index.shingle(
+                            corpus_docs[key_id]
+                        )
+                similarity = jaccard_similarity(
+                    shingles[query_id], shingles[candidate_id]
+                )
+                if similarity >= self.max_similarity and similarity > top_similarity:
+                    top_similarity, top_candidate_id = similarity, candidate_id
+            return top_candidate_id
+
+        # Match incoming jobs to existing jobs first, then to earlier incoming
+        # jobs that are left, since candidates can be from either.
+        candidates = self.minhash_index.get_candidates(query_ids)
+        original_ids = {}  # type: Dict[str, str]
+        for query_id in query_ids:
+            original_id = __get_most_similar(
+                query_id,
+                sorted(c for c in candidates[query_id] if c in filt_existing_jobs_dict),
+            )
+            if original_id:
+                original_ids[query_id] = original_id
+        batch_order = {
+            key_id: i
+            for i, key_id in enumerate(q for q in query_ids if q not in original_ids)
+        }
+        for query_id, order in batch_order.items():
+            original_id = __get_most_similar(
+                query_id,
+                sorted(
+                    c for c in candidates[query_id] if batch_order.get(c, order) < order
+                ),
+            )
+            if original_id:
+                original_ids[query_id] = original_ids.get(original_id, original_id)
+
+        return self._get_duplicated_jobs(
+            query_ids,
+            original_ids,
+            filt_incoming_jobs_dict,
+            filt_existing_jobs_dict,
+            DuplicateType.NEW_MINHASH,
+        )
+
+    @staticmethod
+    def _get_listing(job: Job) -> Optional[Tuple[str, str, str]]:
+        """Get the (title, company, location) of a job, normalized for matching
+        the same listing between providers, or None if any of them is empty.
+        """
+        listing = tuple(
+            " ".join(str(field or "").lower().split())
+            for field in (job.title, job.company, job.location)
+        )
+        return listing if all(listing) else None
+
+    def _get_duplicated_jobs(
+        self,
+        query_ids: List[str],
+        original_ids: Dict[str, str],
+        incoming_jobs_dict: Dict[str, Job],
+        existing_jobs_dict: Dict[str, Job],
+        duplicate_type: DuplicateType,
+    ) -> List[DuplicatedJob]:
+        """Get the DuplicatedJobs of the incoming jobs which have an original
+        NOTE: an original can be an existing job or another incoming job.
+        """
         new_duplicate_jobs_list = []  # type: List[DuplicatedJob]
-        for query_similarities, query_id in zip(similarities_per_query, query_ids):
-            # Identify the jobs in existing_jobs_dict that our query is a
-            # duplicate of
-            # TODO: handle if everything is highly similar!
-            similar_indeces = np.where(query_similarities >= self.max_similarity)[0]
-            if similar_indeces.size > 0:
-                # TODO: capture if more jobs are similar by content match
-                top_similar_job = np.argmax(query_similarities[similar_indeces])
+        for query_id in query_ids:
+            original_id = original_ids.get(query_id)
+            if not original_id:
+                continue
+            if original_id in existing_jobs_dict:
+                original = existing_jobs_dict[original_id]
                 self.logger.debug(
                     f"Identified incoming job {query_id} as new duplicate by "
-                    "contents of existing job "
-                    f"{reference_ids[top_similar_job]}"
+                    f"contents of existing job {original_id}"
                 )
-                new_duplicate_jobs_list.append(
-                    DuplicatedJob(
-                        original=filt_existing_jobs_dict[
-                            reference_ids[top_similar_job]
-                        ],
-                        duplicate=filt_incoming_jobs_dict[query_id],
-                        type=DuplicateType.NEW_TFIDF,
-                    )
+            else:
+                original = incoming_jobs_dict[original_id]
+                self.logger.debug(
+                    f"Identified incoming job {query_id} as new duplicate by "
+                    f"contents of incoming job {original_id}"
+                )
+            new_duplicate_jobs_list.append(
+                DuplicatedJob(
+                    original=original,
+                    duplicate=incoming_jobs_dict[query_id],
+                    type=duplicate_type,
                 )
+            )
 
         if not new_duplicate_jobs_list:
             self.logger.debug("Found no duplicates by content-matching.")
-
-        # returns a list of newly-detected duplicate Jobs
         return new_duplicate_jobs_list
+
+    def _get_ids_and_descriptions(
+        self,
+        jobs_dict: Dict[str, Job],
+        is_incoming: bool = False,
+    ) -> Tuple[List[str], List[str], Dict[str, Job]]:
+        """Get query words and ids as lists + prefilter
+        NOTE: this is just a convenience method since we do this 2x per filter
+        """
+        ids = []  # type: List[str]
+        words = []  # type: List[str]
+        filt_job_dict = {}  # type: Dict[str, Job]
+        for job in jobs_dict.values():
+            if is_incoming and job.key_id in self.duplicate_jobs_dict:
+                # NOTE: we should never see this for incoming jobs.
+                # we will see it for existing jobs since duplicates can
+                # share a key_id.
+                raise ValueError(
+                    "Attempting to find duplicates of existing duplicate "
+                    f"{job.key_id}"
+                )
+            elif not len(job.description):
+                self.logger.debug(
+                    f"Removing {job.key_id} from scrape result, empty " "description."
+                )
+            else:
+                ids.append(job.key_id)
+                words.append(job.description)
+                # NOTE: We want to leave changing incoming_jobs_dict in
+                # place till the end or we will break usage of
+                # Job.update_if_newer()
+                filt_job_dict[job.key_id] = job
+
+        # TODO: assert on length of contents of the lists as well
+        if not words:
+            raise ValueError("No data to fit, are your job descriptions all empty?")
+        return ids, words, filt_job_dict
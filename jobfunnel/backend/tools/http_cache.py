@@ -0,0 +1,274 @@
+"""On-disk cache of HTTP responses, so that re-running the same search does not
+re-download every search results page and job page.
+"""
+
+from contextlib import contextmanager
+from hashlib import sha256
+import json
+import sqlite3
+from threading import Lock, local
+from time import time
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Union
+
+from requests import PreparedRequest, Response, Session
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from jobfunnel.resources import PageKind, Provider
+
+# pylint: disable=using-constant-test,unused-import
+if False:  # or typing.TYPE_CHECKING  if python3.5.3+
+    from jobfunnel.config.http_cache import HTTPCacheConfig
+# pylint: enable=using-constant-test,unused-import
+
+# We store the decoded body, so these no longer describe it.
+UNCACHED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+CACHED_METHODS = ("GET",)  # NOTE: a POST may change state, never re-use one
+
+
+class CachedResponse(NamedTuple):
+    """A response as stored in the HTTPCache"""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class HTTPCache:
+    """Responses keyed by request method, URL and body, stored in SQLite.
+
+    Every entry remembers when it was stored (for TTLs) and when it was last
+    used, the least-recently-used entries are evicted once the cache grows
+    past http_cache_config.max_size_bytes.
+
+    NOTE: this is safe to share between threads.
+    """
+
+    def __init__(self, db_file: str, http_cache_config: "HTTPCacheConfig") -> None:
+        """Open (or create) the cache database
+
+        Args:
+            db_file (str): path to the SQLite database file.
+            http_cache_config (HTTPCacheConfig): TTLs and size limit.
+        """
+        self.config = http_cache_config
+        self._lock = Lock()
+        self._db = sqlite3.connect(db_file, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, status INTEGER, headers TEXT, "
+            "body BLOB, etag TEXT, last_modified TEXT, stored_at REAL, "
+            "last_used REAL, size INTEGER)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        self._db.commit()
+        self._size = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    @staticmethod
+    def get_key(method: str, url: str, body: Union[str, bytes, None] = None) -> str:
+        """Key of a request, i.e. a POST with different form data is a miss"""
+        key = sha256(f"{method.upper()} {url}\n".encode())
+        if body:
+            key.update(body.encode() if isinstance(body, str) else body)
+        return key.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get a cached response and mark it as recently used, or None"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time(), key)
+            )
+            self._db.commit()
+        url, status, headers, body, etag, last_modified, stored_at = row
+        return CachedResponse(
+            url, status, json.loads(headers), body, etag, last_modified, stored_at
+        )
+
+    def get_stored_at(self, key: str) -> Optional[float]:
+        """Get when a response was stored, or None, without marking it as used"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(
+        self, key: str, url: str, status: int, headers: Dict[str, str], body: bytes
+    ) -> None:
+        """Store a response, evicting least-recently-used responses if needed"""
+        headers = {
+            k: v for k, v in headers.items() if k.lower() not in UNCACHED_HEADERS
+        }
+        headers_lower = {k.lower(): v for k, v in headers.items()}
+        size = len(body)
+        if size > self.config.max_size_bytes:
+            return
+        now = time()
+        with self._lock:
+            old_size = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?,?,?,?,?,?,?,?,?,?)",
+                (
+                    key,
+                    url,
+                    status,
+                    json.dumps(headers),
+                    body,
+                    headers_lower.get("etag"),
+                    headers_lower.get("last-modified"),
+                    now,
+                    now,
+                    size,
+                ),
+            )
+            self._size += size - (old_size[0] if old_size else 0)
+            self._evict()
+            self._db.commit()
+
+    def refresh(self, key: str) -> None:
+        """Restart the TTL of a response, i.e. after the server responded 304"""
+        now = time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET stored_at = ?, last_used = ? WHERE key = ?",
+                (now, now, key),
+            )
+            self._db.commit()
+
+    def _evict(self) -> None:
+        """Delete least-recently-used responses until we fit in the size limit
+        NOTE: caller must hold self._lock
+        """
+        if self._size <= self.config.max_size_bytes:
+            return
+        evicted = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ).fetchall():
+            evicted.append((key,))
+            self._size -= size
+            if self._size <= self.config.max_size_bytes:
+                break
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+
+class CachedSession(Session):
+    """Session which serves GET responses from a HTTPCache.
+
+    Fresh responses are returned without making a request at all, stale ones
+    are revalidated with If-None-Match / If-Modified-Since, so an unchanged
+    page costs us a bodiless 304 response instead of a full download.
+
+    NOTE: requests are treated as PageKind.LISTING unless made within
+        cached_as(PageKind.JOB), this decides which TTL applies.
+    """
+
+    def __init__(
+        self, http_cache: HTTPCache, provider: Optional[Provider] = None
+    ) -> None:
+        """Init
+
+        Args:
+            http_cache (HTTPCache): cache to store responses in.
+            provider (Optional[Provider], optional): provider this session
+                makes requests to, for per-provider TTLs. Defaults to None.
+        """
+        super().__init__()
+        self.http_cache = http_cache
+        self.provider = provider
+        self._page_kind = local()
+
+    @property
+    def page_kind(self) -> PageKind:
+        """The kind of page requested by the current thread"""
+        return getattr(self._page_kind, "value", PageKind.LISTING)
+
+    @contextmanager
+    def cached_as(self, page_kind: PageKind) -> Iterator[None]:
+        """Treat requests made by this thread within the context as page_kind"""
+        previous_page_kind = self.page_kind
+        self._page_kind.value = page_kind
+        try:
+            yield
+        finally:
+            self._page_kind.value = previous_page_kind
+
+    def get_ttl(self, page_kind: PageKind) -> float:
+        return self.http_cache.config.get_ttl(self.provider, page_kind)
+
+    def is_fresh(self, url: str, page_kind: PageKind = PageKind.JOB) -> bool:
+        """True if a GET of url would be served from the cache without a request"""
+        stored_at = self.http_cache.get_stored_at(self.http_cache.get_key("GET", url))
+        return stored_at is not None and time() - stored_at < self.get_ttl(page_kind)
+
+    def store_response(
+        self, url: str, status: int, headers: Dict[str, str], body: bytes
+    ) -> None:
+        """Cache the response of a GET made outside of this session (i.e. aiohttp)"""
+        if status == 200:
+            self.http_cache.put(
+                self.http_cache.get_key("GET", url), url, status, headers, body
+            )
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Send a request, unless we have a fresh response for it cached"""
+        if request.method not in CACHED_METHODS:
+            return super().send(request, **kwargs)
+
+        key = self.http_cache.get_key(request.method, request.url, request.body)
+        cached = self.http_cache.get(key)
+        if cached is not None:
+            if time() - cached.stored_at < self.get_ttl(self.page_kind):
+                return self._build_response(request, cached)
+
+            # Stale, ask the server if it has changed since we cached it
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            self.http_cache.refresh(key)
+            return self._build_response(request, cached)
+        if response.status_code == 200:
+            self.http_cache.put(
+                key,
+                response.url,
+                response.status_code,
+                dict(response.headers),
+                response.content,
+            )
+        return response
+
+    @staticmethod
+    def _build_response(request: PreparedRequest, cached: CachedResponse) -> Response:
+        """Build a requests Response from a cached response"""
+        response = Response()
+        response.status_code = cached.status
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = cached.url
+        response.request = request
+        response._content = cached.body  # pylint: disable=protected-access
+        return response
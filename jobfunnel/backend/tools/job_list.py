@@ -0,0 +1,251 @@
+"""A list of jobs by key_id, i.e. the user's block list or the duplicates list,
+stored in SQLite so that adding jobs to it never re-writes the whole list.
+"""
+
+import json
+import os
+import sqlite3
+from threading import Lock
+from time import time_ns
+from typing import Dict, Iterator, List, MutableMapping, Optional, Set
+
+from jobfunnel.backend.tools.bloom import BloomFilter
+from jobfunnel.backend.tools.tools import Logger
+
+MAX_SQL_VARIABLES = 999  # Max. # of key_ids we look up in one query
+
+
+class JobList(Logger, MutableMapping):
+    """Mapping of key_id to the JSON entry of a job (Job.as_json_entry), so
+    JobFilter can use it like the dict it used to json.load.
+
+    Membership checks are an indexed lookup of key_id, which we skip if the
+    key_id is not in key_id_filter, so we don't keep the list in memory at all.
+    Setting or updating entries upserts just those rows, in a single
+    transaction per update().
+
+    The JSON file of the list is the human-readable copy, which export_json()
+    writes. If that file changed since we last imported or exported it (i.e.
+    the user edited it, or it is from before we had a JobList) we import it
+    when we open the list. The file then is the list: we add its entries,
+    replace those we have and remove those it no longer has, i.e. the user
+    removed a job from the block list to stop blocking it.
+
+    NOTE: we never import a JSON file older than our last change to the list,
+        since it is missing the entries we added since.
+
+    NOTE: this is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        json_file: Optional[str],
+        log_file: str,
+        log_level: int,
+    ) -> None:
+        """Open (or create) the list stored next to its JSON file
+
+        Args:
+            json_file (Optional[str]): path to the JSON file of the list, we
+                store the list in the .sqlite file of the same name. Pass None
+                to keep the list in memory only.
+            log_file (str): file to log to.
+            log_level (int): level to log at.
+        """
+        super().__init__(level=log_level, file_path=log_file)
+        self.json_file = json_file
+        self.db_file = (
+            os.path.splitext(json_file)[0] + ".sqlite" if json_file else ":memory:"
+        )
+        self._lock = Lock()
+        self._db = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs (key_id TEXT PRIMARY KEY, entry TEXT)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+        )
+        self._db.commit()
+        if json_file and os.path.isfile(json_file):
+            if self._get_json_file_state() != self._get_meta("json_file_state"):
+                self._import_json()
+        self._n_jobs = self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+        # Bloom filter of (at least) our key_ids, see JobFunnel.__init__
+        # NOTE: we add the key_ids of every update() to it
+        self.key_id_filter: Optional[BloomFilter] = None
+
+    def __contains__(self, key_id: object) -> bool:
+        if self.key_id_filter is not None and key_id not in self.key_id_filter:
+            return False
+        with self._lock:
+            return bool(
+                self._db.execute(
+                    "SELECT 1 FROM jobs WHERE key_id = ?", (key_id,)
+                ).fetchone()
+            )
+
+    def __len__(self) -> int:
+        return self._n_jobs
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._db.execute("SELECT key_id FROM jobs").fetchall()
+        return (key_id for (key_id,) in rows)
+
+    def __getitem__(self, key_id: str) -> Dict[str, str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT entry FROM jobs WHERE key_id = ?", (key_id,)
+            ).fetchone()
+        if not row:
+            raise KeyError(key_id)
+        return json.loads(row[0])
+
+    def __setitem__(self, key_id: str, entry: Dict[str, str]) -> None:
+        self.update({key_id: entry})
+
+    def __delitem__(self, key_id: str) -> None:
+        with self._lock:
+            with self._db:
+                n_deleted = self._db.execute(
+                    "DELETE FROM jobs WHERE key_id = ?", (key_id,)
+                ).rowcount
+                self._set_updated_at()
+            self._n_jobs -= n_deleted
+        if not n_deleted:
+            raise KeyError(key_id)
+
+    def update(
+        self, entries: Optional[Dict[str, Dict[str, str]]] = None, **kwargs
+    ) -> None:
+        """Add or replace entries, in one transaction"""
+        entries = dict(entries or {}, **kwargs)
+        if not entries:
+            return
+        with self._lock:
+            n_new = len(entries) - len(self._get_key_ids_in(list(entries)))
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO jobs VALUES (?,?)",
+                    (
+                        (key_id, json.dumps(entry, ensure_ascii=False))
+                        for key_id, entry in entries.items()
+                    ),
+                )
+                self._set_updated_at()
+            self._n_jobs += n_new
+        if self.key_id_filter is not None:
+            self.key_id_filter.update(entries)
+
+    def get_key_ids_in(self, key_ids: List[str]) -> Set[str]:
+        """Get those of key_ids which are in the list, i.e. to check many
+        key_ids at once, with a query per MAX_SQL_VARIABLES key_ids.
+
+        NOTE: unlike __contains__ this does not check key_id_filter first.
+        """
+        with self._lock:
+            return self._get_key_ids_in(key_ids)
+
+    def export_json(self) -> None:
+        """Write the whole list to its JSON file, sorted by key_id and with an
+        indent of 4 so that it stays human-readable.
+        """
+        if not self.json_file:
+            raise ValueError("Cannot export a list without a JSON file")
+        with self._lock:
+            rows = self._db.execute("SELECT key_id, entry FROM jobs").fetchall()
+        temp_file = f"{self.json_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w", encoding="utf8") as outfile:
+            outfile.write(
+                json.dumps(
+                    {key_id: json.loads(entry) for key_id, entry in rows},
+                    indent=4,
+                    sort_keys=True,
+                    separators=(",", ": "),
+                    ensure_ascii=False,
+                )
+            )
+        os.replace(temp_file, self.json_file)
+        with self._lock:
+            self._set_meta("json_file_state", self._get_json_file_state())
+        self.logger.info("Exported %d jobs to %s", len(rows), self.json_file)
+
+    def _import_json(self) -> None:
+        """Replace the list with the entries of the JSON file, unless the file
+        is older than our last change.
+        """
+        updated_at = self._get_meta("updated_at")
+        if updated_at and os.stat(self.json_file).st_mtime_ns < int(updated_at):
+            self.logger.warning(
+                "Not importing %s, it is older than the list in %s. Run with "
+                "--export-lists to write out the current list, then edit it.",
+                self.json_file,
+                self.db_file,
+            )
+            return
+        with open(self.json_file, "r", encoding="utf8") as infile:
+            entries = json.load(infile)  # type: Dict[str, Dict[str, str]]
+        removed_key_ids = [
+            (key_id,)
+            for (key_id,) in self._db.execute("SELECT key_id FROM jobs")
+            if key_id not in entries
+        ]
+        with self._db:
+            self._db.executemany("DELETE FROM jobs WHERE key_id = ?", removed_key_ids)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO jobs VALUES (?,?)",
+                (
+                    (key_id, json.dumps(entry, ensure_ascii=False))
+                    for key_id, entry in entries.items()
+                ),
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta VALUES (?,?)",
+                ("json_file_state", self._get_json_file_state()),
+            )
+        self.logger.info(
+            "Imported %d jobs from %s, removed %d jobs it no longer has",
+            len(entries),
+            self.json_file,
+            len(removed_key_ids),
+        )
+
+    def _get_key_ids_in(self, key_ids: List[str]) -> Set[str]:
+        """get_key_ids_in(), for callers which hold the lock"""
+        found = set()  # type: Set[str]
+        for start in range(0, len(key_ids), MAX_SQL_VARIABLES):
+            chunk = key_ids[start : start + MAX_SQL_VARIABLES]
+            found.update(
+                key_id
+                for (key_id,) in self._db.execute(
+                    "SELECT key_id FROM jobs WHERE key_id IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return found
+
+    def _get_json_file_state(self) -> str:
+        """Identifies the version of the JSON file by its size and mtime"""
+        file_stat = os.stat(self.json_file)
+        return f"{file_stat.st_size}:{file_stat.st_mtime_ns}"
+
+    def _get_meta(self, name: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_updated_at(self) -> None:
+        """Record the time of a change to the list, within its transaction"""
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta VALUES (?,?)",
+            ("updated_at", str(time_ns())),
+        )
+
+    def _set_meta(self, name: str, value: str) -> None:
+        with self._db:
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES (?,?)", (name, value))
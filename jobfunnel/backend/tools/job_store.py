@@ -0,0 +1,157 @@
+"""Append-only store of every job we scrape, so that we can re-load the jobs of
+a search (--no-scrape) or rebuild the master CSV from them (--recover).
+"""
+
+import pickle
+import sqlite3
+from threading import Lock
+from typing import Iterator, List, Optional, Tuple
+
+from jobfunnel import __version__
+from jobfunnel.backend import Job
+
+
+class JobStore:
+    """Every scraped job as a record of (key_id, search, scrape date, job),
+    stored in SQLite and indexed by key_id and by search and scrape date.
+
+    Records are only ever appended, so writing a job as soon as it is scraped
+    costs the same however many jobs we have stored, and the newest record of
+    a key_id is the current version of that job.
+
+    We also keep a registry of the newest scrape date of every search, so
+    finding the newest jobs of a search is a single lookup.
+
+    NOTE: this is safe to share between threads.
+    """
+
+    def __init__(self, db_file: str) -> None:
+        """Open (or create) the store database
+
+        Args:
+            db_file (str): path to the SQLite database file.
+        """
+        self.db_file = db_file
+        self._lock = Lock()
+        self._db = sqlite3.connect(db_file, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id INTEGER PRIMARY KEY, key_id TEXT NOT NULL, search TEXT NOT NULL, "
+            "scrape_date TEXT NOT NULL, version TEXT NOT NULL, job BLOB NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_key_id ON jobs (key_id)")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_search ON jobs (search, scrape_date)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS searches ("
+            "search TEXT PRIMARY KEY, scrape_date TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    def __len__(self) -> int:
+        """Number of distinct key_ids in the store"""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(DISTINCT key_id) FROM jobs"
+            ).fetchone()[0]
+
+    def add(self, job: Job, search: str, scrape_date: str) -> None:
+        """Append a record of job
+
+        NOTE: we drop Job.RAW, like the pickle cache did, since it is only
+            needed while scraping and may be too deep to pickle.
+
+        Args:
+            job (Job): the job, keyed by its key_id.
+            search (str): identifies the search that found the job.
+            scrape_date (str): date of the scrape as %Y-%m-%d.
+        """
+        job._raw_scrape_data = None  # pylint: disable=protected-access
+        record = pickle.dumps(job, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (key_id, search, scrape_date, version, job) "
+                "VALUES (?,?,?,?,?)",
+                (job.key_id, search, scrape_date, __version__, record),
+            )
+            self._db.execute(
+                "INSERT OR IGNORE INTO searches VALUES (?,?)", (search, scrape_date)
+            )
+            self._db.execute(
+                "UPDATE searches SET scrape_date = ? "
+                "WHERE search = ? AND scrape_date < ?",
+                (scrape_date, search, scrape_date),
+            )
+            self._db.commit()
+
+    def get(self, key_id: str) -> Optional[Job]:
+        """Get the newest record of a job, or None"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT job FROM jobs WHERE key_id = ? ORDER BY id DESC LIMIT 1",
+                (key_id,),
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def get_latest_scrape_date(self, search: str) -> Optional[str]:
+        """Get the newest scrape date of a search as %Y-%m-%d, or None if we
+        have no jobs of the search.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT scrape_date FROM searches WHERE search = ?", (search,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def iter_jobs(
+        self, search: Optional[str] = None, scrape_date: Optional[str] = None
+    ) -> Iterator[Job]:
+        """Yield the newest record of every job, optionally only of the jobs
+        found by a search and / or on a scrape date, oldest first.
+
+        NOTE: we read the records one at a time with a connection of our own,
+            so this does not load the whole store into memory, and jobs can be
+            added while we iterate.
+        """
+        where, params = self._get_where(search, scrape_date)
+        db = sqlite3.connect(self.db_file)
+        try:
+            for (record,) in db.execute(
+                "SELECT job FROM jobs WHERE id IN ("
+                f"SELECT MAX(id) FROM jobs {where} GROUP BY key_id) ORDER BY id",
+                params,
+            ):
+                yield pickle.loads(record)
+        finally:
+            db.close()
+
+    def get_versions(
+        self, search: Optional[str] = None, scrape_date: Optional[str] = None
+    ) -> List[str]:
+        """Get the distinct jobfunnel versions that wrote the records of a
+        search and / or scrape date.
+        """
+        where, params = self._get_where(search, scrape_date)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT DISTINCT version FROM jobs {where}", params
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def _get_where(
+        search: Optional[str], scrape_date: Optional[str]
+    ) -> Tuple[str, Tuple[str, ...]]:
+        """Get the WHERE clause and its parameters for a search and date"""
+        clauses, params = [], []  # type: List[str], List[str]
+        if search is not None:
+            clauses.append("search = ?")
+            params.append(search)
+        if scrape_date is not None:
+            clauses.append("scrape_date = ?")
+            params.append(scrape_date)
+        where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+        return where, tuple(params)
@@ -0,0 +1,226 @@
+"""MinHash signatures of job descriptions with locality-sensitive hashing, so
+that we can find near-verbatim re-posts without comparing every pair of jobs.
+"""
+
+import os
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from zlib import crc32
+
+import numpy as np
+
+from jobfunnel.resources import (
+    MINHASH_BANDS,
+    MINHASH_PERMUTATIONS,
+    MINHASH_SHINGLE_SIZE,
+)
+
+MINHASH_INDEX_VERSION = 1
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class MinHashIndex:
+    """MinHash signature of the word shingles of every indexed document, and
+    the LSH band hashes of every signature, sorted so that we can find the
+    documents which share a band with a binary search.
+
+    Documents that share any band are candidates, the probability of that is
+    1 - (1 - J ** rows) ** bands for documents with Jaccard similarity J, so
+    candidates must be verified with jaccard_similarity().
+
+    NOTE: documents are only shingled when they are added or their contents
+        change, and the index is persisted with save() / load().
+    """
+
+    def __init__(
+        self,
+        analyzer: Callable[[str], List[str]],
+        fingerprint: str,
+        n_permutations: int = MINHASH_PERMUTATIONS,
+        n_bands: int = MINHASH_BANDS,
+        shingle_size: int = MINHASH_SHINGLE_SIZE,
+    ) -> None:
+        """Init
+
+        Args:
+            analyzer (Callable[[str], List[str]]): turns a document into words,
+                i.e. TfidfVectorizer.build_analyzer().
+            fingerprint (str): identifies the analyzer settings, an index saved
+                with a different fingerprint is discarded by load().
+            n_permutations (int, optional): length of the MinHash signatures.
+                Defaults to MINHASH_PERMUTATIONS.
+            n_bands (int, optional): number of LSH bands the signature is split
+                into, must divide n_permutations. Defaults to MINHASH_BANDS.
+            shingle_size (int, optional): number of words per shingle.
+                Defaults to MINHASH_SHINGLE_SIZE.
+        """
+        if n_permutations % n_bands:
+            raise ValueError("Number of LSH bands must divide number of permutations")
+        self.analyzer = analyzer
+        self.n_permutations = n_permutations
+        self.n_bands = n_bands
+        self.shingle_size = shingle_size
+        self.fingerprint = "/".join(
+            [fingerprint, str(n_permutations), str(n_bands), str(shingle_size)]
+        )
+
+        # Fixed random permutations (a * x + b) % prime, so signatures persist
+        rng = np.random.RandomState(1)
+        self._a = rng.randint(1, MAX_HASH, n_permutations, dtype=np.uint64)
+        self._b = rng.randint(0, MAX_HASH, n_permutations, dtype=np.uint64)
+        self._band_weights = rng.randint(
+            1, MAX_HASH, n_permutations // n_bands, dtype=np.uint64
+        )
+
+        self.doc_ids = []  # type: List[str]
+        self.checksums = np.zeros(0, dtype=np.int64)
+        self.signatures = np.zeros((0, n_permutations), dtype=np.uint32)
+        self._rows = {}  # type: Dict[str, int]
+        self._sorted_bands: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    def shingle(self, contents: str) -> Set[Tuple[str, ...]]:
+        """Get the set of word shingles of a document"""
+        words = self.analyzer(contents)
+        size = min(self.shingle_size, len(words))
+        return {
+            tuple(words[i : i + size]) for i in range(len(words) - size + 1) if size
+        }
+
+    def get_signature(self, shingles: Set[Tuple[str, ...]]) -> np.ndarray:
+        """Get the MinHash signature of a set of shingles"""
+        if not shingles:
+            return np.full(self.n_permutations, MAX_HASH, dtype=np.uint32)
+        hashes = np.fromiter(
+            (crc32(" ".join(shingle).encode()) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # NOTE: a, b and the hashes are < 2 ** 32 so this cannot overflow
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % MERSENNE_PRIME
+        return (permuted & MAX_HASH).min(axis=1).astype(np.uint32)
+
+    def update(self, documents: Dict[str, str]) -> int:
+        """Make the index contain exactly these documents, shingling only the
+        documents which are new or have changed contents.
+
+        Args:
+            documents (Dict[str, str]): document contents by id.
+
+        Returns:
+            int: number of documents that we (re-)shingled.
+        """
+        keep_rows = []  # type: List[int]
+        keep_ids = []  # type: List[str]
+        new_ids = []  # type: List[str]
+        new_checksums = []  # type: List[int]
+        new_signatures = []  # type: List[np.ndarray]
+        for doc_id, contents in documents.items():
+            checksum = crc32(contents.encode())
+            row = self._rows.get(doc_id)
+            if row is not None and self.checksums[row] == checksum:
+                keep_rows.append(row)
+                keep_ids.append(doc_id)
+            else:
+                new_ids.append(doc_id)
+                new_checksums.append(checksum)
+                new_signatures.append(self.get_signature(self.shingle(contents)))
+
+        self.doc_ids = keep_ids + new_ids
+        self.checksums = np.concatenate(
+            [self.checksums[keep_rows], np.array(new_checksums, dtype=np.int64)]
+        )
+        self.signatures = np.concatenate(
+            [
+                self.signatures[keep_rows],
+                np.array(new_signatures, dtype=np.uint32).reshape(
+                    -1, self.n_permutations
+                ),
+            ]
+        )
+        self._rows = {doc_id: row for row, doc_id in enumerate(self.doc_ids)}
+        self._sorted_bands = None
+        return len(new_ids)
+
+    def get_candidates(self, doc_ids: List[str]) -> Dict[str, Set[str]]:
+        """Get the indexed documents which share an LSH band with each of
+        the indexed documents doc_ids (excluding themselves).
+
+        NOTE: this is a binary search per band, not a scan of the index.
+        """
+        if self._sorted_bands is None:
+            band_hashes = self._get_band_hashes(self.signatures)
+            order = np.argsort(band_hashes, axis=0, kind="stable")
+            self._sorted_bands = (np.take_along_axis(band_hashes, order, 0), order)
+        sorted_hashes, order = self._sorted_bands
+
+        rows = np.array([self._rows[doc_id] for doc_id in doc_ids], dtype=np.int64)
+        query_hashes = self._get_band_hashes(self.signatures[rows])
+        candidates = {doc_id: set() for doc_id in doc_ids}  # type: Dict[str, Set[str]]
+        for band in range(self.n_bands):
+            starts = np.searchsorted(sorted_hashes[:, band], query_hashes[:, band])
+            ends = np.searchsorted(
+                sorted_hashes[:, band], query_hashes[:, band], side="right"
+            )
+            for i in np.flatnonzero(ends - starts > 1):
+                candidates[doc_ids[i]].update(
+                    self.doc_ids[row] for row in order[starts[i] : ends[i], band]
+                )
+        for doc_id, doc_candidates in candidates.items():
+            doc_candidates.discard(doc_id)
+        return candidates
+
+    def save(self, file_path: str) -> None:
+        """Save the index (but not the analyzer) to a .npz file_path"""
+        np.savez(
+            file_path,
+            version=MINHASH_INDEX_VERSION,
+            fingerprint=self.fingerprint,
+            doc_ids=np.array(self.doc_ids, dtype=str),
+            checksums=self.checksums,
+            signatures=self.signatures,
+        )
+
+    @classmethod
+    def load(
+        cls, file_path: str, analyzer: Callable[[str], List[str]], fingerprint: str
+    ) -> "MinHashIndex":
+        """Load an index saved with save(), or get an empty index if there is
+        no index at file_path or it was built with different settings.
+        """
+        index = cls(analyzer, fingerprint)
+        if not os.path.isfile(file_path):
+            return index
+        with np.load(file_path, allow_pickle=False) as saved:
+            if (
+                saved["version"] != MINHASH_INDEX_VERSION
+                or saved["fingerprint"] != index.fingerprint
+            ):
+                return index
+            index.doc_ids = saved["doc_ids"].tolist()
+            index.checksums = saved["checksums"]
+            index.signatures = saved["signatures"]
+        index._rows = {doc_id: row for row, doc_id in enumerate(index.doc_ids)}
+        return index
+
+    def _get_band_hashes(self, signatures: np.ndarray) -> np.ndarray:
+        """Hash every band of the signatures into a single 64-bit value
+        NOTE: unequal bands may collide, which only adds a candidate.
+        """
+        bands = signatures.astype(np.uint64).reshape(len(signatures), self.n_bands, -1)
+        return (bands * self._band_weights).sum(axis=2)
+
+
+def jaccard_similarity(
+    shingles: Set[Tuple[str, ...]], other_shingles: Set[Tuple[str, ...]]
+) -> float:
+    """Exact Jaccard similarity of two sets of shingles"""
+    if not shingles or not other_shingles:
+        return 0.0
+    n_shared = len(shingles & other_shingles)
+    return n_shared / (len(shingles) + len(other_shingles) - n_shared)
@@ -0,0 +1,103 @@
+"""Pool of HTTP sessions, so that scrapers can run in parallel without sharing
+(and overwriting) each-other's headers.
+"""
+
+from threading import Lock
+from typing import Dict, Optional
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from jobfunnel.backend.tools.http_cache import CachedSession, HTTPCache
+from jobfunnel.config.proxy import ProxyConfig
+from jobfunnel.config.session import SessionConfig
+from jobfunnel.resources import MAX_CPU_WORKERS, Provider, ScrapeEngine
+
+
+class SessionPool:
+    """Keep-alive Sessions keyed by provider, which pool connections by host.
+
+    Each provider (i.e. the scraper class name) gets its own Session, so its
+    headers are only ever set by that scraper. Each Session has a single
+    HTTPAdapter mounted which keeps a connection pool per host, so connections
+    are re-used for the whole run rather than re-built for every scraper.
+
+    NOTE: if we have a HTTPCache, every Session is a CachedSession using it.
+    NOTE: every per-host pool keeps at least as many connections alive as a
+        scraper can have requests in flight, see get_pool_maxsize().
+    """
+
+    def __init__(
+        self,
+        session_config: SessionConfig,
+        proxy_config: Optional[ProxyConfig] = None,
+        http_cache: Optional[HTTPCache] = None,
+    ) -> None:
+        """Init
+
+        Args:
+            session_config (SessionConfig): connection pooling configuration.
+            proxy_config (Optional[ProxyConfig], optional): proxy to use for
+                all sessions. Defaults to None, which will use no proxy.
+            http_cache (Optional[HTTPCache], optional): cache of responses to
+                use for all sessions. Defaults to None, which caches nothing.
+        """
+        self.session_config = session_config
+        self.proxy_config = proxy_config
+        self.http_cache = http_cache
+        self._sessions: Dict[str, Session] = {}
+        self._lock = Lock()
+
+    def get(self, name: str, provider: Optional[Provider] = None) -> Session:
+        """Get the Session for a scraper name, opening a new one if needed
+
+        Args:
+            name (str): name of the scraper (i.e. its class name).
+            provider (Optional[Provider], optional): provider of the scraper,
+                used for per-provider cache TTLs. Defaults to None.
+        """
+        with self._lock:
+            if name not in self._sessions:
+                self._sessions[name] = self._new_session(provider)
+            return self._sessions[name]
+
+    def close(self) -> None:
+        """Close every Session and its pooled connections, get() opens new ones"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def get_pool_maxsize(self) -> int:
+        """Get the max. number of connections we keep alive per host, which is
+        never less than the requests a scraper can have in flight at once.
+
+        NOTE: the ASYNCIO engine keeps up to max_concurrent_requests in flight,
+            and fetch() makes them with our Session if they weren't prefetched.
+        """
+        if self.session_config.engine == ScrapeEngine.ASYNCIO:
+            n_requests = self.session_config.max_concurrent_requests
+        else:
+            n_requests = MAX_CPU_WORKERS
+        return max(self.session_config.pool_maxsize, n_requests)
+
+    def _new_session(self, provider: Optional[Provider] = None) -> Session:
+        """Open a session with/out a proxy configured, with pooling and retries"""
+        if self.http_cache:
+            session = CachedSession(self.http_cache, provider)
+        else:
+            session = Session()
+        if self.proxy_config:
+            session.proxies = {self.proxy_config.protocol: self.proxy_config.url}
+
+        # Elongate the retries TODO: make configurable
+        adapter = HTTPAdapter(
+            pool_connections=self.session_config.pool_connections,
+            pool_maxsize=self.get_pool_maxsize(),
+            max_retries=Retry(connect=3, backoff_factor=0.5),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
@@ -0,0 +1,229 @@
+"""Incremental TFIDF index of job descriptions, so that we only need to
+tokenize the jobs we haven't seen before on every run.
+"""
+
+from collections import Counter
+import os
+from typing import Callable, Dict, Iterator, List, Tuple
+from zlib import crc32
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.preprocessing import normalize
+
+from jobfunnel.resources import MAX_SIMILARITY_BLOCK_SIZE
+
+TFIDF_INDEX_VERSION = 1
+
+# (description checksum, term indices, term counts) of a single document
+IndexedDocument = Tuple[int, np.ndarray, np.ndarray]
+
+
+class TfidfIndex:
+    """Term counts of every indexed document, and the document frequency of
+    every term in our vocabulary.
+
+    This gives the same vectors as fitting a TfidfVectorizer (with its default
+    smooth_idf=True, norm='l2') to all the indexed documents, but documents are
+    only tokenized when they are added or their contents change, since we only
+    apply the IDF weighting when we transform().
+
+    NOTE: terms are never removed from the vocabulary, but terms which are in
+        no documents have no effect on the similarity between documents.
+    """
+
+    def __init__(self, analyzer: Callable[[str], List[str]], fingerprint: str) -> None:
+        """Init
+
+        Args:
+            analyzer (Callable[[str], List[str]]): turns a document into terms,
+                i.e. TfidfVectorizer.build_analyzer().
+            fingerprint (str): identifies the analyzer settings, an index saved
+                with a different fingerprint is discarded by load().
+        """
+        self.analyzer = analyzer
+        self.fingerprint = fingerprint
+        self.vocabulary = {}  # type: Dict[str, int]
+        self.doc_freqs = np.zeros(0, dtype=np.int64)
+        self.documents = {}  # type: Dict[str, IndexedDocument]
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.documents
+
+    def update(self, documents: Dict[str, str]) -> int:
+        """Make the index contain exactly these documents, tokenizing only the
+        documents which are new or have changed contents.
+
+        Args:
+            documents (Dict[str, str]): document contents by id.
+
+        Returns:
+            int: number of documents that we (re-)tokenized.
+        """
+        for doc_id in [d for d in self.documents if d not in documents]:
+            self._remove(doc_id)
+
+        n_tokenized = 0
+        for doc_id, contents in documents.items():
+            checksum = crc32(contents.encode())
+            indexed = self.documents.get(doc_id)
+            if indexed is not None:
+                if indexed[0] == checksum:
+                    continue
+                self._remove(doc_id)
+            self._add(doc_id, contents, checksum)
+            n_tokenized += 1
+        return n_tokenized
+
+    def transform(self, doc_ids: List[str]) -> csr_matrix:
+        """Get the l2-normalized TFIDF vectors of indexed documents
+
+        Args:
+            doc_ids (List[str]): ids of indexed documents, one row per id.
+
+        Returns:
+            csr_matrix: len(doc_ids) x len(self.vocabulary) TFIDF vectors.
+        """
+        n_terms = len(self.vocabulary)
+        idf = np.log((1 + len(self.documents)) / (1 + self.doc_freqs[:n_terms])) + 1
+        indexed = [self.documents[doc_id] for doc_id in doc_ids]
+        indptr = np.zeros(len(indexed) + 1, dtype=np.int64)
+        np.cumsum([len(doc[1]) for doc in indexed], out=indptr[1:])
+        if indexed:
+            indices = np.concatenate([doc[1] for doc in indexed])
+            counts = np.concatenate([doc[2] for doc in indexed])
+        else:
+            indices = np.zeros(0, dtype=np.int64)
+            counts = np.zeros(0)
+        vectors = csr_matrix(
+            (counts * idf[indices], indices, indptr), shape=(len(indexed), n_terms)
+        )
+        return normalize(vectors, norm="l2", copy=False)
+
+    def save(self, file_path: str) -> None:
+        """Save the index (but not the analyzer) to a .npz file_path
+
+        NOTE: we don't pickle this since recovery loads every .pkl in the cache.
+        """
+        doc_ids = list(self.documents)
+        indexed = list(self.documents.values())
+        terms = sorted(self.vocabulary, key=self.vocabulary.__getitem__)
+        np.savez(
+            file_path,
+            version=TFIDF_INDEX_VERSION,
+            fingerprint=self.fingerprint,
+            terms=np.array(terms, dtype=str),
+            doc_freqs=self.doc_freqs[: len(terms)],
+            doc_ids=np.array(doc_ids, dtype=str),
+            checksums=np.array([doc[0] for doc in indexed], dtype=np.int64),
+            lengths=np.array([len(doc[1]) for doc in indexed], dtype=np.int64),
+            indices=np.concatenate([doc[1] for doc in indexed] or [[]]),
+            counts=np.concatenate([doc[2] for doc in indexed] or [[]]),
+        )
+
+    @classmethod
+    def load(
+        cls, file_path: str, analyzer: Callable[[str], List[str]], fingerprint: str
+    ) -> "TfidfIndex":
+        """Load an index saved with save(), or get an empty index if there is
+        no index at file_path or it was built with a different analyzer.
+        """
+        index = cls(analyzer, fingerprint)
+        if not os.path.isfile(file_path):
+            return index
+        with np.load(file_path, allow_pickle=False) as saved:
+            if (
+                saved["version"] != TFIDF_INDEX_VERSION
+                or saved["fingerprint"] != fingerprint
+            ):
+                return index
+            index.vocabulary = {t: i for i, t in enumerate(saved["terms"].tolist())}
+            index.doc_freqs = saved["doc_freqs"]
+            splits = np.cumsum(saved["lengths"])[:-1]
+            index.documents = {
+                doc_id: (checksum, indices, counts)
+                for doc_id, checksum, indices, counts in zip(
+                    saved["doc_ids"].tolist(),
+                    saved["checksums"].tolist(),
+                    np.split(saved["indices"].astype(np.int64), splits),
+                    np.split(saved["counts"].astype(np.float64), splits),
+                )
+            }
+        return index
+
+    def _add(self, doc_id: str, contents: str, checksum: int) -> None:
+        term_counts = Counter(self.analyzer(contents))
+        indices = np.fromiter(
+            (self.vocabulary.setdefault(t, len(self.vocabulary)) for t in term_counts),
+            dtype=np.int64,
+            count=len(term_counts),
+        )
+        if len(self.vocabulary) > len(self.doc_freqs):
+            # Grow geometrically so that adding documents stays cheap
+            doc_freqs = np.zeros(
+                max(len(self.vocabulary), 2 * len(self.doc_freqs)), dtype=np.int64
+            )
+            doc_freqs[: len(self.doc_freqs)] = self.doc_freqs
+            self.doc_freqs = doc_freqs
+        self.doc_freqs[indices] += 1
+        counts = np.fromiter(term_counts.values(), dtype=np.float64)
+        self.documents[doc_id] = (checksum, indices, counts)
+
+    def _remove(self, doc_id: str) -> None:
+        _, indices, _ = self.documents.pop(doc_id)
+        self.doc_freqs[indices] -= 1
+
+
+def iter_most_similar(
+    query_vectors: csr_matrix,
+    reference_vectors: csr_matrix,
+    min_similarity: float,
+    max_block_size: int = MAX_SIMILARITY_BLOCK_SIZE,
+    only_earlier: bool = False,
+) -> Iterator[Tuple[int, int, float]]:
+    """Find the most similar reference vector for every query vector, by
+    cosine similarity of l2-normalized vectors (i.e. from TfidfIndex).
+
+    NOTE: we never build the full len(query) x len(reference) similarity
+        matrix, only sparse blocks of up to max_block_size similarities, and we
+        drop every similarity below min_similarity as soon as a block is built.
+
+    Args:
+        query_vectors (csr_matrix): l2-normalized query vectors.
+        reference_vectors (csr_matrix): l2-normalized vectors to search.
+        min_similarity (float): ignore matches less similar than this.
+        max_block_size (int, optional): max. number of similarities to compute
+            at once. Defaults to MAX_SIMILARITY_BLOCK_SIZE.
+        only_earlier (bool, optional): only match query row i with reference
+            rows before i, for finding duplicates within a single set of
+            vectors (query_vectors is reference_vectors). Defaults to False.
+
+    Yields:
+        Tuple[int, int, float]: query row, most similar reference row and their
+            similarity, only for queries with a match of min_similarity or more.
+    """
+    # NOTE: this copy is linear in the size of the references, unlike a dense
+    # similarity matrix, and it is much faster to multiply blocks with.
+    reference_vectors_t = reference_vectors.T.tocsr()
+    block_rows = max(1, max_block_size // max(1, reference_vectors.shape[0]))
+    for block_start in range(0, query_vectors.shape[0], block_rows):
+        query_block = query_vectors[block_start : block_start + block_rows]
+        similarities = (query_block @ reference_vectors_t).tocsr()
+        similarities.data[similarities.data < min_similarity] = 0
+        if only_earlier:
+            rows = block_start + np.repeat(
+                np.arange(similarities.shape[0]), np.diff(similarities.indptr)
+            )
+            similarities.data[similarities.indices >= rows] = 0
+        similarities.eliminate_zeros()
+        for row in np.flatnonzero(np.diff(similarities.indptr)):
+            start, end = similarities.indptr[row], similarities.indptr[row + 1]
+            top = start + np.argmax(similarities.data[start:end])
+            yield (
+                block_start + int(row),
+                int(similarities.indices[top]),
+                float(similarities.data[top]),
+            )
@@ -1,9 +1,11 @@
 from jobfunnel.config.base import BaseConfig
 from jobfunnel.config.cli import build_config_dict, get_config_manager, parse_cli
 from jobfunnel.config.delay import DelayConfig
+from jobfunnel.config.http_cache import HTTPCacheConfig
 from jobfunnel.config.manager import JobFunnelConfigManager
 from jobfunnel.config.proxy import ProxyConfig
 from jobfunnel.config.search import SearchConfig
+from jobfunnel.config.session import SessionConfig
 from jobfunnel.config.settings import SETTINGS_YAML_SCHEMA, SettingsValidator
 
 __all__ = [
@@ -13,6 +15,8 @@ __all__ = [
     "DelayConfig",
     "ProxyConfig",
     "SearchConfig",
+    "SessionConfig",
+    "HTTPCacheConfig",
     "JobFunnelConfigManager",
     "parse_cli",
     "get_config_manager",
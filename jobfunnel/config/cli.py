@@ -7,26 +7,43 @@ from typing import Any, Dict, List
 import yaml
 
 from jobfunnel.config.delay import DelayConfig
+from jobfunnel.config.http_cache import HTTPCacheConfig
 from jobfunnel.config.manager import JobFunnelConfigManager
 from jobfunnel.config.proxy import ProxyConfig
 from jobfunnel.config.search import SearchConfig
+from jobfunnel.config.session import SessionConfig
 from jobfunnel.config.settings import SettingsValidator
 from jobfunnel.resources import (
     LOG_LEVEL_NAMES,
     DelayAlgorithm,
+    DuplicateEngine,
+    ExportFormat,
     Locale,
+    PageKind,
     Provider,
     Remoteness,
+    ScrapeEngine,
 )
 from jobfunnel.resources.defaults import (
     DEFAULT_COMPANY_BLOCK_LIST,
     DEFAULT_DELAY_ALGORITHM,
     DEFAULT_DELAY_MAX_DURATION,
     DEFAULT_DELAY_MIN_DURATION,
+    DEFAULT_DUPLICATE_ENGINE,
+    DEFAULT_EXPORT_FORMATS,
+    DEFAULT_HTTP_CACHE_ENABLED,
+    DEFAULT_HTTP_CACHE_JOB_TTL,
+    DEFAULT_HTTP_CACHE_LISTING_TTL,
+    DEFAULT_HTTP_CACHE_MAX_SIZE_MB,
+    DEFAULT_HTTP_POOL_CONNECTIONS,
+    DEFAULT_HTTP_POOL_MAXSIZE,
     DEFAULT_LOG_LEVEL_NAME,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_SCRAPERS,
     DEFAULT_MAX_LISTING_DAYS,
     DEFAULT_PROVIDER_NAMES,
     DEFAULT_REMOTENESS,
+    DEFAULT_SCRAPE_ENGINE,
     DEFAULT_SEARCH_RADIUS,
 )
 
@@ -49,6 +66,24 @@ def parse_cli(args: List[str]) -> Dict[str, Any]:
         "state.",
     )
 
+    base_parser.add_argument(
+        "--export-lists",
+        dest="do_export_lists",
+        action="store_true",
+        help="Write the block list and duplicates list out to their JSON files "
+        "in a human-readable format, then exit without scraping. NOTE: edits "
+        "to these files are imported the next time JobFunnel runs.",
+    )
+
+    base_parser.add_argument(
+        "--from-export",
+        dest="do_from_export",
+        action="store_true",
+        help="Read the master list of jobs from its export (-export) instead "
+        "of the master CSV, i.e. if the CSV was deleted. WARNING: this "
+        "discards any changes made to the master CSV since the last run.",
+    )
+
     base_subparsers = base_parser.add_subparsers(
         dest="load | inline",
         help="Pass load with a YAML config or inline to pass args by CLI.",
@@ -104,6 +139,33 @@ def parse_cli(args: List[str]) -> Dict[str, Any]:
         help="Do not make any get requests, instead, load jobs from cache "
         "and update filters + CSV file.",
     )
+    cli_parser.add_argument(
+        "-max-concurrent-scrapers",
+        dest="max_concurrent_scrapers",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_SCRAPERS,
+        help="Maximum number of job providers to scrape at the same time, "
+        "pass 1 to scrape providers one after another.",
+    )
+    cli_parser.add_argument(
+        "-duplicate-engine",
+        dest="duplicate_engine",
+        type=str,
+        choices=[e.name for e in DuplicateEngine],
+        default=DEFAULT_DUPLICATE_ENGINE.name,
+        help="How to detect jobs which are duplicates by their description, "
+        "MINHASH only compares near-verbatim candidates and scales better.",
+    )
+    cli_parser.add_argument(
+        "-export",
+        dest="export_formats",
+        type=str,
+        nargs="*",
+        choices=[f.name for f in ExportFormat],
+        default=[f.name for f in DEFAULT_EXPORT_FORMATS],
+        help="Also export the master list of jobs to these formats, next to "
+        "the master CSV (PARQUET requires pyarrow: pip install jobfunnel[parquet]).",
+    )
 
     # Paths
     search_group = cli_parser.add_argument_group("paths")
@@ -307,6 +369,81 @@ def parse_cli(args: List[str]) -> Dict[str, Any]:
         default=DEFAULT_DELAY_ALGORITHM.name,
         help="Select a function to calculate delay times with.",
     )
+
+    # Session stuff
+    session_group = cli_parser.add_argument_group("session")
+    session_group.add_argument(
+        "-pool-connections",
+        dest="session.pool_connections",
+        type=int,
+        default=DEFAULT_HTTP_POOL_CONNECTIONS,
+        help="Number of hosts to keep a pool of open connections to, per "
+        "job provider.",
+    )
+
+    session_group.add_argument(
+        "-pool-maxsize",
+        dest="session.pool_maxsize",
+        type=int,
+        default=DEFAULT_HTTP_POOL_MAXSIZE,
+        help="Maximum number of open connections to keep alive per host, we "
+        "always keep at least as many as a scraper has requests in flight.",
+    )
+
+    session_group.add_argument(
+        "-engine",
+        dest="session.engine",
+        choices=[e.name for e in ScrapeEngine],
+        default=DEFAULT_SCRAPE_ENGINE.name,
+        help="Scrape job pages with a pool of threads, or with a single asyncio "
+        "event loop (requires aiohttp: pip install jobfunnel[async]).",
+    )
+
+    session_group.add_argument(
+        "-max-concurrent-requests",
+        dest="session.max_concurrent_requests",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        help="Maximum number of requests in flight per job provider when using "
+        "the ASYNCIO engine.",
+    )
+
+    # HTTP cache stuff
+    http_cache_group = cli_parser.add_argument_group("http_cache")
+    http_cache_group.add_argument(
+        "--http-cache",
+        dest="http_cache.enabled",
+        action="store_true",
+        default=DEFAULT_HTTP_CACHE_ENABLED,
+        help="Cache HTTP responses in the cache folder, so that re-runs re-use "
+        "search results pages and job pages until their TTLs expire.",
+    )
+
+    http_cache_group.add_argument(
+        "-http-cache-max-size",
+        dest="http_cache.max_size_mb",
+        type=float,
+        default=DEFAULT_HTTP_CACHE_MAX_SIZE_MB,
+        help="Maximum size of the HTTP cache in MB, the least-recently-used "
+        "responses are evicted past this.",
+    )
+
+    http_cache_group.add_argument(
+        "-listing-ttl",
+        dest="http_cache.listing_ttl",
+        type=float,
+        default=DEFAULT_HTTP_CACHE_LISTING_TTL,
+        help="Seconds to re-use cached search results pages for before "
+        "revalidating them.",
+    )
+
+    http_cache_group.add_argument(
+        "-job-ttl",
+        dest="http_cache.job_ttl",
+        type=float,
+        default=DEFAULT_HTTP_CACHE_JOB_TTL,
+        help="Seconds to re-use cached job pages for before revalidating them.",
+    )
     return vars(base_parser.parse_args(args))
 
 
@@ -340,12 +477,12 @@ def build_config_dict(args_dict: Dict[str, Any]) -> Dict[str, Any]:
 
     else:
         # Handle CLI arguments for paths, possibly overwriting YAML
-        sub_keys = ["search", "delay", "proxy"]
+        sub_keys = ["search", "delay", "proxy", "session", "http_cache"]
         config = {k: {} for k in sub_keys}  # type: Dict[str, Dict[str, Any]]
 
         # Handle all the sub-configs, and non-path, non-default CLI args
         for key, value in args_dict.items():
-            if key == "do_recovery_mode":
+            if key in ("do_recovery_mode", "do_export_lists", "do_from_export"):
                 # This is not present in the schema, it is CLI only.
                 continue
             elif value is not None:
@@ -387,6 +524,24 @@ def get_config_manager(config: Dict[str, Any]) -> JobFunnelConfigManager:
         converge=config["delay"]["converging"],
     )
 
+    session_cfg = SessionConfig(
+        pool_connections=config["session"]["pool_connections"],
+        pool_maxsize=config["session"]["pool_maxsize"],
+        engine=ScrapeEngine[config["session"]["engine"]],
+        max_concurrent_requests=config["session"]["max_concurrent_requests"],
+    )
+
+    http_cache_cfg = HTTPCacheConfig(
+        enabled=config["http_cache"]["enabled"],
+        max_size_mb=config["http_cache"]["max_size_mb"],
+        listing_ttl=config["http_cache"]["listing_ttl"],
+        job_ttl=config["http_cache"]["job_ttl"],
+        provider_ttls={
+            Provider[provider]: {PageKind[kind]: ttl for kind, ttl in ttls.items()}
+            for provider, ttls in config["http_cache"].get("provider_ttls", {}).items()
+        },
+    )
+
     if config.get("proxy"):
         proxy_cfg = ProxyConfig(
             protocol=config["proxy"]["protocol"],
@@ -404,9 +559,14 @@ def get_config_manager(config: Dict[str, Any]) -> JobFunnelConfigManager:
         log_file=config["log_file"],
         log_level=config["log_level"],
         no_scrape=config["no_scrape"],
+        max_concurrent_scrapers=config["max_concurrent_scrapers"],
+        duplicate_engine=DuplicateEngine[config["duplicate_engine"]],
+        export_formats=[ExportFormat[f] for f in config["export_formats"]],
         search_config=search_cfg,
         delay_config=delay_cfg,
         proxy_config=proxy_cfg,
+        session_config=session_cfg,
+        http_cache_config=http_cache_cfg,
     )
 
     return funnel_cfg_mgr
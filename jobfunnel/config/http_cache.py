@@ -0,0 +1,67 @@
+"""Simple config object to contain the HTTP response cache configuration
+"""
+
+from typing import Dict, Optional
+
+from jobfunnel.config.base import BaseConfig
+from jobfunnel.resources import PageKind, Provider
+from jobfunnel.resources.defaults import (
+    DEFAULT_HTTP_CACHE_ENABLED,
+    DEFAULT_HTTP_CACHE_JOB_TTL,
+    DEFAULT_HTTP_CACHE_LISTING_TTL,
+    DEFAULT_HTTP_CACHE_MAX_SIZE_MB,
+)
+
+
+class HTTPCacheConfig(BaseConfig):
+    """Simple config object to contain the HTTP response cache configuration"""
+
+    def __init__(
+        self,
+        enabled: bool = DEFAULT_HTTP_CACHE_ENABLED,
+        max_size_mb: float = DEFAULT_HTTP_CACHE_MAX_SIZE_MB,
+        listing_ttl: float = DEFAULT_HTTP_CACHE_LISTING_TTL,
+        job_ttl: float = DEFAULT_HTTP_CACHE_JOB_TTL,
+        provider_ttls: Optional[Dict[Provider, Dict[PageKind, float]]] = None,
+    ) -> None:
+        """HTTP response cache configuration, the cache is kept in cache_folder
+
+        Args:
+            enabled (bool, optional): whether to cache HTTP responses at all.
+                Defaults to DEFAULT_HTTP_CACHE_ENABLED.
+            max_size_mb (float, optional): max total size of cached responses,
+                we evict the least-recently-used responses past this.
+                Defaults to DEFAULT_HTTP_CACHE_MAX_SIZE_MB.
+            listing_ttl (float, optional): seconds that a cached search results
+                page is used before we revalidate it with the provider.
+                Defaults to DEFAULT_HTTP_CACHE_LISTING_TTL.
+            job_ttl (float, optional): seconds that a cached job page is used
+                before we revalidate it with the provider.
+                Defaults to DEFAULT_HTTP_CACHE_JOB_TTL.
+            provider_ttls (Optional[Dict[Provider, Dict[PageKind, float]]]):
+                per-provider overrides of the above TTLs. Defaults to None.
+        """
+        super().__init__()
+        self.enabled = enabled
+        self.max_size_mb = max_size_mb
+        self.listing_ttl = listing_ttl
+        self.job_ttl = job_ttl
+        self.provider_ttls = provider_ttls or {}
+
+    @property
+    def max_size_bytes(self) -> int:
+        return int(self.max_size_mb * 1024 * 1024)
+
+    def get_ttl(self, provider: Optional[Provider], page_kind: PageKind) -> float:
+        """Get the TTL in seconds for a provider's kind of page"""
+        default_ttl = self.job_ttl if page_kind == PageKind.JOB else self.listing_ttl
+        return self.provider_ttls.get(provider, {}).get(page_kind, default_ttl)
+
+    def validate(self) -> None:
+        if self.max_size_mb <= 0:
+            raise ValueError("HTTP cache max size must be > 0 MB.")
+        ttls = [self.listing_ttl, self.job_ttl]
+        for page_ttls in self.provider_ttls.values():
+            ttls.extend(page_ttls.values())
+        if min(ttls) < 0:
+            raise ValueError("HTTP cache TTLs must be >= 0 seconds.")
@@ -1,6 +1,7 @@
 """Config object to run JobFunnel
 """
 
+from importlib.util import find_spec
 import logging
 import os
 from typing import List, Optional
@@ -8,9 +9,16 @@ from typing import List, Optional
 from jobfunnel.backend.scrapers.registry import SCRAPER_FROM_LOCALE
 from jobfunnel.config.base import BaseConfig
 from jobfunnel.config.delay import DelayConfig
+from jobfunnel.config.http_cache import HTTPCacheConfig
 from jobfunnel.config.proxy import ProxyConfig
 from jobfunnel.config.search import SearchConfig
-from jobfunnel.resources import BS4_PARSER
+from jobfunnel.config.session import SessionConfig
+from jobfunnel.resources import BS4_PARSER, DuplicateEngine, ExportFormat
+from jobfunnel.resources.defaults import (
+    DEFAULT_DUPLICATE_ENGINE,
+    DEFAULT_EXPORT_FORMATS,
+    DEFAULT_MAX_CONCURRENT_SCRAPERS,
+)
 
 # pylint: disable=using-constant-test,unused-import
 if False:  # or typing.TYPE_CHECKING  if python3.5.3+
@@ -31,10 +39,15 @@ class JobFunnelConfigManager(BaseConfig):
         log_file: str,
         log_level: Optional[int] = logging.INFO,
         no_scrape: Optional[bool] = False,
+        max_concurrent_scrapers: Optional[int] = DEFAULT_MAX_CONCURRENT_SCRAPERS,
+        duplicate_engine: Optional[DuplicateEngine] = DEFAULT_DUPLICATE_ENGINE,
+        export_formats: Optional[List[ExportFormat]] = None,
         bs4_parser: Optional[str] = BS4_PARSER,
         return_similar_results: Optional[bool] = False,
         delay_config: Optional[DelayConfig] = None,
         proxy_config: Optional[ProxyConfig] = None,
+        session_config: Optional[SessionConfig] = None,
+        http_cache_config: Optional[HTTPCacheConfig] = None,
     ) -> None:
         """Init a config that determines how we will scrape jobs from Scrapers
         and how we will update CSV and filtering lists
@@ -55,6 +68,15 @@ class JobFunnelConfigManager(BaseConfig):
             no_scrape (Optional[bool], optional): If True, will not scrape data
                 at all, instead will only update filters and CSV. Defaults to
                 False.
+            max_concurrent_scrapers (Optional[int], optional): maximum number
+                of Scrapers (i.e. providers) to run at the same time. Each one
+                keeps its own delaying. Defaults to all providers at once.
+            duplicate_engine (Optional[DuplicateEngine], optional): how to
+                detect jobs which are duplicates by their description.
+                Defaults to DEFAULT_DUPLICATE_ENGINE.
+            export_formats (Optional[List[ExportFormat]], optional): formats to
+                also export the master list of jobs to, next to the master CSV.
+                Defaults to DEFAULT_EXPORT_FORMATS.
             bs4_parser (Optional[str], optional): the parser to use for BS4.
             return_similar_resuts (Optional[bool], optional): If True, we will
                 ask the job provider to provide more loosely-similar results for
@@ -63,6 +85,11 @@ class JobFunnelConfigManager(BaseConfig):
                 Defaults to a default delay config object.
             proxy_config (Optional[ProxyConfig], optional): proxy config object.
                  Defaults to None, which will result in no proxy being used
+            session_config (Optional[SessionConfig], optional): HTTP session
+                config object. Defaults to a default session config object.
+            http_cache_config (Optional[HTTPCacheConfig], optional): HTTP
+                response cache config object. Defaults to a default HTTP cache
+                config object.
         """
         super().__init__()
         self.master_csv_file = master_csv_file
@@ -73,6 +100,9 @@ class JobFunnelConfigManager(BaseConfig):
         self.log_file = log_file
         self.log_level = log_level
         self.no_scrape = no_scrape
+        self.max_concurrent_scrapers = max_concurrent_scrapers
+        self.duplicate_engine = duplicate_engine
+        self.export_formats = list(export_formats or DEFAULT_EXPORT_FORMATS)
         self.bs4_parser = bs4_parser  # NOTE: this is not currently configurable
         self.return_similar_results = return_similar_results
         if not delay_config:
@@ -81,6 +111,8 @@ class JobFunnelConfigManager(BaseConfig):
         else:
             self.delay_config = delay_config
         self.proxy_config = proxy_config
+        self.session_config = session_config or SessionConfig()
+        self.http_cache_config = http_cache_config or HTTPCacheConfig()
 
     @property
     def scrapers(self) -> List["BaseScraper"]:
@@ -120,7 +152,15 @@ class JobFunnelConfigManager(BaseConfig):
         TODO: impl. more validation here
         """
         assert os.path.exists(self.cache_folder)
+        assert self.max_concurrent_scrapers >= 1, "Must run at least one scraper"
         self.search_config.validate()
         if self.proxy_config:
             self.proxy_config.validate()
         self.delay_config.validate()
+        self.session_config.validate()
+        self.http_cache_config.validate()
+        if ExportFormat.PARQUET in self.export_formats and not find_spec("pyarrow"):
+            raise ValueError(
+                "Exporting to PARQUET requires pyarrow, please install it with: "
+                "pip install jobfunnel[parquet]"
+            )
@@ -1,6 +1,8 @@
 """Object to contain job query metadata
 """
 
+from hashlib import sha256
+import json
 from typing import List, Optional
 
 from jobfunnel.config import BaseConfig
@@ -77,6 +79,24 @@ class SearchConfig(BaseConfig):
         """User-readable version of the keywords we are searching with for CSV"""
         return " ".join(self.keywords)
 
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the search we make, identifies its scraped jobs
+
+        NOTE: max_listing_days and blocked_company_names only filter the jobs
+            we get, so searches which differ by them have the same fingerprint.
+        """
+        search = {
+            "keywords": self.keywords,
+            "locale": self.locale.name,
+            "province_or_state": self.province_or_state,
+            "city": self.city,
+            "radius": self.radius,
+            "remoteness": self.remoteness.name if self.remoteness else None,
+            "providers": sorted(provider.name for provider in self.providers),
+        }
+        return sha256(json.dumps(search, sort_keys=True).encode()).hexdigest()
+
     def validate(self):
         """We need to have the right information set, not mixing stuff"""
         assert self.province_or_state is not None, "Province/State not set"
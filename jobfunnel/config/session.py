@@ -0,0 +1,60 @@
+"""Simple config object to contain the HTTP session configuration
+"""
+
+from importlib.util import find_spec
+
+from jobfunnel.config.base import BaseConfig
+from jobfunnel.resources import ScrapeEngine
+from jobfunnel.resources.defaults import (
+    DEFAULT_HTTP_POOL_CONNECTIONS,
+    DEFAULT_HTTP_POOL_MAXSIZE,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_SCRAPE_ENGINE,
+)
+
+
+class SessionConfig(BaseConfig):
+    """Simple config object to contain the HTTP session configuration"""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_HTTP_POOL_MAXSIZE,
+        engine: ScrapeEngine = DEFAULT_SCRAPE_ENGINE,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """HTTP Session Configuration for GET and POST requests
+
+        Args:
+            pool_connections (int, optional): number of per-host connection
+                pools each provider's session keeps alive.
+                Defaults to DEFAULT_HTTP_POOL_CONNECTIONS.
+            pool_maxsize (int, optional): max number of keep-alive connections
+                in each per-host pool, SessionPool raises it to the number of
+                requests a scraper can have in flight if it is lower.
+                Defaults to DEFAULT_HTTP_POOL_MAXSIZE.
+            engine (ScrapeEngine, optional): whether to scrape job pages with a
+                pool of threads or with an asyncio event loop (needs aiohttp).
+                Defaults to DEFAULT_SCRAPE_ENGINE.
+            max_concurrent_requests (int, optional): max number of requests in
+                flight per provider when engine is ScrapeEngine.ASYNCIO.
+                Defaults to DEFAULT_MAX_CONCURRENT_REQUESTS.
+        """
+        super().__init__()
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.engine = engine
+        self.max_concurrent_requests = max_concurrent_requests
+
+    def validate(self) -> None:
+        if self.pool_connections < 1:
+            raise ValueError("Session must be able to pool at least 1 host.")
+        if self.pool_maxsize < 1:
+            raise ValueError("Session must be able to pool at least 1 connection.")
+        if self.max_concurrent_requests < 1:
+            raise ValueError("Session must allow at least 1 concurrent request.")
+        if self.engine == ScrapeEngine.ASYNCIO and not find_spec("aiohttp"):
+            raise ValueError(
+                "The ASYNCIO scrape engine requires aiohttp, please install it "
+                "with: pip install jobfunnel[async]"
+            )
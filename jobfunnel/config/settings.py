@@ -8,22 +8,37 @@ from cerberus import Validator
 from jobfunnel.resources import (
     LOG_LEVEL_NAMES,
     DelayAlgorithm,
+    DuplicateEngine,
+    ExportFormat,
     Locale,
+    PageKind,
     Provider,
     Remoteness,
+    ScrapeEngine,
 )
 from jobfunnel.resources.defaults import (
     DEFAULT_COMPANY_BLOCK_LIST,
     DEFAULT_DELAY_ALGORITHM,
     DEFAULT_DELAY_MAX_DURATION,
     DEFAULT_DELAY_MIN_DURATION,
+    DEFAULT_DUPLICATE_ENGINE,
+    DEFAULT_EXPORT_FORMATS,
+    DEFAULT_HTTP_CACHE_ENABLED,
+    DEFAULT_HTTP_CACHE_JOB_TTL,
+    DEFAULT_HTTP_CACHE_LISTING_TTL,
+    DEFAULT_HTTP_CACHE_MAX_SIZE_MB,
+    DEFAULT_HTTP_POOL_CONNECTIONS,
+    DEFAULT_HTTP_POOL_MAXSIZE,
     DEFAULT_LOG_LEVEL_NAME,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_SCRAPERS,
     DEFAULT_MAX_LISTING_DAYS,
     DEFAULT_PROVIDERS,
     DEFAULT_RANDOM_CONVERGING_DELAY,
     DEFAULT_RANDOM_DELAY,
     DEFAULT_REMOTENESS,
     DEFAULT_RETURN_SIMILAR_RESULTS,
+    DEFAULT_SCRAPE_ENGINE,
     DEFAULT_SEARCH_RADIUS,
 )
 
@@ -58,6 +73,23 @@ SETTINGS_YAML_SCHEMA = {
         "allowed": LOG_LEVEL_NAMES,
         "default": DEFAULT_LOG_LEVEL_NAME,
     },
+    "max_concurrent_scrapers": {
+        "required": False,
+        "type": "integer",
+        "min": 1,
+        "default": DEFAULT_MAX_CONCURRENT_SCRAPERS,
+    },
+    "duplicate_engine": {
+        "required": False,
+        "allowed": [e.name for e in DuplicateEngine],
+        "default": DEFAULT_DUPLICATE_ENGINE.name,
+    },
+    "export_formats": {
+        "required": False,
+        "type": "list",
+        "allowed": [f.name for f in ExportFormat],
+        "default": [f.name for f in DEFAULT_EXPORT_FORMATS],
+    },
     "search": {
         "type": "dict",
         "required": True,
@@ -143,6 +175,77 @@ SETTINGS_YAML_SCHEMA = {
             },
         },
     },
+    "session": {
+        "type": "dict",
+        "required": False,
+        "default": {},
+        "schema": {
+            "pool_connections": {
+                "required": False,
+                "type": "integer",
+                "min": 1,
+                "default": DEFAULT_HTTP_POOL_CONNECTIONS,
+            },
+            "pool_maxsize": {
+                "required": False,
+                "type": "integer",
+                "min": 1,
+                "default": DEFAULT_HTTP_POOL_MAXSIZE,
+            },
+            "engine": {
+                "required": False,
+                "allowed": [e.name for e in ScrapeEngine],
+                "default": DEFAULT_SCRAPE_ENGINE.name,
+            },
+            "max_concurrent_requests": {
+                "required": False,
+                "type": "integer",
+                "min": 1,
+                "default": DEFAULT_MAX_CONCURRENT_REQUESTS,
+            },
+        },
+    },
+    "http_cache": {
+        "type": "dict",
+        "required": False,
+        "default": {},
+        "schema": {
+            "enabled": {
+                "required": False,
+                "type": "boolean",
+                "default": DEFAULT_HTTP_CACHE_ENABLED,
+            },
+            "max_size_mb": {
+                "required": False,
+                "type": "number",
+                "check_with": "positive",
+                "default": DEFAULT_HTTP_CACHE_MAX_SIZE_MB,
+            },
+            "listing_ttl": {
+                "required": False,
+                "type": "number",
+                "min": 0,
+                "default": DEFAULT_HTTP_CACHE_LISTING_TTL,
+            },
+            "job_ttl": {
+                "required": False,
+                "type": "number",
+                "min": 0,
+                "default": DEFAULT_HTTP_CACHE_JOB_TTL,
+            },
+            "provider_ttls": {
+                "required": False,
+                "type": "dict",
+                "default": {},
+                "keysrules": {"allowed": [p.name for p in Provider]},
+                "valuesrules": {
+                    "type": "dict",
+                    "keysrules": {"allowed": [k.name for k in PageKind]},
+                    "valuesrules": {"type": "number", "min": 0},
+                },
+            },
+        },
+    },
     "proxy": {
         "type": "dict",
         "required": False,
@@ -182,5 +285,12 @@ class JobFunnelSettingsValidator(Validator):
         except Exception:
             self._error(value, "Not a valid IPv4 address")
 
+    def _check_with_positive(self, field, value):
+        """
+        checks that the given number is > 0, i.e. unlike min: 0
+        """
+        if value <= 0:
+            self._error(field, "must be greater than 0")
+
 
 SettingsValidator = JobFunnelSettingsValidator(SETTINGS_YAML_SCHEMA)
@@ -1,20 +1,32 @@
 from jobfunnel.resources.enums import (
     DelayAlgorithm,
+    DuplicateEngine,
     DuplicateType,
+    ExportFormat,
     JobField,
     JobStatus,
     Locale,
+    PageKind,
     Provider,
     Remoteness,
+    ScrapeEngine,
 )
 from jobfunnel.resources.resources import (
     BS4_PARSER,
     CSV_HEADER,
     DEFAULT_MAX_TFIDF_SIMILARITY,
+    KEY_ID_FILTER_FALSE_POSITIVE_RATE,
     LOG_LEVEL_NAMES,
     MAX_BLOCK_LIST_DESC_CHARS,
     MAX_CPU_WORKERS,
+    MAX_QUEUED_JOB_SOUPS,
+    MAX_SIMILARITY_BLOCK_SIZE,
     MIN_DESCRIPTION_CHARS,
+    MIN_KEY_ID_FILTER_CAPACITY,
+    MINHASH_BANDS,
+    MINHASH_PERMUTATIONS,
+    MINHASH_SHINGLE_SIZE,
+    MIN_JOBS_FOR_JOB_TABLE,
     MIN_JOBS_TO_PERFORM_SIMILARITY_SEARCH,
     PRINTABLE_STRINGS,
     T_NOW,
@@ -28,9 +40,17 @@ __all__ = [
     "LOG_LEVEL_NAMES",
     "MIN_DESCRIPTION_CHARS",
     "MAX_CPU_WORKERS",
+    "MAX_QUEUED_JOB_SOUPS",
+    "MIN_JOBS_FOR_JOB_TABLE",
     "MIN_JOBS_TO_PERFORM_SIMILARITY_SEARCH",
     "MAX_BLOCK_LIST_DESC_CHARS",
     "DEFAULT_MAX_TFIDF_SIMILARITY",
+    "MAX_SIMILARITY_BLOCK_SIZE",
+    "MINHASH_PERMUTATIONS",
+    "MINHASH_BANDS",
+    "MINHASH_SHINGLE_SIZE",
+    "KEY_ID_FILTER_FALSE_POSITIVE_RATE",
+    "MIN_KEY_ID_FILTER_CAPACITY",
     "BS4_PARSER",
     "T_NOW",
     "PRINTABLE_STRINGS",
@@ -42,6 +62,10 @@ __all__ = [
     "JobField",
     "Remoteness",
     "DuplicateType",
+    "DuplicateEngine",
+    "ExportFormat",
     "Provider",
     "DelayAlgorithm",
+    "ScrapeEngine",
+    "PageKind",
 ]
@@ -2,7 +2,15 @@
 NOTE: Not all defaults here are used, as we rely on YAML for demo and not kwargs
 """
 
-from jobfunnel.resources.enums import DelayAlgorithm, Locale, Provider, Remoteness
+from jobfunnel.resources.enums import (
+    DelayAlgorithm,
+    DuplicateEngine,
+    Locale,
+    Provider,
+    Remoteness,
+    ScrapeEngine,
+)
+from jobfunnel.resources.resources import MAX_CPU_WORKERS
 
 DEFAULT_LOG_LEVEL_NAME = "INFO"
 DEFAULT_LOCALE = Locale.CANADA_ENGLISH
@@ -22,6 +30,17 @@ DEFAULT_RETURN_SIMILAR_RESULTS = False
 DEFAULT_RANDOM_DELAY = False
 DEFAULT_RANDOM_CONVERGING_DELAY = False
 DEFAULT_REMOTENESS = Remoteness.ANY
+DEFAULT_MAX_CONCURRENT_SCRAPERS = len(Provider)  # i.e. all providers at once
+DEFAULT_DUPLICATE_ENGINE = DuplicateEngine.TFIDF
+DEFAULT_EXPORT_FORMATS = []  # i.e. only write the master CSV
+DEFAULT_HTTP_POOL_CONNECTIONS = MAX_CPU_WORKERS
+DEFAULT_HTTP_POOL_MAXSIZE = MAX_CPU_WORKERS  # one connection per scrape worker
+DEFAULT_SCRAPE_ENGINE = ScrapeEngine.THREADS
+DEFAULT_MAX_CONCURRENT_REQUESTS = 100  # only used by ScrapeEngine.ASYNCIO
+DEFAULT_HTTP_CACHE_ENABLED = False  # i.e. a re-run could miss new listings
+DEFAULT_HTTP_CACHE_MAX_SIZE_MB = 256
+DEFAULT_HTTP_CACHE_LISTING_TTL = 60 * 60  # seconds, search results change often
+DEFAULT_HTTP_CACHE_JOB_TTL = 24 * 60 * 60  # seconds
 
 # Defaults we use from localization, the scraper can always override it.
 DEFAULT_DOMAIN_FROM_LOCALE = {
@@ -77,6 +77,22 @@ class DuplicateType(Enum):
     KEY_ID = 0
     EXISTING_TFIDF = 1
     NEW_TFIDF = 2
+    NEW_MINHASH = 3
+    LISTING = 4  # i.e. another provider's copy of a listing we kept
+
+
+class DuplicateEngine(Enum):
+    """How we detect jobs which are duplicates by their description"""
+
+    TFIDF = 1  # cosine similarity of every incoming vs. every existing job
+    MINHASH = 2  # LSH candidates, verified by Jaccard similarity of shingles
+
+
+class ExportFormat(Enum):
+    """Formats we can export the master list of jobs to, alongside the CSV"""
+
+    SQLITE = 1  # a table keyed by key_id
+    PARQUET = 2  # columnar, needs pyarrow
 
 
 class Provider(Enum):
@@ -93,3 +109,17 @@ class DelayAlgorithm(Enum):
     CONSTANT = 1
     SIGMOID = 2
     LINEAR = 3
+
+
+class ScrapeEngine(Enum):
+    """Concurrency model used to scrape the individual job pages"""
+
+    THREADS = 1
+    ASYNCIO = 2
+
+
+class PageKind(Enum):
+    """Kinds of pages we request, NOTE: we cache each kind for different TTLs"""
+
+    LISTING = 1  # search results pages (or the requests we make to get them)
+    JOB = 2  # an individual job's own page
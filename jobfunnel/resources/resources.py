@@ -28,9 +28,17 @@ LOG_LEVEL_NAMES = ["CRITICAL", "FATAL", "ERROR", "WARNING", "INFO", "DEBUG", "NO
 
 MIN_DESCRIPTION_CHARS = 5  # If Job.description is less than this we fail valid.
 MAX_CPU_WORKERS = 8  # Maximum num threads we use when scraping
+MAX_QUEUED_JOB_SOUPS = 100  # Max. listings waiting to be scraped, per scraper
 MIN_JOBS_TO_PERFORM_SIMILARITY_SEARCH = 25  # Minimum # of jobs we need to TFIDF
 MAX_BLOCK_LIST_DESC_CHARS = 150  # Maximum len of description in block_list JSON
 DEFAULT_MAX_TFIDF_SIMILARITY = 0.75  # Maximum similarity between job text TFIDF
+MAX_SIMILARITY_BLOCK_SIZE = 2**22  # Max. # of TFIDF similarities computed at once
+MINHASH_PERMUTATIONS = 128  # Length of the MinHash signature of a job description
+MINHASH_BANDS = 32  # LSH bands per signature, i.e. candidates from ~0.42 Jaccard
+MINHASH_SHINGLE_SIZE = 3  # Words per shingle of a job description
+KEY_ID_FILTER_FALSE_POSITIVE_RATE = 0.01  # Of the block / duplicates Bloom filter
+MIN_KEY_ID_FILTER_CAPACITY = 10000  # Min. # of key_ids we size that filter for
+MIN_JOBS_FOR_JOB_TABLE = 500  # Min. # of jobs JobFilter.filter() filters as a table
 
 BS4_PARSER = "lxml"
 T_NOW = datetime.datetime.today()  # NOTE: use today so we only compare days
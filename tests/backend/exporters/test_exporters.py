@@ -0,0 +1,124 @@
+"""Test writing the master list of jobs to our exports and reading it back
+"""
+
+from datetime import date, datetime
+from importlib.util import find_spec
+import os
+from typing import Any, Dict, List
+
+import pytest
+
+from jobfunnel.backend import Job, JobStatus
+from jobfunnel.backend.exporters.base import EXPORT_COLUMNS
+from jobfunnel.backend.exporters.parquet import ParquetExporter
+from jobfunnel.backend.exporters.sqlite import SQLiteExporter
+from jobfunnel.backend.jobfunnel import JobFunnel
+from jobfunnel.resources import ExportFormat
+from tests.backend.test_jobfunnel import get_job, get_jobs
+from tests.conftest import get_config
+
+EXPORTERS = [
+    SQLiteExporter,
+    pytest.param(
+        ParquetExporter,
+        marks=pytest.mark.skipif(
+            not find_spec("pyarrow"), reason="PARQUET requires pyarrow"
+        ),
+    ),
+]
+
+
+def get_values(jobs: Dict[str, Job]) -> Dict[str, List[Any]]:
+    """Get the exported values of every job, with every date as a date"""
+    values = {}  # type: Dict[str, List[Any]]
+    for key_id, job in jobs.items():
+        values[key_id] = [getattr(job, column) for column in EXPORT_COLUMNS]
+        values[key_id] = [
+            value.date() if isinstance(value, datetime) else value
+            for value in values[key_id]
+        ]
+    return values
+
+
+def get_exporter(exporter_cls, folder) -> Any:
+    return exporter_cls(
+        os.path.join(str(folder), "master" + exporter_cls.file_extension),
+        os.path.join(str(folder), "log.log"),
+    )
+
+
+@pytest.mark.parametrize("exporter_cls", EXPORTERS)
+def test_exporter_read_missing(exporter_cls, tmp_path):
+    assert get_exporter(exporter_cls, tmp_path).read() == {}
+
+
+@pytest.mark.parametrize("exporter_cls", EXPORTERS)
+def test_exporter_write_read(exporter_cls, tmp_path):
+    """The jobs we read are the jobs we wrote, in the same order"""
+    jobs = get_jobs()
+    jobs["id0"].scrape_date = date(2020, 2, 1)
+    jobs["id1"].short_description = "A short description"
+    get_exporter(exporter_cls, tmp_path).write(jobs)
+
+    read_jobs = get_exporter(exporter_cls, tmp_path).read()
+
+    assert list(read_jobs) == list(jobs)
+    assert get_values(read_jobs) == get_values(jobs)
+    assert isinstance(read_jobs["id0"].post_date, datetime)
+    assert read_jobs["id0"].scrape_date == datetime(2020, 2, 1)
+
+
+@pytest.mark.parametrize("exporter_cls", EXPORTERS)
+def test_exporter_write_changed(exporter_cls, tmp_path):
+    """Writing the export again leaves it holding exactly the new jobs"""
+    exporter = get_exporter(exporter_cls, tmp_path)
+    jobs = get_jobs()
+    exporter.write(jobs)
+
+    jobs["id3"].status = JobStatus.APPLIED
+    jobs["id4"].tags = ["changed"]
+    del jobs["id5"]
+    jobs["new"] = get_job(100, key_id="new")
+    exporter.write(jobs)
+
+    read_jobs = exporter.read()
+    assert sorted(read_jobs) == sorted(jobs)
+    assert get_values(read_jobs) == get_values(jobs)
+
+
+def test_sqlite_exporter_write_only_changed(tmp_path):
+    """We only replace the rows of changed jobs and delete those of gone jobs"""
+    exporter = get_exporter(SQLiteExporter, tmp_path)
+    jobs = get_jobs()
+    exporter.write(jobs)
+    # pylint: disable=protected-access
+    n_changes = exporter._db.total_changes
+
+    exporter.write(jobs)
+    assert exporter._db.total_changes == n_changes
+
+    jobs["id3"].status = JobStatus.APPLIED
+    del jobs["id5"]
+    exporter.write(jobs)
+    assert exporter._db.total_changes == n_changes + 2
+
+
+def test_run_from_export(tmp_path):
+    """We only read the export instead of the master CSV if we are asked to"""
+    config = get_config(
+        str(tmp_path), export_formats=[ExportFormat.SQLITE], no_scrape=True
+    )
+    jobs = get_jobs()
+    for job in jobs.values():
+        job.post_date = date.today()  # i.e. so that we don't filter them away
+    JobFunnel(config).exporters[0].write(jobs)
+
+    funnel = JobFunnel(config)
+    funnel.run()
+    assert not funnel.master_jobs_dict
+    assert not os.path.isfile(config.master_csv_file)
+
+    funnel = JobFunnel(config)
+    funnel.run(from_export=True)
+    assert sorted(funnel.master_jobs_dict) == sorted(jobs)
+    assert sorted(JobFunnel(config).read_master_csv()) == sorted(jobs)
@@ -0,0 +1,276 @@
+"""Test the scrape engines of BaseScraper with a local job site
+"""
+
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import logging
+from threading import Thread, get_ident
+from typing import Any, Dict, List
+
+from bs4 import BeautifulSoup
+import pytest
+from requests import Session
+
+from jobfunnel.backend import Job
+from jobfunnel.backend.scrapers.base import BaseCANEngScraper
+from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.config import SessionConfig
+from jobfunnel.resources import DuplicateType, JobField, ScrapeEngine
+from tests.conftest import get_config
+
+N_JOBS = 12
+
+
+class JobPageHandler(BaseHTTPRequestHandler):
+    """Serves /job/<i> and records the requested paths on the server"""
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self.server.requested_paths.append(self.path)
+        body = f"<p>Description of {self.path}, a job page</p>".encode("utf8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class NoDelay:
+    """Rate limiter which never waits"""
+
+    def wait(self, url: str) -> None:
+        pass
+
+    async def wait_async(self, url: str) -> None:
+        pass
+
+
+class LocalScraper(BaseCANEngScraper):
+    """Scraper of the local job site, which fetch()es each job's own page in a
+    delayed set() like Monster and Glassdoor do.
+    """
+
+    headers = {}  # type: Dict[str, str]
+    job_get_fields = [
+        JobField.TITLE,
+        JobField.COMPANY,
+        JobField.LOCATION,
+        JobField.KEY_ID,
+        JobField.URL,
+        JobField.POST_DATE,
+    ]
+    job_set_fields = [JobField.RAW, JobField.DESCRIPTION]
+    high_priority_get_set_fields = [JobField.RAW]
+    delayed_get_set_fields = [JobField.RAW]
+
+    def __init__(self, site_url: str, *args: Any, **kwargs: Any) -> None:
+        self.site_url = site_url
+        self.get_set_threads = set()  # type: set
+        super().__init__(*args, **kwargs)
+
+    def get_job_soups_from_search_result_listings(self) -> List[Dict[str, str]]:
+        return [{"id": str(i)} for i in range(N_JOBS)]
+
+    def get(self, parameter: JobField, soup: Dict[str, str]) -> Any:
+        self.get_set_threads.add(get_ident())
+        if parameter == JobField.URL:
+            return f"{self.site_url}/job/{soup['id']}"
+        if parameter == JobField.KEY_ID:
+            return soup["id"]
+        if parameter == JobField.POST_DATE:
+            return date.today()
+        return f"{parameter.name.lower()} {soup['id']}"
+
+    def set(self, parameter: JobField, job: Job, soup: Dict[str, str]) -> None:
+        self.get_set_threads.add(get_ident())
+        if parameter == JobField.RAW:
+            job._raw_scrape_data = BeautifulSoup(self.fetch(job.url), "html.parser")
+        elif parameter == JobField.DESCRIPTION:
+            job.description = job._raw_scrape_data.text
+
+
+@pytest.fixture()
+def site_url():
+    """Serve the local job site for the duration of a test"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), JobPageHandler)
+    server.requested_paths = []
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", server.requested_paths
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("engine", [ScrapeEngine.THREADS, ScrapeEngine.ASYNCIO])
+def test_iter_jobs(engine, site_url, tmp_path):
+    """Every job is scraped once, from its own page, with either engine"""
+    if engine == ScrapeEngine.ASYNCIO:
+        pytest.importorskip("aiohttp")
+    url, requested_paths = site_url
+    config = get_config(
+        str(tmp_path),
+        session_config=SessionConfig(engine=engine, max_concurrent_requests=4),
+    )
+    scraper = LocalScraper(
+        url,
+        Session(),
+        config,
+        JobFilter(log_file=config.log_file, log_level=logging.WARNING),
+        rate_limiter=NoDelay(),
+    )
+
+    jobs = scraper.scrape()
+
+    assert sorted(jobs) == sorted(f"LocalScraper_{i}" for i in range(N_JOBS))
+    for i in range(N_JOBS):
+        assert jobs[f"LocalScraper_{i}"].description == (
+            f"Description of /job/{i}, a job page"
+        )
+    # i.e. set() read the prefetched page rather than getting it again
+    assert sorted(requested_paths) == sorted(f"/job/{i}" for i in range(N_JOBS))
+    assert scraper._prefetched_pages == {}
+
+
+def test_iter_jobs_async_get_set_off_loop(site_url, tmp_path):
+    """The asyncio engine runs get() and set() in worker threads, never on the
+    thread that runs the event loop (i.e. the thread iterating the jobs).
+    """
+    pytest.importorskip("aiohttp")
+    url, _ = site_url
+    config = get_config(
+        str(tmp_path),
+        session_config=SessionConfig(
+            engine=ScrapeEngine.ASYNCIO, max_concurrent_requests=4
+        ),
+    )
+    scraper = LocalScraper(
+        url,
+        Session(),
+        config,
+        JobFilter(log_file=config.log_file, log_level=logging.WARNING),
+        rate_limiter=NoDelay(),
+    )
+
+    assert len(scraper.scrape()) == N_JOBS
+    assert scraper.get_set_threads
+    assert get_ident() not in scraper.get_set_threads
+
+
+class OtherLocalScraper(LocalScraper):
+    """Another provider, which lists the same jobs as LocalScraper but never
+    waits for a request slot, like Indeed.
+    """
+
+    delayed_get_set_fields = []  # type: List[JobField]
+
+
+class BrokenLocalScraper(LocalScraper):
+    """Another provider, which lists the same jobs but fails to scrape job 0"""
+
+    def set(self, parameter: JobField, job: Job, soup: Dict[str, str]) -> None:
+        super().set(parameter, job, soup)
+        if parameter == JobField.DESCRIPTION and soup["id"] == "0":
+            job.description = ""  # i.e. it fails validation
+
+
+def get_scrapers(url: str, config, *scraper_classes: type) -> List[LocalScraper]:
+    """Get scrapers of the local job site which share a JobFilter"""
+    job_filter = JobFilter(log_file=config.log_file, log_level=logging.WARNING)
+    return [
+        scraper_class(url, Session(), config, job_filter, rate_limiter=NoDelay())
+        for scraper_class in scraper_classes
+    ]
+
+
+def test_iter_jobs_claimed_listings(site_url, tmp_path):
+    """A provider doesn't scrape the listings another provider already has, we
+    list them as duplicates once we know we kept the other provider's jobs.
+    """
+    url, requested_paths = site_url
+    scrapers = get_scrapers(
+        url, get_config(str(tmp_path)), LocalScraper, OtherLocalScraper
+    )
+    job_filter = scrapers[0].job_filter
+    jobs = scrapers[0].scrape()
+
+    assert scrapers[1].scrape() == {}
+    assert len(requested_paths) == N_JOBS
+    assert not job_filter.duplicate_jobs_dict  # i.e. not until we keep jobs
+
+    del jobs["LocalScraper_0"]  # i.e. filtered away
+    assert job_filter.find_duplicates({}, jobs) == []
+    assert sorted(job_filter.duplicate_jobs_dict) == sorted(
+        f"OtherLocalScraper_{i}" for i in range(1, N_JOBS)
+    )
+    assert job_filter.duplicate_jobs_dict["OtherLocalScraper_1"]["title"] == (
+        jobs["LocalScraper_1"].title
+    )
+
+
+def test_iter_jobs_claimed_listings_order(site_url, tmp_path):
+    """The same provider keeps the listings whichever provider scrapes first"""
+    url, _ = site_url
+    scrapers = get_scrapers(
+        url, get_config(str(tmp_path)), OtherLocalScraper, LocalScraper
+    )
+    job_filter = scrapers[0].job_filter
+    jobs = scrapers[0].scrape()
+    jobs.update(scrapers[1].scrape())
+    assert len(jobs) == 2 * N_JOBS  # i.e. LocalScraper claimed them back
+
+    duplicate_jobs = job_filter.find_duplicates({}, jobs)
+
+    assert sorted(
+        (j.original.key_id, j.duplicate.key_id, j.type) for j in duplicate_jobs
+    ) == sorted(
+        (f"LocalScraper_{i}", f"OtherLocalScraper_{i}", DuplicateType.LISTING)
+        for i in range(N_JOBS)
+    )
+    assert sorted(job_filter.duplicate_jobs_dict) == sorted(
+        f"OtherLocalScraper_{i}" for i in range(N_JOBS)
+    )
+
+
+def test_iter_jobs_claimed_listings_failed(site_url, tmp_path):
+    """If the provider that claimed a listing fails to scrape it, another
+    provider scrapes its copy instead.
+    """
+    url, _ = site_url
+    scrapers = get_scrapers(
+        url, get_config(str(tmp_path)), BrokenLocalScraper, LocalScraper
+    )
+
+    assert len(scrapers[0].scrape()) == N_JOBS - 1
+    assert list(scrapers[1].scrape()) == ["LocalScraper_0"]
+
+
+class EarlyDelayScraper(LocalScraper):
+    """Scraper with a delayed get() before it has got the job's url"""
+
+    delayed_get_set_fields = [JobField.TITLE, JobField.RAW]
+
+    @property
+    def job_init_kwargs(self) -> Dict[JobField, Any]:
+        job_init_kwargs = super().job_init_kwargs
+        del job_init_kwargs[JobField.URL]  # i.e. it has no default
+        return job_init_kwargs
+
+
+@pytest.mark.parametrize("engine", [ScrapeEngine.THREADS, ScrapeEngine.ASYNCIO])
+def test_iter_jobs_delayed_get_before_url(engine, site_url, tmp_path):
+    """A delayed get() before we have the job's url doesn't fail the scrape"""
+    if engine == ScrapeEngine.ASYNCIO:
+        pytest.importorskip("aiohttp")
+    url, _ = site_url
+    config = get_config(str(tmp_path), session_config=SessionConfig(engine=engine))
+    scraper = EarlyDelayScraper(
+        url,
+        Session(),
+        config,
+        JobFilter(log_file=config.log_file, log_level=logging.WARNING),
+        rate_limiter=NoDelay(),
+    )
+
+    assert len(scraper.scrape()) == N_JOBS
@@ -0,0 +1,78 @@
+"""Test the Monster scraper's search results pages
+"""
+
+import logging
+from typing import Any, List
+from urllib.parse import parse_qs, urlsplit
+
+from requests import Session
+
+from jobfunnel.backend.scrapers.monster import (
+    MAX_RESULTS_PER_MONSTER_PAGE,
+    MonsterScraperCANEng,
+)
+from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.resources import JobField
+from tests.conftest import get_config
+
+N_RESULTS = 4 * MAX_RESULTS_PER_MONSTER_PAGE + 3  # i.e. 5 pages, last one short
+
+
+class FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class FakeMonsterSession(Session):
+    """Serves endless-scroll search results pages, which list the results of
+    every page up to and including the requested one.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requested_urls: List[str] = []
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.requested_urls.append(url)
+        page = int(parse_qs(urlsplit(url).query).get("page", ["1"])[0])
+        listings = "".join(
+            '<div class="flex-row"><h2 class="title">'
+            f'<a data-m_impr_j_postingid="posting{i}">Job {i}</a></h2></div>'
+            for i in range(min(page * MAX_RESULTS_PER_MONSTER_PAGE, N_RESULTS))
+        )
+        return FakeResponse(
+            f'<h2 class="figure">({N_RESULTS} Jobs Found)</h2>{listings}'
+        )
+
+
+class RecordingRateLimiter:
+    """Rate limiter which records the urls it was asked to wait for"""
+
+    def __init__(self) -> None:
+        self.waited_urls: List[str] = []
+
+    def wait(self, url: str) -> None:
+        self.waited_urls.append(url)
+
+
+def test_iter_job_soups_from_search_result_listings(tmp_path):
+    """We get every results page up to and including the last one, once each,
+    and wait for a request slot before every one of them.
+    """
+    config = get_config(str(tmp_path))
+    session = FakeMonsterSession()
+    rate_limiter = RecordingRateLimiter()
+    scraper = MonsterScraperCANEng(
+        session,
+        config,
+        JobFilter(log_file=config.log_file, log_level=logging.WARNING),
+        rate_limiter=rate_limiter,
+    )
+
+    job_soups = list(scraper.iter_job_soups_from_search_result_listings())
+
+    key_ids = [scraper.get(JobField.KEY_ID, job_soup) for job_soup in job_soups]
+    assert sorted(key_ids) == sorted(f"posting{i}" for i in range(N_RESULTS))
+    assert len(session.requested_urls) == 5
+    assert len(set(session.requested_urls)) == 5
+    assert sorted(rate_limiter.waited_urls) == sorted(session.requested_urls)
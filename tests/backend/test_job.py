@@ -0,0 +1,89 @@
+"""Test pickling the Job, including jobs pickled before it had __slots__
+"""
+
+import copyreg
+from datetime import date, datetime
+import io
+import pickle
+from sys import intern
+from typing import Any, Dict
+
+import pytest
+
+from jobfunnel.backend import Job, JobStatus
+from jobfunnel.resources import Locale, Remoteness
+
+# i.e. every attrib the Job had in its __dict__ before it had __slots__
+BASELINE_STATE = {
+    "title": "Python Developer",
+    "company": "Company",
+    "location": "Waterloo, ON",
+    "description": "We are looking for a Python developer.",
+    "key_id": "id0",
+    "url": "https://www.example.com/job/0",
+    "locale": Locale.CANADA_ENGLISH,
+    "query": "Python",
+    "provider": "IndeedScraperCANEng",
+    "status": JobStatus.APPLIED,
+    "wage": "$100,000",
+    "remoteness": Remoteness.FULLY_REMOTE,
+    "post_date": date(2020, 1, 1),
+    "scrape_date": datetime(2020, 1, 2, 3, 4, 5),
+    "tags": ["python", "remote"],
+    "short_description": "A short description",
+    "_raw_scrape_data": None,
+}  # type: Dict[str, Any]
+
+
+class BaselinePickler(pickle.Pickler):
+    """Pickle a Job as we did before it had __slots__, i.e. as its __dict__"""
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, Job):
+            return copyreg.__newobj__, (Job,), dict(BASELINE_STATE)
+        return NotImplemented
+
+
+def get_job() -> Job:
+    kwargs = dict(BASELINE_STATE)
+    kwargs["raw"] = kwargs.pop("_raw_scrape_data")
+    return Job(**kwargs)
+
+
+def get_state(job: Job) -> Dict[str, Any]:
+    return {attr: getattr(job, attr) for attr in Job.__slots__}
+
+
+def test_job_slots():
+    """The Job has exactly the attribs it had before, and no __dict__"""
+    assert sorted(Job.__slots__) == sorted(BASELINE_STATE)
+    assert not hasattr(get_job(), "__dict__")
+
+
+@pytest.mark.parametrize("protocol", [2, pickle.HIGHEST_PROTOCOL])
+def test_job_unpickle_baseline(protocol):
+    """A Job pickled as a __dict__ unpickles with every attrib, interned"""
+    outfile = io.BytesIO()
+    BaselinePickler(outfile, protocol).dump({"id0": get_job()})
+
+    job = pickle.loads(outfile.getvalue())["id0"]
+
+    assert isinstance(job, Job)
+    assert get_state(job) == BASELINE_STATE
+    assert job.location is intern("Waterloo, ON")
+    assert job.query is intern("Python")
+    assert job.provider is intern("IndeedScraperCANEng")
+    assert all(tag is intern(tag) for tag in job.tags)
+
+
+@pytest.mark.parametrize("protocol", [2, pickle.HIGHEST_PROTOCOL])
+def test_job_pickle_round_trip(protocol):
+    """A Job survives a round trip through pickle with every attrib"""
+    job = get_job()
+
+    unpickled = pickle.loads(pickle.dumps({"id0": job}, protocol))["id0"]
+
+    assert unpickled is not job
+    assert get_state(unpickled) == get_state(job) == BASELINE_STATE
+    assert not hasattr(unpickled, "__dict__")
+    assert unpickled.provider is intern("IndeedScraperCANEng")
@@ -0,0 +1,144 @@
+"""Test filtering jobs as a JobTable, which must agree with filterable()
+"""
+
+from datetime import datetime
+import logging
+from typing import Dict
+
+import numpy as np
+import pytest
+
+from jobfunnel.backend import Job, JobStatus, JobTable
+from jobfunnel.backend.tools.bloom import BloomFilter
+from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.backend.tools.job_list import JobList
+from jobfunnel.resources import Remoteness
+from tests.backend.test_jobfunnel import get_job
+
+N_JOBS = 200
+
+
+def get_jobs(n_jobs: int = N_JOBS) -> Dict[str, Job]:
+    """Get jobs with every status, remoteness and some unset attribs"""
+    jobs = {}
+    for i in range(n_jobs):
+        job = get_job(
+            i,
+            company=f"Company {i % 7}",
+            status=list(JobStatus)[i % len(JobStatus)],
+            remoteness=list(Remoteness)[i % len(Remoteness)],
+            post_date=datetime(2020, 1, 1 + i % 28),
+        )
+        if i % 11 == 0:
+            job.post_date = None
+        if i % 13 == 0:
+            job.status = None
+        if i % 17 == 0:
+            job.remoteness = None
+        if i % 19 == 0:
+            job.key_id = "" if i % 2 else None
+        jobs[f"row{i}"] = job
+    return jobs
+
+
+def get_list(tmp_path, name: str, key_ids, use_job_list: bool):
+    """The block or duplicates list, as a JobList or as a dict"""
+    entries = {key_id: {"key_id": key_id} for key_id in key_ids}
+    if not use_job_list:
+        return entries
+    job_list = JobList(
+        str(tmp_path / f"{name}.json"), str(tmp_path / "log.log"), logging.WARNING
+    )
+    job_list.update(entries)
+    return job_list
+
+
+def get_job_filter(tmp_path, use_job_list: bool, **kwargs) -> JobFilter:
+    block_list = get_list(
+        tmp_path, "block_list", [f"id{i}" for i in range(0, N_JOBS, 3)], use_job_list
+    )
+    duplicates_list = get_list(
+        tmp_path,
+        "duplicates_list",
+        [f"id{i}" for i in range(1, N_JOBS, 5)],
+        use_job_list,
+    )
+    if use_job_list:
+        key_id_filter = BloomFilter.build(list(block_list) + list(duplicates_list), 200)
+        block_list.key_id_filter = key_id_filter
+        duplicates_list.key_id_filter = key_id_filter
+    kwargs.setdefault("max_job_date", datetime(2020, 1, 10))
+    kwargs.setdefault("desired_remoteness", Remoteness.FULLY_REMOTE)
+    return JobFilter(
+        block_list,
+        duplicates_list,
+        ["Company 3", "Company 5"],
+        log_level=logging.WARNING,
+        log_file=str(tmp_path / "log.log"),
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("use_job_list", [True, False])
+@pytest.mark.parametrize("check_existing_duplicates", [True, False])
+@pytest.mark.parametrize(
+    "filter_kwargs",
+    [
+        {},
+        {"max_job_date": None, "desired_remoteness": Remoteness.ANY},
+    ],
+)
+def test_get_filterable_mask(
+    tmp_path, use_job_list, check_existing_duplicates, filter_kwargs
+):
+    """The mask of a table is filterable() of every job in it"""
+    job_filter = get_job_filter(tmp_path, use_job_list, **filter_kwargs)
+    jobs = get_jobs()
+
+    mask = job_filter.get_filterable_mask(
+        JobTable.from_dict(jobs), check_existing_duplicates
+    )
+
+    expected = [
+        job_filter.filterable(job, check_existing_duplicates) for job in jobs.values()
+    ]
+    assert 0 < sum(expected) < len(expected)
+    assert mask.tolist() == expected
+
+
+def test_get_filterable_mask_empty(tmp_path):
+    job_filter = get_job_filter(tmp_path, use_job_list=True)
+
+    mask = job_filter.get_filterable_mask(JobTable([]))
+
+    assert mask.dtype == bool and mask.shape == (0,)
+
+
+@pytest.mark.parametrize("use_job_list", [True, False])
+def test_filter_uses_job_table(tmp_path, monkeypatch, use_job_list):
+    """filter() filters min_job_table_size or more jobs as a JobTable, and
+    keeps the same jobs in the same order as filtering one job at a time.
+    """
+    jobs = get_jobs()
+    expected = get_job_filter(
+        tmp_path, use_job_list, min_job_table_size=N_JOBS + 1
+    ).filter(jobs)
+
+    job_filter = get_job_filter(tmp_path, use_job_list, min_job_table_size=N_JOBS)
+    # i.e. it does not filter one job at a time
+    monkeypatch.setattr(job_filter, "filterable", pytest.fail)
+    kept = job_filter.filter(jobs)
+
+    assert list(kept) == list(expected)
+    assert all(kept[key] is jobs[key] for key in kept)
+
+
+def test_job_table_has_key_id_where(tmp_path):
+    """We only look up the key_ids of the rows where is True"""
+    job_list = get_list(tmp_path, "block_list", ["id1", "id2", "id3"], True)
+    table = JobTable.from_dict({f"row{i}": get_job(i) for i in range(5)})
+    where = np.array([True, True, False, True, True])
+
+    assert np.flatnonzero(table.has_key_id(job_list)).tolist() == [1, 2, 3]
+    assert np.flatnonzero(table.has_key_id(job_list, where=where)).tolist() == [1, 3]
+    assert not table.has_key_id({}).any()
@@ -0,0 +1,324 @@
+"""Test merging the scrapers of JobFunnel and reading and writing the master CSV
+"""
+
+import csv
+from datetime import date, datetime
+import json
+import logging
+import os
+from threading import Event
+from typing import Any, Dict, Iterator
+
+import pytest
+
+from jobfunnel.backend import Job, JobStatus
+from jobfunnel.backend.jobfunnel import JobFunnel
+from jobfunnel.config import JobFunnelConfigManager
+from jobfunnel.resources import CSV_HEADER, Locale, Provider, Remoteness
+from tests.conftest import get_config
+
+N_JOBS = 20
+
+
+def get_job(i: int, **changes) -> Job:
+    kwargs = dict(
+        title=f"Python Developer {i}",
+        company=f"Company {i % 3}",
+        location="Waterloo, ON",
+        description=f"Job {i}, we are looking for a developer, " * 3,
+        url=f"https://www.example.com/job/{i}",
+        locale=Locale.CANADA_ENGLISH,
+        query="Python",
+        provider="IndeedScraperCANEng",
+        status=JobStatus.NEW,
+        key_id=f"id{i}",
+        post_date=date(2020, 1, 1 + i % 28),
+        tags=["python", "remote"] if i % 2 else [],
+        wage="$100,000" if i % 5 else "",
+        remoteness=Remoteness.FULLY_REMOTE if i % 4 else Remoteness.UNKNOWN,
+    )
+    kwargs.update(changes)
+    return Job(**kwargs)
+
+
+def get_jobs(n_jobs: int = N_JOBS) -> Dict[str, Job]:
+    return {f"id{i}": get_job(i) for i in range(n_jobs)}
+
+
+def get_rows(jobs: Dict[str, Job]) -> Dict[str, Dict[str, str]]:
+    return {key_id: job.as_row for key_id, job in jobs.items()}
+
+
+@pytest.fixture()
+def funnel(tmp_path):
+    return JobFunnel(get_config(str(tmp_path)))
+
+
+def write_fresh(funnel: JobFunnel, jobs: Dict[str, Job]) -> bytes:
+    """Get the CSV of jobs, written from scratch by another JobFunnel"""
+    folder = os.path.join(os.path.dirname(funnel.config.master_csv_file), "fresh")
+    JobFunnel(get_config(folder)).write_master_csv(jobs)
+    with open(os.path.join(folder, "master.csv"), "rb") as infile:
+        return infile.read()
+
+
+def read_bytes(funnel: JobFunnel) -> bytes:
+    with open(funnel.config.master_csv_file, "rb") as infile:
+        return infile.read()
+
+
+def test_read_master_csv(funnel):
+    """The jobs we read are the jobs we wrote, in the same order"""
+    jobs = get_jobs()
+    funnel.write_master_csv(jobs)
+
+    read_jobs = funnel.read_master_csv()
+
+    assert get_rows(read_jobs) == get_rows(jobs)
+    assert list(read_jobs) == list(jobs)
+    assert [job.as_row for job in funnel.iter_master_csv()] == list(
+        get_rows(jobs).values()
+    )
+
+
+def test_read_master_csv_edited(funnel):
+    """We read rows the user edited or wrote, i.e. in a spreadsheet"""
+    jobs = get_jobs(3)
+    rows = list(get_rows(jobs).values())
+    rows[0]["status"] = "applied"
+    rows[1]["status"] = "not a status"
+    rows[2]["locale"] = ""
+    with open(funnel.config.master_csv_file, "w", encoding="utf8") as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=CSV_HEADER, lineterminator="\n")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            outfile.write("\n")  # i.e. blank lines
+
+    read_jobs = funnel.read_master_csv()
+
+    assert list(read_jobs) == list(jobs)
+    assert read_jobs["id0"].status == JobStatus.APPLIED
+    assert read_jobs["id1"].status == JobStatus.UNKNOWN
+    assert read_jobs["id2"].locale == funnel.config.search_config.locale
+    # i.e. none of these rows can be copied as they are when we write them
+    assert not funnel._master_csv_rows  # pylint: disable=protected-access
+
+
+def test_write_master_csv_unchanged(funnel):
+    """Writing the jobs we read leaves the CSV as it was"""
+    jobs = get_jobs()
+    funnel.write_master_csv(jobs)
+    written = read_bytes(funnel)
+
+    funnel.write_master_csv(funnel.read_master_csv())
+
+    assert read_bytes(funnel) == written
+
+
+def test_write_master_csv_append(funnel):
+    """New jobs after the jobs we read are appended to the CSV"""
+    jobs = get_jobs()
+    funnel.write_master_csv(jobs)
+    written = read_bytes(funnel)
+    jobs = funnel.read_master_csv()
+
+    jobs["new"] = get_job(100, key_id="new")
+    funnel.write_master_csv(jobs)
+    assert read_bytes(funnel).startswith(written)
+    jobs["newer"] = get_job(101, key_id="newer")
+    funnel.write_master_csv(jobs)  # i.e. without reading it again
+
+    assert read_bytes(funnel).startswith(written)
+    assert read_bytes(funnel) == write_fresh(funnel, jobs)
+    assert get_rows(funnel.read_master_csv()) == get_rows(jobs)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        "status",
+        "description",
+        "delete",
+        "reorder",
+        "insert",
+    ],
+)
+def test_write_master_csv_changed(funnel, change):
+    """The CSV is the same as writing every job, whatever jobs changed"""
+    funnel.write_master_csv(get_jobs())
+    jobs = funnel.read_master_csv()
+
+    if change == "status":
+        jobs["id3"].status = JobStatus.APPLIED
+    elif change == "description":
+        jobs["id0"].description = "An entirely different description"
+    elif change == "delete":
+        del jobs["id5"]
+    elif change == "reorder":
+        jobs = dict(reversed(list(jobs.items())))
+    elif change == "insert":
+        jobs = {"new": get_job(100, key_id="new"), **jobs}
+    funnel.write_master_csv(jobs)
+
+    assert read_bytes(funnel) == write_fresh(funnel, jobs)
+
+    # i.e. the rows we kept track of while writing are right too
+    jobs["id1"].status = JobStatus.INTERVIEWING
+    funnel.write_master_csv(jobs)
+    assert read_bytes(funnel) == write_fresh(funnel, jobs)
+    assert get_rows(funnel.read_master_csv()) == get_rows(jobs)
+
+
+def test_write_master_csv_edited_since_read(funnel):
+    """If the user edited the CSV since we read it, we write every job"""
+    funnel.write_master_csv(get_jobs())
+    jobs = funnel.read_master_csv()
+    with open(funnel.config.master_csv_file, "ab") as outfile:
+        outfile.write(b"a row the user added\r\n")
+
+    jobs["new"] = get_job(100, key_id="new")
+    funnel.write_master_csv(jobs)
+
+    assert read_bytes(funnel) == write_fresh(funnel, jobs)
+
+
+class StubScraper:
+    """Scraper which yields N_JOBS jobs without making any requests"""
+
+    n_jobs = N_JOBS
+
+    def __init__(self, session: Any, config: Any, *args: Any) -> None:
+        self.session = session
+
+    def iter_jobs(self) -> Iterator[Job]:
+        name = self.__class__.__name__
+        for i in range(self.n_jobs):
+            yield get_job(i, key_id=f"{name}_{i}", provider=name)
+
+
+class FailingScraper(StubScraper):
+    """Scraper which raises after its first few jobs"""
+
+    n_jobs = 3
+
+    def iter_jobs(self) -> Iterator[Job]:
+        yield from super().iter_jobs()
+        raise ValueError("Unable to extract jobs from search result pages")
+
+
+class EndlessScraper(StubScraper):
+    """Scraper which keeps yielding jobs until it is stopped"""
+
+    n_jobs = 10**6
+    n_yielded = 0
+    stopped = Event()
+
+    def iter_jobs(self) -> Iterator[Job]:
+        try:
+            for job in super().iter_jobs():
+                EndlessScraper.n_yielded += 1
+                yield job
+        finally:
+            self.stopped.set()
+
+
+class ClashingScraper(StubScraper):
+    """Scraper which yields some of the key_ids of StubScraper"""
+
+    n_jobs = 3
+
+    def iter_jobs(self) -> Iterator[Job]:
+        for job in super().iter_jobs():
+            job.key_id = job.key_id.replace(self.__class__.__name__, "StubScraper")
+            yield job
+
+
+def use_scrapers(monkeypatch, funnel: JobFunnel, *scrapers: type) -> None:
+    """Make funnel run scrapers, as if they were the configured providers"""
+    funnel.config.search_config.providers = list(Provider)[: len(scrapers)]
+    monkeypatch.setattr(
+        JobFunnelConfigManager, "scrapers", property(lambda self: list(scrapers))
+    )
+
+
+def test_iter_scraped_jobs(monkeypatch, funnel):
+    """We get the jobs of every provider, even if another provider fails"""
+    use_scrapers(monkeypatch, funnel, StubScraper, FailingScraper)
+
+    jobs = funnel.scrape()
+
+    assert sorted(jobs) == sorted(
+        [f"StubScraper_{i}" for i in range(N_JOBS)]
+        + [f"FailingScraper_{i}" for i in range(FailingScraper.n_jobs)]
+    )
+    assert all(job.key_id == key_id for key_id, job in jobs.items())
+
+
+def test_iter_scraped_jobs_stop_early(monkeypatch, funnel):
+    """The scrapers stop once we stop iterating the jobs"""
+    use_scrapers(monkeypatch, funnel, StubScraper, EndlessScraper)
+    EndlessScraper.n_yielded = 0
+    EndlessScraper.stopped.clear()
+
+    scraped_jobs = funnel.iter_scraped_jobs()
+    next(scraped_jobs)
+    scraped_jobs.close()  # i.e. this waits for the scrapers to finish
+
+    assert EndlessScraper.stopped.is_set()
+    assert EndlessScraper.n_yielded < EndlessScraper.n_jobs
+
+
+def test_check_for_inter_scraper_validity(funnel, caplog):
+    """A job with the key_id of another provider's job is dropped, the job we
+    already had is kept, and we warn with both providers.
+    """
+    job_providers = {}  # type: Dict[str, str]
+    existing = get_job(0, provider="IndeedScraperCANEng")
+    incoming = get_job(0, provider="MonsterScraperCANEng")
+
+    # pylint: disable=protected-access
+    assert funnel._check_for_inter_scraper_validity(job_providers, existing)
+    with caplog.at_level(logging.WARNING, logger="JobFunnel"):
+        assert not funnel._check_for_inter_scraper_validity(job_providers, incoming)
+
+    assert job_providers == {"id0": "IndeedScraperCANEng"}
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert "Inter-scraper key-id duplicate! Dropping job id0" in message
+    assert "from MonsterScraperCANEng" in message
+    assert "a job from IndeedScraperCANEng" in message
+
+
+def test_iter_scraped_jobs_inter_scraper_duplicates(monkeypatch, funnel):
+    """We keep one job per key_id when two providers scrape the same key_ids"""
+    use_scrapers(monkeypatch, funnel, StubScraper, ClashingScraper)
+
+    jobs = list(funnel.iter_scraped_jobs())
+
+    assert sorted(job.key_id for job in jobs) == sorted(
+        f"StubScraper_{i}" for i in range(N_JOBS)
+    )
+    providers = {job.provider for job in jobs if job.key_id == "StubScraper_0"}
+    assert len(providers) == 1
+
+
+def test_export_lists_unblock(funnel):
+    """Removing a job from the exported block list stops blocking it"""
+    jobs = {f"id{i}": get_job(i, post_date=datetime.now()) for i in range(3)}
+    funnel.job_filter.user_block_jobs_dict.update(
+        {key_id: job.as_json_entry for key_id, job in jobs.items()}
+    )
+    funnel.export_lists()
+    block_list_file = funnel.config.user_block_list_file
+    with open(block_list_file, "r", encoding="utf8") as infile:
+        block_list = json.load(infile)
+    del block_list["id0"]
+    with open(block_list_file, "w", encoding="utf8") as outfile:
+        json.dump(block_list, outfile)
+
+    funnel = JobFunnel(funnel.config)
+
+    assert not funnel.job_filter.filterable(jobs["id0"])
+    assert funnel.job_filter.filterable(jobs["id1"])
+    assert sorted(funnel.job_filter.user_block_jobs_dict) == ["id1", "id2"]
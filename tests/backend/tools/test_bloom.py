@@ -0,0 +1,106 @@
+"""Test the BloomFilter of key_ids
+"""
+
+import pytest
+
+from jobfunnel.backend.tools import bloom
+from jobfunnel.backend.tools.bloom import BloomFilter
+
+
+def get_key_ids(n_key_ids: int, prefix: str = "key_id") -> list:
+    return [f"{prefix}{i}" for i in range(n_key_ids)]
+
+
+@pytest.mark.parametrize("capacity", [1, 100, 5000])
+def test_bloom_filter_no_false_negatives(capacity):
+    """Every key_id we added is in the filter, whether we built it with them
+    or added them later.
+    """
+    key_ids = get_key_ids(capacity)
+    bloom_filter = BloomFilter.build(key_ids[: capacity // 2], capacity)
+    bloom_filter.update(key_ids[capacity // 2 : -1])
+    bloom_filter.add(key_ids[-1])
+
+    assert all(key_id in bloom_filter for key_id in key_ids)
+
+
+@pytest.mark.parametrize("false_positive_rate", [0.1, 0.01, 0.001])
+def test_bloom_filter_false_positive_rate(false_positive_rate):
+    """At capacity, about false_positive_rate of other key_ids are in it"""
+    capacity = 2000
+    bloom_filter = BloomFilter.build(
+        get_key_ids(capacity), capacity, false_positive_rate=false_positive_rate
+    )
+
+    n_false_positives = sum(
+        key_id in bloom_filter for key_id in get_key_ids(50000, prefix="other")
+    )
+
+    assert n_false_positives / 50000 < 2 * false_positive_rate
+
+
+def test_bloom_filter_contains_hashes():
+    """Checking the hashes of many key_ids at once agrees with __contains__"""
+    bloom_filter = BloomFilter.build(get_key_ids(500), 500, false_positive_rate=0.2)
+    key_ids = get_key_ids(1000) + get_key_ids(5000, prefix="other")
+
+    mask = bloom_filter.contains_hashes(BloomFilter.get_hashes(key_ids))
+
+    assert mask.tolist() == [key_id in bloom_filter for key_id in key_ids]
+    assert mask[:500].all() and not mask[500:].all()
+
+
+def test_bloom_filter_not_str():
+    bloom_filter = BloomFilter.build(["1"], 10)
+
+    assert "1" in bloom_filter
+    assert 1 not in bloom_filter
+    assert None not in bloom_filter
+
+
+def test_bloom_filter_update_chunks(monkeypatch):
+    """Adding key_ids a chunk at a time sets the same bits as all at once"""
+    key_ids = get_key_ids(100)
+    bloom_filter = BloomFilter.build(key_ids, 100)
+
+    monkeypatch.setattr(bloom, "BLOOM_CHUNK_SIZE", 7)
+    chunked_filter = BloomFilter.build(iter(key_ids), 100)
+
+    # pylint: disable=protected-access
+    assert chunked_filter._bits.any()
+    assert chunked_filter._bits.tobytes() == bloom_filter._bits.tobytes()
+
+
+def test_bloom_filter_build_open(tmp_path):
+    """A filter we open() from its file has the same key_ids, including any
+    we add to the filter after we built it.
+    """
+    file_path = str(tmp_path / "key_ids.bloom")
+    key_ids = get_key_ids(100)
+    bloom_filter = BloomFilter.build(key_ids, 200, file_path=file_path)
+
+    opened = BloomFilter.open(file_path)
+    assert (opened.n_bits, opened.n_hashes) == (
+        bloom_filter.n_bits,
+        bloom_filter.n_hashes,
+    )
+    assert all(key_id in opened for key_id in key_ids)
+    assert "new" not in opened
+
+    bloom_filter.add("new")
+    assert "new" in opened
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"not a Bloom filter of key_ids, but long enough to have a header",
+        bloom.HEADER.pack(b"JFBLOOM1", 64, 3) + b"\0",  # i.e. truncated
+    ],
+)
+def test_bloom_filter_open_invalid(tmp_path, contents):
+    file_path = tmp_path / "key_ids.bloom"
+    file_path.write_bytes(contents)
+
+    with pytest.raises(ValueError):
+        BloomFilter.open(str(file_path))
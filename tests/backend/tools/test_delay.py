@@ -0,0 +1,122 @@
+"""Test the RateLimiter
+"""
+
+import asyncio
+from itertools import accumulate
+from threading import Thread
+from typing import List
+
+import pytest
+
+from jobfunnel.backend.tools import delay
+from jobfunnel.backend.tools.delay import RateLimiter, calculate_delays
+from jobfunnel.config import DelayConfig
+from jobfunnel.resources import DelayAlgorithm
+
+URL_A = "https://www.a.com/jobs?page={}"
+URL_B = "https://www.b.com/job/{}"
+
+
+def get_intervals(n_requests: int, delay_config: DelayConfig) -> List[float]:
+    """Get the delays before the first n_requests to a host
+    NOTE: the RateLimiter calculates at least SCHEDULE_CHUNK_SIZE of them.
+    """
+    return calculate_delays(
+        max(n_requests, RateLimiter.SCHEDULE_CHUNK_SIZE), delay_config
+    )[:n_requests]
+
+
+@pytest.fixture()
+def delay_config():
+    """Non-random constant delays, so the schedule is deterministic"""
+    return DelayConfig(
+        max_duration=2.0,
+        min_duration=1.0,
+        algorithm=DelayAlgorithm.CONSTANT,
+        random=False,
+        converge=False,
+    )
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    """Replace the monotonic clock of the RateLimiter with one we advance"""
+    now = [1000.0]
+    monkeypatch.setattr(delay, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.parametrize("n_requests", [1, 10, 3 * RateLimiter.SCHEDULE_CHUNK_SIZE])
+def test_rate_limiter_reserve(n_requests, delay_config, clock):
+    """Requests made at once are spaced out by the delays, one after another"""
+    rate_limiter = RateLimiter(delay_config)
+
+    waits = [rate_limiter.reserve(URL_A.format(i)) for i in range(n_requests)]
+
+    assert waits == pytest.approx(
+        list(accumulate(get_intervals(n_requests, delay_config)))
+    )
+
+
+def test_rate_limiter_reserve_per_host(delay_config, clock):
+    """Each host has its own schedule of delays"""
+    rate_limiter = RateLimiter(delay_config)
+    for i in range(5):
+        rate_limiter.reserve(URL_A.format(i))
+
+    assert rate_limiter.reserve(URL_B.format(0)) == 0.0
+    assert rate_limiter.reserve(URL_B.format(1)) == pytest.approx(
+        get_intervals(2, delay_config)[1]
+    )
+
+
+def test_rate_limiter_reserve_late_request(delay_config, clock):
+    """A request which shows up after its slot is not delayed any further"""
+    rate_limiter = RateLimiter(delay_config)
+    assert rate_limiter.reserve(URL_A.format(0)) == 0.0
+
+    clock[0] += 10.0
+    assert rate_limiter.reserve(URL_A.format(1)) == 0.0
+
+    # i.e. the next slot is one delay after the late request, not the first
+    assert rate_limiter.reserve(URL_A.format(2)) == pytest.approx(
+        get_intervals(3, delay_config)[2]
+    )
+
+
+def test_rate_limiter_reserve_threads(delay_config, clock):
+    """Slots reserved concurrently are the same as if reserved one at a time"""
+    rate_limiter = RateLimiter(delay_config)
+    waits = []
+
+    def reserve_many() -> None:
+        for i in range(50):
+            waits.append(rate_limiter.reserve(URL_A.format(i)))
+
+    threads = [Thread(target=reserve_many) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(waits) == pytest.approx(
+        list(accumulate(get_intervals(200, delay_config)))
+    )
+
+
+def test_rate_limiter_wait(delay_config, clock, monkeypatch):
+    """wait() sleeps and wait_async() yields to the loop until the slot"""
+    sleeps = []
+    monkeypatch.setattr(delay, "sleep", sleeps.append)
+
+    async def fake_async_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_async_sleep)
+    rate_limiter = RateLimiter(delay_config)
+
+    rate_limiter.wait(URL_A.format(0))
+    asyncio.run(rate_limiter.wait_async(URL_A.format(1)))
+    rate_limiter.wait(URL_A.format(2))
+
+    assert sleeps == pytest.approx(list(accumulate(get_intervals(3, delay_config))))
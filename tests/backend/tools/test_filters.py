@@ -1 +1,146 @@
-# FIXME
+"""Test finding duplicate jobs with the JobFilter
+"""
+
+from datetime import date
+import logging
+import random
+from typing import Dict
+
+import pytest
+
+from jobfunnel.backend import Job, JobStatus
+from jobfunnel.backend.tools.filters import JobFilter
+from jobfunnel.resources import DuplicateEngine, DuplicateType, Locale
+
+WORDS = [f"word{i}" for i in range(1000)]
+N_JOBS = 30
+
+
+def get_description(seed: int, n_words: int = 200) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choices(WORDS, k=n_words))
+
+
+def repost(description: str, seed: int, n_changes: int = 2) -> str:
+    """Change a few words of a description, i.e. a near-verbatim re-post"""
+    rng = random.Random(seed)
+    words = description.split()
+    for i in rng.sample(range(len(words)), n_changes):
+        words[i] = "changed"
+    return " ".join(words)
+
+
+def get_job(key_id: str, description: str) -> Job:
+    return Job(
+        title=f"Python Developer {key_id}",
+        company="Company",
+        location="Waterloo, ON",
+        description=description,
+        url=f"https://www.example.com/job/{key_id}",
+        locale=Locale.CANADA_ENGLISH,
+        query="Python",
+        provider="Provider",
+        status=JobStatus.NEW,
+        key_id=key_id,
+        post_date=date(2020, 1, 1),
+    )
+
+
+def get_jobs(prefix: str, n_jobs: int = N_JOBS, seed: int = 0) -> Dict[str, Job]:
+    return {
+        f"{prefix}{i}": get_job(f"{prefix}{i}", get_description(seed + i))
+        for i in range(n_jobs)
+    }
+
+
+def get_job_filter(duplicate_engine: DuplicateEngine, tmp_path) -> JobFilter:
+    return JobFilter(
+        duplicate_engine=duplicate_engine,
+        log_level=logging.WARNING,
+        log_file=str(tmp_path / "log.log"),
+    )
+
+
+@pytest.mark.parametrize(
+    "duplicate_engine, duplicate_type",
+    [
+        (DuplicateEngine.TFIDF, DuplicateType.NEW_TFIDF),
+        (DuplicateEngine.MINHASH, DuplicateType.NEW_MINHASH),
+    ],
+)
+def test_find_duplicates_within_scrape(duplicate_engine, duplicate_type, tmp_path):
+    """With no master jobs, the later of two near-identical incoming jobs is a
+    duplicate of the earlier one (i.e. the same job on two providers).
+    """
+    job_filter = get_job_filter(duplicate_engine, tmp_path)
+    incoming_jobs = get_jobs("new")
+    incoming_jobs["repost"] = get_job(
+        "repost", repost(incoming_jobs["new3"].description, seed=0)
+    )
+
+    duplicate_jobs = job_filter.find_duplicates({}, incoming_jobs)
+
+    assert [
+        (j.original.key_id, j.duplicate.key_id, j.type) for j in duplicate_jobs
+    ] == [("new3", "repost", duplicate_type)]
+    assert duplicate_jobs[0].original is incoming_jobs["new3"]
+    assert list(job_filter.duplicate_jobs_dict) == ["repost"]
+
+
+@pytest.mark.parametrize(
+    "duplicate_engine, duplicate_type",
+    [
+        (DuplicateEngine.TFIDF, DuplicateType.NEW_TFIDF),
+        (DuplicateEngine.MINHASH, DuplicateType.NEW_MINHASH),
+    ],
+)
+def test_find_duplicates_of_existing(duplicate_engine, duplicate_type, tmp_path):
+    """Incoming jobs are duplicates of existing jobs before other incoming
+    jobs, and jobs with the same key_id are duplicates by key_id.
+    """
+    job_filter = get_job_filter(duplicate_engine, tmp_path)
+    existing_jobs = get_jobs("old")
+    incoming_jobs = get_jobs("new", n_jobs=5, seed=N_JOBS)
+    incoming_jobs["repost"] = get_job(
+        "repost", repost(existing_jobs["old7"].description, seed=0)
+    )
+    incoming_jobs["repost2"] = get_job(
+        "repost2", repost(existing_jobs["old7"].description, seed=1)
+    )
+    incoming_jobs["old1"] = get_job("old1", existing_jobs["old1"].description)
+
+    duplicate_jobs = job_filter.find_duplicates(existing_jobs, incoming_jobs)
+
+    assert sorted(
+        (j.original.key_id, j.duplicate.key_id, j.type) for j in duplicate_jobs
+    ) == sorted(
+        [
+            ("old1", "old1", DuplicateType.KEY_ID),
+            ("old7", "repost", duplicate_type),
+            ("old7", "repost2", duplicate_type),
+        ]
+    )
+
+
+def test_find_duplicates_none(tmp_path):
+    """Unrelated jobs have no duplicates, with or without existing jobs"""
+    job_filter = get_job_filter(DuplicateEngine.TFIDF, tmp_path)
+
+    assert job_filter.find_duplicates({}, get_jobs("new")) == []
+    assert job_filter.find_duplicates(get_jobs("old"), get_jobs("new", seed=100)) == []
+    assert not job_filter.duplicate_jobs_dict
+
+
+def test_tfidf_filter_no_existing_jobs(tmp_path):
+    """tfidf_filter() works without any existing jobs"""
+    job_filter = get_job_filter(DuplicateEngine.TFIDF, tmp_path)
+    incoming_jobs = get_jobs("new")
+    incoming_jobs["repost"] = get_job(
+        "repost", repost(incoming_jobs["new0"].description, seed=0)
+    )
+
+    duplicate_jobs = job_filter.tfidf_filter(incoming_jobs, {})
+
+    assert [(j.original.key_id, j.duplicate.key_id) for j in duplicate_jobs] == [
+        ("new0", "repost")
+    ]
@@ -0,0 +1,73 @@
+"""Test the HTTPCache and CachedSession
+"""
+
+import os
+from typing import Any, List
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from jobfunnel.backend.tools.http_cache import CachedSession, HTTPCache
+from jobfunnel.config import HTTPCacheConfig
+from jobfunnel.resources import PageKind
+
+URL = "https://www.example.com/job/1"
+
+
+class FakeAdapter(BaseAdapter):
+    """Responds 200 to every request and records the requests it was sent"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests: List[PreparedRequest] = []
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        self.requests.append(request)
+        response = Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response._content = f"{request.method} #{len(self.requests)}".encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def get_session(folder: str) -> CachedSession:
+    """Get a CachedSession which sends its requests to a FakeAdapter"""
+    http_cache = HTTPCache(os.path.join(folder, "http_cache.sqlite"), HTTPCacheConfig())
+    session = CachedSession(http_cache)
+    session.mount("https://", FakeAdapter())
+    return session
+
+
+def test_cached_session_get(tmp_path):
+    """A fresh GET is served from the cache without making a request"""
+    session = get_session(str(tmp_path))
+
+    assert session.get(URL).text == "GET #1"
+    assert session.get(URL).text == "GET #1"
+    assert len(session.get_adapter(URL).requests) == 1
+
+
+def test_cached_session_post(tmp_path):
+    """A POST is always sent, never served from the cache"""
+    session = get_session(str(tmp_path))
+
+    assert session.post(URL, data={"q": "python"}).text == "POST #1"
+    assert session.post(URL, data={"q": "python"}).text == "POST #2"
+    assert len(session.get_adapter(URL).requests) == 2
+
+
+def test_cached_session_is_fresh_read_only(tmp_path):
+    """is_fresh() doesn't mark the response as used, i.e. it makes no writes"""
+    session = get_session(str(tmp_path))
+    assert not session.is_fresh(URL)
+    session.get(URL)
+    db = session.http_cache._db  # pylint: disable=protected-access
+    n_changes = db.total_changes
+
+    assert session.is_fresh(URL, PageKind.JOB)
+    assert not session.is_fresh(URL + "?page=2", PageKind.JOB)
+    assert db.total_changes == n_changes
@@ -0,0 +1,164 @@
+"""Test the JobList and importing / exporting its JSON file
+"""
+
+import json
+import logging
+import os
+from typing import Dict
+
+from jobfunnel.backend.tools import job_list as job_list_module
+from jobfunnel.backend.tools.bloom import BloomFilter
+from jobfunnel.backend.tools.job_list import JobList
+
+
+def get_entry(key_id: str, title: str = "Python Developer") -> Dict[str, str]:
+    return {"title": title, "company": "Company", "key_id": key_id}
+
+
+def get_job_list(tmp_path) -> JobList:
+    return JobList(
+        str(tmp_path / "block_list.json"), str(tmp_path / "log.log"), logging.WARNING
+    )
+
+
+def write_json(tmp_path, entries: Dict[str, Dict[str, str]], mtime_ns: int) -> None:
+    """Write the JSON file of the list as the user would, modified at mtime_ns"""
+    json_file = str(tmp_path / "block_list.json")
+    with open(json_file, "w", encoding="utf8") as outfile:
+        json.dump(entries, outfile)
+    os.utime(json_file, ns=(mtime_ns, mtime_ns))
+
+
+def get_updated_at(job_list: JobList) -> int:
+    return int(job_list._get_meta("updated_at"))  # pylint: disable=protected-access
+
+
+def test_job_list_mapping(tmp_path):
+    """The list is a mapping of key_id to entry which persists"""
+    job_list = get_job_list(tmp_path)
+    assert len(job_list) == 0 and "1" not in job_list
+
+    job_list["1"] = get_entry("1")
+    job_list.update({"2": get_entry("2"), "3": get_entry("3")})
+    job_list["1"] = get_entry("1", "New Title")
+    del job_list["3"]
+
+    assert len(job_list) == 2
+    assert sorted(job_list) == ["1", "2"]
+    assert job_list["1"] == get_entry("1", "New Title")
+    assert "3" not in job_list
+
+    job_list = get_job_list(tmp_path)
+    assert len(job_list) == 2
+    assert dict(job_list) == {"1": get_entry("1", "New Title"), "2": get_entry("2")}
+
+
+def test_job_list_len(tmp_path):
+    """We count the jobs as we add and remove them, instead of querying"""
+    job_list = get_job_list(tmp_path)
+    statements = []
+    # pylint: disable=protected-access
+    job_list._db.set_trace_callback(statements.append)
+
+    job_list.update({str(i): get_entry(str(i)) for i in range(5)})
+    job_list.update({str(i): get_entry(str(i), "New Title") for i in range(3, 8)})
+    job_list["0"] = get_entry("0", "New Title")
+    job_list["8"] = get_entry("8")
+    del job_list["1"]
+
+    assert len(job_list) == 8
+    assert not [statement for statement in statements if "COUNT" in statement]
+    assert len(get_job_list(tmp_path)) == 8
+
+
+def test_job_list_key_id_filter(tmp_path):
+    """Key_ids not in the Bloom filter are not in the list, even if they are
+    in the table, and key_ids we add are added to the filter too.
+    """
+    job_list = get_job_list(tmp_path)
+    job_list.update({"1": get_entry("1"), "2": get_entry("2")})
+    job_list.key_id_filter = BloomFilter.build(["1"], 100)
+
+    assert "1" in job_list
+    assert "2" not in job_list  # i.e. we trust the filter
+    job_list["3"] = get_entry("3")
+    assert "3" in job_list
+
+
+def test_job_list_get_key_ids_in(tmp_path, monkeypatch):
+    """We get the key_ids in the list, looking them up a chunk at a time"""
+    monkeypatch.setattr(job_list_module, "MAX_SQL_VARIABLES", 3)
+    job_list = get_job_list(tmp_path)
+    job_list.update({str(i): get_entry(str(i)) for i in range(0, 20, 2)})
+
+    key_ids = [str(i) for i in range(10)] + ["x"]
+
+    assert job_list.get_key_ids_in(key_ids) == {"0", "2", "4", "6", "8"}
+    assert job_list.get_key_ids_in([]) == set()
+
+
+def test_job_list_export_import(tmp_path):
+    """The exported JSON file has every entry, and the user's edits to it are
+    imported when the list is opened next.
+    """
+    job_list = get_job_list(tmp_path)
+    job_list.update({str(i): get_entry(str(i)) for i in range(5)})
+    job_list.export_json()
+    with open(job_list.json_file, "r", encoding="utf8") as infile:
+        assert json.load(infile) == dict(job_list)
+
+    # i.e. not imported again, since it did not change
+    job_list["0"] = get_entry("0", "Changed since the export")
+    assert get_job_list(tmp_path)["0"] == get_entry("0", "Changed since the export")
+
+    entries = {str(i): get_entry(str(i)) for i in range(5)}
+    entries["1"] = get_entry("1", "Edited Title")
+    entries["5"] = get_entry("5")
+    write_json(tmp_path, entries, get_updated_at(job_list) + 10**9)
+
+    job_list = get_job_list(tmp_path)
+    assert len(job_list) == 6
+    assert job_list["1"] == get_entry("1", "Edited Title")
+    assert job_list["5"] == get_entry("5")
+
+
+def test_job_list_import_removes(tmp_path):
+    """A JSON file newer than our last change is the list, i.e. jobs the user
+    removed from it are removed from the list too.
+    """
+    job_list = get_job_list(tmp_path)
+    job_list.update({str(i): get_entry(str(i)) for i in range(4)})
+    job_list.export_json()
+
+    write_json(
+        tmp_path,
+        {"1": get_entry("1", "Edited Title"), "5": get_entry("5")},
+        get_updated_at(job_list) + 10**9,
+    )
+
+    job_list = get_job_list(tmp_path)
+    job_list.key_id_filter = BloomFilter.build([str(i) for i in range(6)], 100)
+    assert sorted(job_list) == ["1", "5"]
+    assert len(job_list) == 2
+    assert "0" not in job_list and "3" not in job_list  # i.e. unblocked
+    assert job_list["1"] == get_entry("1", "Edited Title")
+
+
+def test_job_list_import_stale(tmp_path):
+    """A JSON file older than our last change to the list is not imported"""
+    job_list = get_job_list(tmp_path)
+    job_list.update({"1": get_entry("1"), "2": get_entry("2")})
+    write_json(
+        tmp_path,
+        {"1": get_entry("1", "Stale Title")},
+        get_updated_at(job_list) - 10**9,
+    )
+
+    job_list = get_job_list(tmp_path)
+    assert len(job_list) == 2
+    assert job_list["1"] == get_entry("1")
+
+    # i.e. a JSON file from before we had a JobList is always imported
+    (tmp_path / "old").mkdir()
+    write_json(tmp_path / "old", {"1": get_entry("1", "Stale Title")}, 10**9)
+    assert get_job_list(tmp_path / "old")["1"] == get_entry("1", "Stale Title")
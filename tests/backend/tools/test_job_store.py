@@ -0,0 +1,129 @@
+"""Test the JobStore
+"""
+
+from datetime import date
+from threading import Thread
+
+from jobfunnel import __version__
+from jobfunnel.backend import Job, JobStatus
+from jobfunnel.backend.tools.job_store import JobStore
+from jobfunnel.resources import Locale
+
+
+def get_job(key_id: str, title: str = "Python Developer") -> Job:
+    return Job(
+        title=title,
+        company="Company",
+        location="Waterloo, ON",
+        description="A job description",
+        url=f"https://www.example.com/job/{key_id}",
+        locale=Locale.CANADA_ENGLISH,
+        query="Python",
+        provider="Provider",
+        status=JobStatus.NEW,
+        key_id=key_id,
+        post_date=date(2020, 1, 1),
+        raw="<html>the job's own page</html>",
+    )
+
+
+def test_job_store_add_get(tmp_path):
+    """The newest record of a key_id is the job, without its raw scrape data"""
+    store = JobStore(str(tmp_path / "jobs.sqlite"))
+    assert store.get("1") is None
+    assert len(store) == 0
+
+    store.add(get_job("1", "Old Title"), "search", "2020-01-01")
+    store.add(get_job("2"), "search", "2020-01-01")
+    store.add(get_job("1", "New Title"), "search", "2020-01-02")
+
+    assert len(store) == 2
+    job = store.get("1")
+    assert job.title == "New Title"
+    assert job._raw_scrape_data is None  # pylint: disable=protected-access
+
+    # i.e. the store persists
+    assert JobStore(str(tmp_path / "jobs.sqlite")).get("2").key_id == "2"
+
+
+def test_job_store_iter_jobs(tmp_path):
+    """We iterate the newest record of every job of a search and / or date"""
+    store = JobStore(str(tmp_path / "jobs.sqlite"))
+    store.add(get_job("1", "Old Title"), "search", "2020-01-01")
+    store.add(get_job("2"), "search", "2020-01-01")
+    store.add(get_job("3"), "other search", "2020-01-01")
+    store.add(get_job("1", "New Title"), "search", "2020-01-02")
+
+    assert [(j.key_id, j.title) for j in store.iter_jobs()] == [
+        ("2", "Python Developer"),
+        ("3", "Python Developer"),
+        ("1", "New Title"),
+    ]
+    assert [j.key_id for j in store.iter_jobs(search="search")] == ["2", "1"]
+    assert [
+        (j.key_id, j.title)
+        for j in store.iter_jobs(search="search", scrape_date="2020-01-01")
+    ] == [("1", "Old Title"), ("2", "Python Developer")]
+    assert list(store.iter_jobs(search="unknown search")) == []
+
+
+def test_job_store_iter_jobs_while_adding(tmp_path):
+    """Jobs can be added while we iterate the store"""
+    store = JobStore(str(tmp_path / "jobs.sqlite"))
+    for i in range(10):
+        store.add(get_job(str(i)), "search", "2020-01-01")
+
+    key_ids = []
+    for job in store.iter_jobs():
+        key_ids.append(job.key_id)
+        store.add(get_job(job.key_id, "Re-scraped"), "search", "2020-01-02")
+
+    assert key_ids == [str(i) for i in range(10)]
+    assert all(job.title == "Re-scraped" for job in store.iter_jobs())
+
+
+def test_job_store_add_threads(tmp_path):
+    """Jobs can be added from several threads at once"""
+    store = JobStore(str(tmp_path / "jobs.sqlite"))
+
+    def add_jobs(thread: int) -> None:
+        for i in range(25):
+            store.add(get_job(f"{thread}_{i}"), "search", "2020-01-01")
+
+    threads = [Thread(target=add_jobs, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store) == 100
+
+
+def test_job_store_get_versions(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite"))
+    store.add(get_job("1"), "search", "2020-01-01")
+
+    assert store.get_versions() == [__version__]
+    assert store.get_versions(search="search", scrape_date="2020-01-01") == [
+        __version__
+    ]
+    assert store.get_versions(scrape_date="2020-01-02") == []
+
+
+def test_job_store_get_latest_scrape_date(tmp_path):
+    """Every search remembers the newest date it was scraped on"""
+    store = JobStore(str(tmp_path / "jobs.sqlite"))
+    assert store.get_latest_scrape_date("search") is None
+
+    store.add(get_job("1"), "search", "2020-01-02")
+    store.add(get_job("2"), "search", "2020-01-01")  # i.e. added out of order
+    store.add(get_job("3"), "other search", "2020-01-03")
+
+    assert store.get_latest_scrape_date("search") == "2020-01-02"
+    assert store.get_latest_scrape_date("other search") == "2020-01-03"
+    assert [
+        j.key_id
+        for j in store.iter_jobs(
+            search="search", scrape_date=store.get_latest_scrape_date("search")
+        )
+    ] == ["1"]
@@ -0,0 +1,128 @@
+"""Test the MinHashIndex
+"""
+
+import random
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from jobfunnel.backend.tools.minhash import MinHashIndex, jaccard_similarity
+
+WORDS = [f"word{i}" for i in range(1000)]
+
+
+def get_description(seed: int, n_words: int = 200) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choices(WORDS, k=n_words))
+
+
+def repost(description: str, n_changes: int, seed: int) -> str:
+    """Change n_changes words of a description, i.e. a near-verbatim re-post"""
+    rng = random.Random(seed)
+    words = description.split()
+    for i in rng.sample(range(len(words)), n_changes):
+        words[i] = "changed"
+    return " ".join(words)
+
+
+def get_index(**kwargs) -> MinHashIndex:
+    return MinHashIndex(TfidfVectorizer().build_analyzer(), "fingerprint", **kwargs)
+
+
+def test_minhash_index_shingle():
+    index = get_index(shingle_size=3)
+
+    assert index.shingle("a1 b1 c1 d1") == {("a1", "b1", "c1"), ("b1", "c1", "d1")}
+    assert index.shingle("a1 b1") == {("a1", "b1")}
+    assert index.shingle("") == set()
+
+
+@pytest.mark.parametrize("n_changes", [2, 10, 40])
+def test_minhash_index_signature_estimates_jaccard(n_changes):
+    """The fraction of equal signature values estimates Jaccard similarity"""
+    index = get_index()
+    description = get_description(0)
+    shingles = index.shingle(description)
+    other_shingles = index.shingle(repost(description, n_changes, seed=1))
+
+    agreement = np.mean(
+        index.get_signature(shingles) == index.get_signature(other_shingles)
+    )
+
+    # NOTE: the standard error with 128 permutations is at most ~0.045
+    assert agreement == pytest.approx(
+        jaccard_similarity(shingles, other_shingles), abs=0.2
+    )
+
+
+def test_minhash_index_get_candidates():
+    """Re-posts are candidates of each other, unrelated jobs are not"""
+    index = get_index()
+    documents = {f"job{i}": get_description(i) for i in range(50)}
+    documents["repost0"] = repost(documents["job0"], 2, seed=0)
+    documents["repost1"] = repost(documents["job1"], 4, seed=1)
+
+    assert index.update(documents) == 52
+    candidates = index.get_candidates(list(documents))
+
+    assert candidates["job0"] == {"repost0"}
+    assert candidates["repost0"] == {"job0"}
+    assert candidates["job1"] == {"repost1"}
+    assert all(not candidates[f"job{i}"] for i in range(2, 50))
+
+
+def test_minhash_index_update():
+    """Only new or changed documents are shingled, and removed ones dropped"""
+    index = get_index()
+    documents = {f"job{i}": get_description(i) for i in range(10)}
+    index.update(documents)
+    signature = index.signatures[index.doc_ids.index("job5")].copy()
+
+    documents.pop("job0")
+    documents["job1"] = get_description(100)
+    documents["job10"] = repost(documents["job5"], 1, seed=0)
+    assert index.update(documents) == 2  # i.e. job1 and job10
+
+    assert len(index) == 10
+    assert "job0" not in index and "job10" in index
+    np.testing.assert_array_equal(
+        index.signatures[index.doc_ids.index("job5")], signature
+    )
+    assert index.get_candidates(["job10"]) == {"job10": {"job5"}}
+
+
+def test_minhash_index_save_load(tmp_path):
+    """A saved index loads the same, unless it has other settings"""
+    index = get_index()
+    documents = {f"job{i}": get_description(i) for i in range(10)}
+    index.update(documents)
+    file_path = str(tmp_path / "minhash_index.npz")
+    index.save(file_path)
+    analyzer = TfidfVectorizer().build_analyzer()
+
+    loaded = MinHashIndex.load(file_path, analyzer, "fingerprint")
+    assert loaded.update(documents) == 0
+    assert loaded.doc_ids == index.doc_ids
+    np.testing.assert_array_equal(loaded.signatures, index.signatures)
+
+    assert len(MinHashIndex.load(file_path, analyzer, "other fingerprint")) == 0
+    assert len(MinHashIndex.load(str(tmp_path / "missing.npz"), analyzer, "")) == 0
+
+
+def test_minhash_index_invalid_bands():
+    with pytest.raises(ValueError):
+        get_index(n_permutations=128, n_bands=30)
+
+
+@pytest.mark.parametrize(
+    "shingles, other_shingles, similarity",
+    [
+        ({("a",), ("b",)}, {("a",), ("b",)}, 1.0),
+        ({("a",), ("b",)}, {("b",), ("c",)}, 1 / 3),
+        ({("a",)}, {("b",)}, 0.0),
+        (set(), set(), 0.0),
+    ],
+)
+def test_jaccard_similarity(shingles, other_shingles, similarity):
+    assert jaccard_similarity(shingles, other_shingles) == pytest.approx(similarity)
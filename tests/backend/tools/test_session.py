@@ -0,0 +1,75 @@
+"""Test the SessionPool
+"""
+
+from threading import Thread
+
+import pytest
+
+from jobfunnel.backend.tools.session import SessionPool
+from jobfunnel.config import SessionConfig
+from jobfunnel.resources import MAX_CPU_WORKERS, Provider, ScrapeEngine
+
+
+def test_session_pool_get():
+    """Every provider gets its own Session, which is re-used for the run"""
+    session_pool = SessionPool(SessionConfig())
+    sessions = []
+
+    def get_sessions() -> None:
+        for name in ("IndeedScraperCANEng", "MonsterScraperCANEng"):
+            sessions.append(session_pool.get(name, Provider.INDEED))
+
+    threads = [Thread(target=get_sessions) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    indeed = session_pool.get("IndeedScraperCANEng")
+    monster = session_pool.get("MonsterScraperCANEng")
+    assert indeed is not monster
+    assert sorted(map(id, sessions)) == sorted([id(indeed), id(monster)] * 4)
+    # i.e. one adapter, so one pool of connections per host, for both schemes
+    assert indeed.get_adapter("http://a.com") is indeed.get_adapter("https://a.com")
+
+
+@pytest.mark.parametrize(
+    "engine, max_concurrent_requests, pool_maxsize, expected_pool_maxsize",
+    [
+        (ScrapeEngine.THREADS, 100, 1, MAX_CPU_WORKERS),
+        (ScrapeEngine.THREADS, 100, 50, 50),
+        (ScrapeEngine.ASYNCIO, 100, 8, 100),
+        (ScrapeEngine.ASYNCIO, 4, 50, 50),
+    ],
+)
+def test_session_pool_sizes(
+    engine, max_concurrent_requests, pool_maxsize, expected_pool_maxsize
+):
+    """Every host keeps as many connections alive as we have requests in flight"""
+    session_pool = SessionPool(
+        SessionConfig(
+            pool_connections=3,
+            pool_maxsize=pool_maxsize,
+            engine=engine,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+    )
+
+    adapter = session_pool.get("IndeedScraperCANEng").get_adapter("https://a.com")
+
+    assert adapter._pool_connections == 3  # pylint: disable=protected-access
+    assert adapter._pool_maxsize == expected_pool_maxsize
+
+
+def test_session_pool_close(monkeypatch):
+    """Closing the pool closes every Session, get() then opens new ones"""
+    session_pool = SessionPool(SessionConfig())
+    sessions = [session_pool.get(name) for name in ("Indeed", "Monster")]
+    closed = []
+    for session in sessions:
+        monkeypatch.setattr(session, "close", lambda s=session: closed.append(s))
+
+    session_pool.close()
+
+    assert sorted(map(id, closed)) == sorted(map(id, sessions))
+    assert session_pool.get("Indeed") not in sessions
@@ -0,0 +1,107 @@
+"""Test the TfidfIndex and iter_most_similar
+"""
+
+import random
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from jobfunnel.backend.tools.tfidf import TfidfIndex, iter_most_similar
+
+WORDS = [f"word{i}" for i in range(40)]
+
+
+def get_documents(n_documents: int, seed: int = 0) -> dict:
+    """Get random documents of a small vocabulary, so that many are similar"""
+    rng = random.Random(seed)
+    return {
+        f"doc{i}": " ".join(rng.choices(WORDS, k=rng.randint(5, 30)))
+        for i in range(n_documents)
+    }
+
+
+def get_index(documents: dict) -> TfidfIndex:
+    index = TfidfIndex(TfidfVectorizer().build_analyzer(), "fingerprint")
+    index.update(documents)
+    return index
+
+
+def assert_same_vectors(index: TfidfIndex, documents: dict) -> None:
+    """The index gives the vectors of a TfidfVectorizer fit to the documents"""
+    doc_ids = sorted(documents)
+    vectorizer = TfidfVectorizer()
+    expected = vectorizer.fit_transform([documents[d] for d in doc_ids]).toarray()
+    vectors = index.transform(doc_ids).toarray()
+    columns = [index.vocabulary[t] for t in vectorizer.get_feature_names_out()]
+    np.testing.assert_allclose(vectors[:, columns], expected, atol=1e-12)
+    # i.e. terms of removed documents have no weight
+    unused = np.setdiff1d(np.arange(vectors.shape[1]), columns)
+    assert not vectors[:, unused].any()
+
+
+def test_tfidf_index_transform():
+    """Adding, changing and removing documents keeps the vectors exact"""
+    documents = get_documents(30)
+    index = get_index(documents)
+    assert len(index) == 30
+    assert_same_vectors(index, documents)
+
+    documents = {
+        **{d: c for d, c in documents.items() if d not in ("doc0", "doc1")},
+        "doc2": "an entirely new description",
+        "doc30": "word1 word2 word3 unseen",
+    }
+    assert index.update(documents) == 2  # i.e. only doc2 and doc30
+    assert "doc0" not in index and "doc30" in index
+    assert_same_vectors(index, documents)
+
+
+def test_tfidf_index_save_load(tmp_path):
+    """A saved index loads the same, unless it has another fingerprint"""
+    documents = get_documents(20)
+    index = get_index(documents)
+    file_path = str(tmp_path / "tfidf_index.npz")
+    index.save(file_path)
+    analyzer = TfidfVectorizer().build_analyzer()
+
+    loaded = TfidfIndex.load(file_path, analyzer, "fingerprint")
+    assert loaded.update(documents) == 0
+    assert_same_vectors(loaded, documents)
+
+    assert len(TfidfIndex.load(file_path, analyzer, "other fingerprint")) == 0
+    assert len(TfidfIndex.load(str(tmp_path / "missing.npz"), analyzer, "")) == 0
+
+
+@pytest.mark.parametrize("max_block_size", [1, 7, 100, 10**6])
+@pytest.mark.parametrize("only_earlier", [False, True])
+def test_iter_most_similar(max_block_size, only_earlier):
+    """Matches the most similar row of the dense similarity matrix"""
+    documents = get_documents(40)
+    index = get_index(documents)
+    doc_ids = sorted(documents)
+    query_vectors = index.transform(doc_ids)
+    reference_vectors = query_vectors if only_earlier else index.transform(doc_ids[:25])
+    min_similarity = 0.5
+
+    matches = list(
+        iter_most_similar(
+            query_vectors,
+            reference_vectors,
+            min_similarity,
+            max_block_size=max_block_size,
+            only_earlier=only_earlier,
+        )
+    )
+
+    similarities = (query_vectors @ reference_vectors.T).toarray()
+    if only_earlier:
+        similarities = np.tril(similarities, k=-1)
+    expected = [
+        (row, int(np.argmax(similarities[row])), similarities[row].max())
+        for row in range(similarities.shape[0])
+        if similarities[row].max() >= min_similarity
+    ]
+    assert expected  # i.e. the documents are similar enough to test anything
+    assert [(q, r) for q, r, _ in matches] == [(q, r) for q, r, _ in expected]
+    np.testing.assert_allclose([s for _, _, s in matches], [s for _, _, s in expected])
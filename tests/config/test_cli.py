@@ -135,9 +135,13 @@ def test_parse_cli_inline(argv):
     """
     args = parse_cli(argv)
     assert args["do_recovery_mode"] is False
+    assert args["do_export_lists"] is False
+    assert args["do_from_export"] is False
     assert args["load | inline"] == "inline"
     assert args["log_level"] == "DEBUG"
     assert args["no_scrape"] is False
+    assert args["max_concurrent_scrapers"] == 3
+    assert args["duplicate_engine"] == "TFIDF"
     assert args["master_csv_file"] == "TEST_search"
     assert args["log_file"] == "TEST_log_file"
     assert args["cache_folder"] == "TEST_cache"
@@ -160,6 +164,15 @@ def test_parse_cli_inline(argv):
     assert args["delay.max_duration"] == 8.0
     assert args["delay.min_duration"] == 2.0
     assert args["delay.algorithm"] == "LINEAR"
+    assert args["session.pool_connections"] == 8
+    assert args["session.pool_maxsize"] == 8
+    assert args["session.engine"] == "THREADS"
+    assert args["session.max_concurrent_requests"] == 100
+    assert args["http_cache.enabled"] is False
+    assert args["http_cache.max_size_mb"] == 256
+    assert args["http_cache.listing_ttl"] == 3600
+    assert args["http_cache.job_ttl"] == 86400
+    assert args["export_formats"] == []
 
 
 @pytest.mark.parametrize("argv", load_args)
@@ -237,6 +250,22 @@ def test_build_config_dict_load_args(argv):
         assert cfg_dict["no_scrape"] is True
     else:
         assert cfg_dict["no_scrape"] is False
+    assert cfg_dict["max_concurrent_scrapers"] == 3
+    assert cfg_dict["duplicate_engine"] == "TFIDF"
+    assert cfg_dict["session"] == {
+        "pool_connections": 8,
+        "pool_maxsize": 8,
+        "engine": "THREADS",
+        "max_concurrent_requests": 100,
+    }
+    assert cfg_dict["http_cache"] == {
+        "enabled": False,
+        "max_size_mb": 256,
+        "listing_ttl": 3600,
+        "job_ttl": 86400,
+        "provider_ttls": {},
+    }
+    assert cfg_dict["export_formats"] == []
 
 
 @pytest.mark.parametrize("argv", inline_args)
@@ -270,3 +299,16 @@ def test_build_config_dict_inline_args(argv):
     assert cfg_dict["log_level"] == "DEBUG"
     assert cfg_dict["no_scrape"] is False
     assert cfg_dict["proxy"] == {}
+    assert cfg_dict["session"] == {
+        "pool_connections": 8,
+        "pool_maxsize": 8,
+        "engine": "THREADS",
+        "max_concurrent_requests": 100,
+    }
+    assert cfg_dict["http_cache"] == {
+        "enabled": False,
+        "max_size_mb": 256,
+        "listing_ttl": 3600,
+        "job_ttl": 86400,
+    }
+    assert cfg_dict["export_formats"] == []
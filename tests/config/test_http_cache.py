@@ -0,0 +1,72 @@
+"""Test the HTTPCacheConfig
+"""
+
+import pytest
+
+from jobfunnel.config import HTTPCacheConfig
+from jobfunnel.config.settings import SettingsValidator
+from jobfunnel.resources import PageKind, Provider
+
+
+@pytest.mark.parametrize(
+    "max_size_mb, listing_ttl, job_ttl, provider_ttls, invalid",
+    [
+        (256, 3600, 86400, None, False),
+        (0.5, 0, 0, {Provider.INDEED: {PageKind.LISTING: 0}}, False),
+        (0, 3600, 86400, None, True),
+        (256, -1, 86400, None, True),
+        (256, 3600, -1, None, True),
+        (256, 3600, 86400, {Provider.MONSTER: {PageKind.JOB: -1}}, True),
+    ],
+)
+def test_http_cache_config_validate(
+    max_size_mb, listing_ttl, job_ttl, provider_ttls, invalid
+):
+    """Test HTTPCacheConfig"""
+    cfg = HTTPCacheConfig(
+        max_size_mb=max_size_mb,
+        listing_ttl=listing_ttl,
+        job_ttl=job_ttl,
+        provider_ttls=provider_ttls,
+    )
+
+    # FUT
+    if invalid:
+        with pytest.raises(ValueError):
+            cfg.validate()
+    else:
+        cfg.validate()
+
+
+def test_http_cache_config_get_ttl():
+    """Test that provider TTLs override the per-page-kind TTLs"""
+    cfg = HTTPCacheConfig(
+        listing_ttl=10,
+        job_ttl=20,
+        provider_ttls={Provider.INDEED: {PageKind.LISTING: 5}},
+    )
+
+    # FUT
+    assert cfg.get_ttl(Provider.INDEED, PageKind.LISTING) == 5
+    assert cfg.get_ttl(Provider.INDEED, PageKind.JOB) == 20
+    assert cfg.get_ttl(Provider.MONSTER, PageKind.LISTING) == 10
+    assert cfg.get_ttl(None, PageKind.JOB) == 20
+    assert cfg.max_size_bytes == 256 * 1024 * 1024
+
+
+@pytest.mark.parametrize(
+    "max_size_mb, invalid", [(256, False), (0.5, False), (0, True)]
+)
+def test_http_cache_settings_agree_with_validate(max_size_mb, invalid):
+    """The settings YAML schema accepts exactly the max sizes validate() does"""
+    is_valid = SettingsValidator.validate(
+        {"http_cache": {"max_size_mb": max_size_mb}}, update=True
+    )
+
+    # FUT
+    assert is_valid is not invalid
+    if invalid:
+        with pytest.raises(ValueError):
+            HTTPCacheConfig(max_size_mb=max_size_mb).validate()
+    else:
+        HTTPCacheConfig(max_size_mb=max_size_mb).validate()
@@ -223,3 +223,33 @@ def test_search_config_validate_remoteness(
 
     with pytest.raises(AssertionError, match="Remoteness is UNKNOWN!"):
         cfg.validate()
+
+
+@pytest.mark.parametrize(
+    "changes, exp_same",
+    [
+        ({}, True),
+        ({"providers": [enums.Provider.MONSTER, enums.Provider.INDEED]}, True),
+        ({"max_listing_days": 3, "blocked_company_names": ["Bad Co"]}, True),
+        ({"keywords": ["Python", "Django"]}, False),
+        ({"city": "Toronto"}, False),
+        ({"distance_radius": 50}, False),
+        ({"remoteness": Remoteness.FULLY_REMOTE}, False),
+        ({"providers": [enums.Provider.INDEED]}, False),
+    ],
+)
+def test_search_config_fingerprint(changes, exp_same):
+    """Test that only changes to the search we make change the fingerprint"""
+    kwargs = dict(
+        keywords=["Python"],
+        province_or_state="ON",
+        locale=Locale.CANADA_ENGLISH,
+        providers=[enums.Provider.INDEED, enums.Provider.MONSTER],
+        city="Waterloo",
+    )
+    cfg = SearchConfig(**kwargs)
+    kwargs.update(changes)
+    other_cfg = SearchConfig(**kwargs)
+
+    # Assertions
+    assert (cfg.fingerprint == other_cfg.fingerprint) == exp_same
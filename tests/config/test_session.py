@@ -0,0 +1,45 @@
+"""Test the SessionConfig
+"""
+
+import pytest
+
+from jobfunnel.config import SessionConfig
+from jobfunnel.resources import ScrapeEngine
+
+
+@pytest.mark.parametrize(
+    "pool_connections, pool_maxsize, max_concurrent_requests, invalid",
+    [
+        (8, 8, 100, False),
+        (1, 1, 1, False),
+        (0, 8, 100, True),
+        (8, 0, 100, True),
+        (8, 8, 0, True),
+    ],
+)
+def test_session_config_validate(
+    pool_connections, pool_maxsize, max_concurrent_requests, invalid
+):
+    """Test SessionConfig"""
+    cfg = SessionConfig(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_concurrent_requests=max_concurrent_requests,
+    )
+
+    # FUT
+    if invalid:
+        with pytest.raises(ValueError):
+            cfg.validate()
+    else:
+        cfg.validate()
+
+
+def test_session_config_validate_asyncio_engine(mocker):
+    """Test that the ASYNCIO engine requires aiohttp"""
+    cfg = SessionConfig(engine=ScrapeEngine.ASYNCIO)
+    mocker.patch("jobfunnel.config.session.find_spec", return_value=None)
+
+    # FUT
+    with pytest.raises(ValueError, match="aiohttp"):
+        cfg.validate()
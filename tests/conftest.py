@@ -1,7 +1,11 @@
+import logging
 import os
 
 import pytest  # noqa=F401 - TODO: Remove this once we have tests
 
+from jobfunnel.config import JobFunnelConfigManager, SearchConfig
+from jobfunnel.resources import Locale, Provider
+
 
 # TODO: This should be a fixture. For now it is not because fixtures cannot be easily called as regular functions.
 def get_data_path():
@@ -11,3 +15,31 @@ def get_data_path():
     :return:
     """
     return os.path.join(os.path.dirname(os.path.realpath(__file__)), "data")
+
+
+def get_config(folder, **kwargs):
+    """
+    Get a minimal JobFunnelConfigManager which writes all of its files into folder, for CANADA_ENGLISH.
+    NOTE: this creates folder and the cache folder, like __main__ does.
+    :param folder: folder to put the master CSV, lists, cache and log into.
+    :param kwargs: any other JobFunnelConfigManager arguments, i.e. session_config.
+    :return:
+    """
+    config = JobFunnelConfigManager(
+        master_csv_file=os.path.join(folder, "master.csv"),
+        user_block_list_file=os.path.join(folder, "block_list.json"),
+        duplicates_list_file=os.path.join(folder, "duplicates_list.json"),
+        cache_folder=os.path.join(folder, "cache"),
+        log_file=os.path.join(folder, "log.log"),
+        log_level=logging.WARNING,
+        search_config=SearchConfig(
+            keywords=["Python"],
+            province_or_state="ON",
+            locale=Locale.CANADA_ENGLISH,
+            providers=[Provider.INDEED],
+            city="Waterloo",
+        ),
+        **kwargs,
+    )
+    config.create_dirs()
+    return config